@@ -13,6 +13,7 @@ from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
 
+from eam_council.council.checkpoints import RunCheckpoint, new_run_id
 from eam_council.council.lead_agent import run_council
 
 # Force UTF-8 stdout to avoid Windows cp1252 encoding errors
@@ -23,12 +24,39 @@ if sys.stdout.encoding != "utf-8":
 console = Console(force_terminal=False)
 
 
+class _StreamSink:
+    """Echo streamed text to the terminal and append it to the output file."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(exist_ok=True)
+        self._fh = path.open("w", encoding="utf-8")
+        self.parts: list[str] = []
+
+    def __call__(self, text: str) -> None:
+        self.parts.append(text)
+        console.out(text, end="", highlight=False)
+        self._fh.write(text)
+        self._fh.flush()
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="eam_council",
         description="EAM Architecture Council - multi-agent EAM advisor",
     )
-    parser.add_argument("question", help="The EAM architecture question to answer")
+    parser.add_argument(
+        "question",
+        nargs="?",
+        default=None,
+        help="The EAM architecture question to answer (optional with --resume)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -66,23 +94,82 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable tokens-per-minute throttling for this run",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Overall run deadline in seconds; slow stages are cut and noted in the output",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the lead reconciliation to the terminal and out/latest.md as it arrives",
+    )
+    parser.add_argument(
+        "--cassette",
+        choices=["record", "replay"],
+        default=None,
+        help="Record live API calls to disk, or replay them offline without an API key",
+    )
+    parser.add_argument(
+        "--cassette-dir",
+        default=None,
+        help="Cassette directory (default: out/cassettes)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="When replaying, wait the recorded latency of each call",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Resume an interrupted or failed run from its first incomplete stage",
+    )
+    args = parser.parse_args()
+    if args.question is None and args.resume is None:
+        parser.error("a question is required unless --resume is given")
+    return args
 
 
 def main() -> None:
     load_dotenv()
     args = parse_args()
 
+    question = args.question
+    resumed_model = None
+    search_enabled = not args.no_search
+    if args.resume is not None:
+        try:
+            checkpoint = RunCheckpoint.load(args.resume)
+            question = question or checkpoint.question
+            resumed_model = checkpoint.meta.get("model")
+            # Keep the run's search setting; --no-search on a run that searched is refused below.
+            search_enabled = search_enabled and checkpoint.meta.get("search_enabled", True)
+            checkpoint.check(question=question, model=args.model or resumed_model, search_enabled=search_enabled)
+        except (FileNotFoundError, ValueError) as exc:
+            console.print(f"[red]{exc}[/red]")
+            sys.exit(1)
+    run_id = args.resume or new_run_id()
+
+    if args.cassette is not None:
+        os.environ["EAM_CASSETTE_MODE"] = args.cassette
+    if args.cassette_dir is not None:
+        os.environ["EAM_CASSETTE_DIR"] = args.cassette_dir
+    if args.replay_latency:
+        os.environ["EAM_CASSETTE_REPLAY_LATENCY"] = "1"
+    replaying = os.environ.get("EAM_CASSETTE_MODE", "").strip().lower() == "replay"
+
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    dry_run = args.dry_run or not api_key
+    dry_run = args.dry_run or (not api_key and not replaying)
 
-    if not api_key and not args.dry_run:
+    if not api_key and not args.dry_run and not replaying:
         console.print(
             "[yellow]No ANTHROPIC_API_KEY found. Running in dry-run mode.[/yellow]"
         )
 
-    model = args.model or os.environ.get("EAM_MODEL", "claude-sonnet-4-20250514")
-    search_enabled = not args.no_search
+    model = args.model or resumed_model or os.environ.get("EAM_MODEL", "claude-sonnet-4-20250514")
     if args.minimal_context:
         os.environ["EAM_MINIMAL_MODE"] = "1"
     if args.search_budget is not None:
@@ -91,33 +178,56 @@ def main() -> None:
         os.environ["EAM_TOKENS_PER_MINUTE"] = str(args.tokens_per_minute)
     if args.disable_tpm_throttle:
         os.environ["EAM_ENABLE_TPM_THROTTLE"] = "0"
+    if args.deadline is not None:
+        os.environ["EAM_RUN_DEADLINE_SECONDS"] = str(args.deadline)
 
     console.print(
         Panel(
             f"[bold]EAM Architecture Council[/bold]\n"
-            f"Mode: {'DRY-RUN' if dry_run else 'LIVE'}\n"
+            f"Mode: {'DRY-RUN' if dry_run else 'REPLAY' if replaying else 'LIVE'}\n"
             f"Model: {model}\n"
             f"Web Search: {'ON' if search_enabled else 'OFF'}",
             title="Council Session",
         )
     )
-    console.print(f"\n[bold]Question:[/bold] {args.question}\n")
+    console.print(f"\n[bold]Question:[/bold] {question}\n")
+
+    out_dir = Path("out")
+    out_dir.mkdir(exist_ok=True)
+    out_path = out_dir / "latest.md"
 
-    result = asyncio.run(
-        run_council(
-            question=args.question,
-            model=model,
-            dry_run=dry_run,
-            search_enabled=search_enabled,
+    sink = _StreamSink(out_path) if args.stream else None
+    try:
+        result = asyncio.run(
+            run_council(
+                question=question,
+                model=model,
+                dry_run=dry_run,
+                search_enabled=search_enabled,
+                on_token=sink,
+                run_id=run_id,
+            )
         )
-    )
+    except KeyboardInterrupt:
+        if not dry_run:
+            console.print(
+                f"\n[yellow]Interrupted. Completed stages are checkpointed; resume with:[/yellow]\n"
+                f"  python -m eam_council --resume {run_id}"
+            )
+        sys.exit(130)
+    finally:
+        if sink is not None:
+            sink.close()
 
     # Print to stdout
-    console.print(Panel(result, title="Council Response", border_style="green"))
+    if sink is None:
+        console.print(Panel(result, title="Council Response", border_style="green"))
+    elif result.startswith(sink.text):
+        console.out(result[len(sink.text):], highlight=False)
+    else:
+        # Escalation, validation or a deadline replaced the streamed draft.
+        console.print(Panel(result, title="Council Response (revised)", border_style="green"))
 
     # Write to file
-    out_dir = Path("out")
-    out_dir.mkdir(exist_ok=True)
-    out_path = out_dir / "latest.md"
     out_path.write_text(result, encoding="utf-8")
     console.print(f"\n[dim]Output written to {out_path}[/dim]")
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import anthropic
-
-from eam_council.council.llm import create_with_retry
+from eam_council.council.clients import get_async_client
+from eam_council.council.llm import acreate_with_retry
 from eam_council.council.models import SubagentDraft
 from eam_council.council.prompts import (
     AGENTIC_ARCH_SUBAGENT_SYSTEM,
+    build_agentic_speculative_prompt,
     build_agentic_with_domain_prompt,
+    build_cached_system,
     build_subagent_prompt,
+    filter_context_for_question,
 )
+from eam_council.council.rate_limiter import Priority
+from eam_council.council.runtime_config import load_runtime_config
 
 DRY_RUN_RESPONSE = """\
 ## Agentic Architecture Expert Draft
@@ -46,8 +50,14 @@ async def run_agentic_arch_subagent(
     dry_run: bool = False,
     sap_draft: str | None = None,
     general_draft: str | None = None,
+    *,
+    speculative: bool = False,
 ) -> SubagentDraft:
-    """Run the agentic architecture subagent and return its draft."""
+    """Run the agentic architecture subagent and return its draft.
+
+    ``speculative`` runs it before the EAM drafts exist, in the background
+    lane, with a prompt that asks it to list its domain assumptions.
+    """
     if dry_run:
         return SubagentDraft(
             agent_name="Agentic Architecture Expert",
@@ -55,23 +65,33 @@ async def run_agentic_arch_subagent(
             content=DRY_RUN_RESPONSE,
         )
 
-    client = anthropic.Anthropic()
-    if sap_draft and general_draft:
+    client = get_async_client()
+    cfg = load_runtime_config()
+    cache = cfg.prompt_caching
+    system = AGENTIC_ARCH_SUBAGENT_SYSTEM
+    if cache:
+        system = build_cached_system(system, filter_context_for_question(skills_context, question))
+    if speculative:
+        user_prompt = build_agentic_speculative_prompt(question, skills_context, mock_context, include_context=not cache)
+    elif sap_draft and general_draft:
         user_prompt = build_agentic_with_domain_prompt(
             question,
             skills_context,
             mock_context,
             sap_draft,
             general_draft,
+            include_context=not cache,
         )
     else:
-        user_prompt = build_subagent_prompt(question, skills_context, mock_context)
+        user_prompt = build_subagent_prompt(question, skills_context, mock_context, include_context=not cache)
 
-    response = create_with_retry(
+    response = await acreate_with_retry(
         client,
+        priority=Priority.BACKGROUND if speculative else Priority.EXPERT,
+        stage="agentic_speculative" if speculative else "agentic",
         model=model,
-        max_tokens=4096,
-        system=AGENTIC_ARCH_SUBAGENT_SYSTEM,
+        max_tokens=cfg.expert_max_tokens,
+        system=system,
         messages=[{"role": "user", "content": user_prompt}],
     )
 
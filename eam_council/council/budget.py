@@ -0,0 +1,127 @@
+"""Per-stage input token budgets.
+
+With ``EAM_BUDGET_PLANNER`` on, each stage's prompt is assembled from parts in
+priority order::
+
+    question > expert drafts > SKILL.md sections > resource sections > mock data
+
+Parts are added until the stage's input budget is spent. The question and the
+drafts are always kept, since a stage cannot run without them. A skill section
+that does not fit is dropped, along with every lower-priority part, so a
+resource never displaces a skill and mock data never displaces a resource.
+Within one priority level a part that does not fit is skipped and smaller ones
+after it may still be taken. What was dropped is recorded in the run telemetry.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Sequence
+
+from eam_council.council.prompts import split_sections
+from eam_council.council.telemetry import RunTelemetry
+from eam_council.council.token_counter import get_token_counter
+
+
+class PartPriority(IntEnum):
+    QUESTION = 0
+    DRAFTS = 1
+    REQUIRED_SKILLS = 2
+    OPTIONAL_RESOURCES = 3
+    MOCK_DATA = 4
+
+
+_MANDATORY = (PartPriority.QUESTION, PartPriority.DRAFTS)
+
+
+@dataclass(frozen=True)
+class PromptPart:
+    priority: PartPriority
+    name: str
+    text: str
+    tokens: int
+
+
+@dataclass
+class BudgetPlan:
+    stage: str
+    budget_tokens: int
+    used_tokens: int = 0
+    kept: list[PromptPart] = field(default_factory=list)
+    dropped: list[PromptPart] = field(default_factory=list)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.used_tokens > self.budget_tokens
+
+    def _joined(self, *priorities: PartPriority) -> str:
+        kept = [p.text for p in self.kept if p.priority in priorities]
+        text = "".join(kept)
+        return text.rstrip("\n") if any(p.priority in priorities for p in self.dropped) else text
+
+    @property
+    def skills_context(self) -> str:
+        return self._joined(PartPriority.REQUIRED_SKILLS, PartPriority.OPTIONAL_RESOURCES)
+
+    @property
+    def mock_context(self) -> str:
+        return self._joined(PartPriority.MOCK_DATA)
+
+
+def _part(priority: PartPriority, name: str, text: str) -> PromptPart:
+    return PromptPart(priority, name, text, get_token_counter().count(text))
+
+
+def _section_name(section: str) -> str:
+    return section.split("\n", 1)[0].strip("=- ").split(": ", 1)[-1]
+
+
+def plan_prompt(
+    stage: str,
+    budget_tokens: int,
+    *,
+    question: str,
+    drafts: Sequence[str] = (),
+    skills_context: str = "",
+    mock_context: str = "",
+    fixed: Sequence[str] = (),
+) -> BudgetPlan:
+    """Choose the parts of a stage's prompt that fit ``budget_tokens``.
+
+    ``fixed`` texts (system prompts, instructions) count against the budget but
+    are not part of the plan.
+    """
+    parts = [_part(PartPriority.QUESTION, "question", question)]
+    parts += [_part(PartPriority.DRAFTS, f"draft_{i + 1}", d) for i, d in enumerate(drafts)]
+    for section in split_sections(skills_context):
+        priority = PartPriority.REQUIRED_SKILLS if section.startswith("=== SKILL: ") else PartPriority.OPTIONAL_RESOURCES
+        parts.append(_part(priority, _section_name(section), section))
+    if mock_context:
+        parts.append(_part(PartPriority.MOCK_DATA, "mock_data", mock_context))
+
+    counter = get_token_counter()
+    plan = BudgetPlan(stage, budget_tokens, used_tokens=sum(counter.count(t) for t in fixed))
+    cutoff: PartPriority | None = None
+    # Stable sort: parts keep their context order within a priority level.
+    for part in sorted(parts, key=lambda p: p.priority):
+        fits = plan.used_tokens + part.tokens <= budget_tokens
+        if part.priority in _MANDATORY or (fits and (cutoff is None or part.priority <= cutoff)):
+            plan.kept.append(part)
+            plan.used_tokens += part.tokens
+        else:
+            plan.dropped.append(part)
+            cutoff = part.priority if cutoff is None else min(cutoff, part.priority)
+    order = {id(p): i for i, p in enumerate(parts)}
+    plan.kept.sort(key=lambda p: order[id(p)])
+    return plan
+
+
+def record_plan(telemetry: RunTelemetry, plan: BudgetPlan) -> None:
+    """Write ``plan`` to ``telemetry`` (dropped parts by name, with their token counts)."""
+    telemetry.record_budget(
+        stage=plan.stage,
+        budget_tokens=plan.budget_tokens,
+        used_tokens=plan.used_tokens,
+        dropped={p.name: p.tokens for p in plan.dropped},
+    )
@@ -0,0 +1,173 @@
+"""Record/replay of Anthropic request/response pairs for offline council runs.
+
+In ``record`` mode every live call made by :mod:`eam_council.council.llm` is
+stored as ``<dir>/<request-hash>.json`` together with its latency (and the text
+deltas of streamed calls). In ``replay`` mode the same requests are answered
+from disk without touching the network, optionally re-imposing the recorded
+latencies so benchmarks see realistic timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from eam_council.council.runtime_config import RuntimeConfig
+
+MODES = ("off", "record", "replay")
+
+
+class CassetteMissError(LookupError):
+    """Replay was requested for a call that was never recorded."""
+
+
+def request_key(kwargs: dict[str, Any]) -> str:
+    """Canonical hash of a ``messages.create`` payload."""
+    canonical = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _to_plain(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, SimpleNamespace):
+        return {k: _to_plain(v) for k, v in vars(value).items()}
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+def _to_namespace(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(v) for v in value]
+    return value
+
+
+def serialize_response(response: Any) -> dict[str, Any]:
+    return _to_plain(response)
+
+
+def deserialize_response(data: dict[str, Any]) -> Any:
+    """Rebuild an SDK ``Message`` when possible, else an attribute namespace."""
+    try:
+        from anthropic.types import Message
+
+        return Message.model_validate(data)
+    except Exception:  # noqa: BLE001
+        return _to_namespace(data)
+
+
+def _response_text(response: Any) -> str:
+    return "".join(
+        getattr(block, "text", "") for block in getattr(response, "content", []) or []
+        if getattr(block, "type", None) == "text"
+    )
+
+
+class Cassette:
+    """On-disk store of recorded calls keyed by :func:`request_key`."""
+
+    def __init__(self, directory: Path, mode: str, replay_latency: bool = False) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {MODES}")
+        self.directory = directory
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def record(
+        self,
+        kwargs: dict[str, Any],
+        response: Any,
+        elapsed: float,
+        *,
+        chunks: list[str] | None = None,
+        ttft: float | None = None,
+    ) -> None:
+        entry = {
+            "request": kwargs,
+            "response": serialize_response(response),
+            "elapsed": elapsed,
+            "ttft": ttft,
+            "chunks": chunks,
+        }
+        path = self._path(request_key(kwargs))
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry, indent=1, default=str), encoding="utf-8")
+            tmp.replace(path)
+
+    def _load(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        key = request_key(kwargs)
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise CassetteMissError(
+                f"No recorded response for request {key[:12]} in {self.directory}"
+            ) from None
+
+    def replay(self, kwargs: dict[str, Any]) -> Any:
+        entry = self._load(kwargs)
+        if self.replay_latency:
+            time.sleep(entry.get("elapsed") or 0.0)
+        return deserialize_response(entry["response"])
+
+    async def areplay(self, kwargs: dict[str, Any]) -> Any:
+        entry = self._load(kwargs)
+        if self.replay_latency:
+            await asyncio.sleep(entry.get("elapsed") or 0.0)
+        return deserialize_response(entry["response"])
+
+    async def areplay_stream(self, kwargs: dict[str, Any], on_text: Callable[[str], None]) -> Any:
+        """Replay a call as a stream, pacing recorded deltas over the recorded latency."""
+        entry = self._load(kwargs)
+        response = deserialize_response(entry["response"])
+        chunks = entry.get("chunks") or [_response_text(response)]
+        elapsed = entry.get("elapsed") or 0.0
+        ttft = entry.get("ttft") or 0.0
+        gap = max(0.0, elapsed - ttft) / max(1, len(chunks) - 1)
+        for index, chunk in enumerate(chunks):
+            if self.replay_latency:
+                await asyncio.sleep(ttft if index == 0 else gap)
+            on_text(chunk)
+        return response
+
+
+_cassette_lock = threading.Lock()
+_cassette: Cassette | None = None
+_cassette_key: tuple | None = None
+
+
+def get_cassette(cfg: RuntimeConfig) -> Cassette | None:
+    """Return the configured cassette, or None when record/replay is off."""
+    global _cassette, _cassette_key
+    if cfg.cassette_mode == "off":
+        return None
+    key = (cfg.cassette_mode, cfg.cassette_dir, cfg.cassette_replay_latency)
+    with _cassette_lock:
+        if _cassette is None or _cassette_key != key:
+            _cassette = Cassette(Path(cfg.cassette_dir), cfg.cassette_mode, cfg.cassette_replay_latency)
+            _cassette_key = key
+        return _cassette
@@ -0,0 +1,124 @@
+"""Per-run stage checkpoints so interrupted or failed council runs can resume.
+
+Each live run owns ``out/runs/<run_id>/`` holding ``meta.json`` (question,
+model, status) and one ``<stage>.json`` per completed stage. A resumed run
+replays the stored stage outputs in order and calls the API only from the
+first stage without a checkpoint.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from eam_council.council.models import SubagentDraft
+
+RUNS_DIR = Path("out") / "runs"
+
+
+def new_run_id() -> str:
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+class RunCheckpoint:
+    """Stage outputs of one council run, stored under ``<root>/<run_id>/``."""
+
+    def __init__(self, directory: Path, meta: dict[str, Any]) -> None:
+        self.directory = directory
+        self.meta = meta
+
+    @property
+    def run_id(self) -> str:
+        return self.meta["run_id"]
+
+    @property
+    def question(self) -> str:
+        return self.meta["question"]
+
+    @classmethod
+    def load(cls, run_id: str, root: Path = RUNS_DIR) -> RunCheckpoint:
+        directory = root / run_id
+        try:
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No checkpointed run {run_id!r} in {root}") from None
+        return cls(directory, meta)
+
+    @classmethod
+    def open(
+        cls,
+        run_id: str | None,
+        *,
+        question: str,
+        model: str,
+        search_enabled: bool,
+        root: Path = RUNS_DIR,
+    ) -> RunCheckpoint:
+        """Resume ``run_id`` if it exists, otherwise start a new run directory."""
+        if run_id is not None and (root / run_id / "meta.json").exists():
+            checkpoint = cls.load(run_id, root)
+            checkpoint.check(question=question, model=model, search_enabled=search_enabled)
+            checkpoint.mark("running")
+            return checkpoint
+
+        run_id = run_id or new_run_id()
+        directory = root / run_id
+        directory.mkdir(parents=True, exist_ok=True)
+        checkpoint = cls(
+            directory,
+            {
+                "run_id": run_id,
+                "question": question,
+                "model": model,
+                "search_enabled": search_enabled,
+                "created": time.time(),
+            },
+        )
+        checkpoint.mark("running")
+        return checkpoint
+
+    def check(self, *, question: str, model: str, search_enabled: bool) -> None:
+        """Raise ValueError unless the run was started with this configuration."""
+        for name, value in (("question", question), ("model", model), ("search_enabled", search_enabled)):
+            if name in self.meta and self.meta[name] != value:
+                raise ValueError(f"Run {self.run_id!r} was started with a different {name.replace('_', ' ')}")
+
+    def mark(self, status: str, *, error: str | None = None) -> None:
+        self.meta["status"] = status
+        self.meta["updated"] = time.time()
+        if error is not None:
+            self.meta["error"] = error
+        else:
+            self.meta.pop("error", None)
+        _write_json(self.directory / "meta.json", self.meta)
+
+    def save(self, stage: str, value: SubagentDraft | str | None) -> None:
+        if isinstance(value, SubagentDraft):
+            payload = {"kind": "draft", "value": value.model_dump()}
+        elif value is None:
+            payload = {"kind": "none", "value": None}
+        else:
+            payload = {"kind": "text", "value": value}
+        _write_json(self.directory / f"{stage}.json", payload)
+
+    def load_stage(self, stage: str) -> tuple[bool, SubagentDraft | str | None]:
+        """Return ``(found, value)`` for a completed stage."""
+        try:
+            payload = json.loads((self.directory / f"{stage}.json").read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return False, None
+        if payload["kind"] == "draft":
+            return True, SubagentDraft(**payload["value"])
+        return True, payload["value"]
+
+    def completed_stages(self) -> list[str]:
+        return sorted(p.stem for p in self.directory.glob("*.json") if p.name != "meta.json")
@@ -0,0 +1,72 @@
+"""Process-wide pooled Anthropic clients shared by every council stage."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+
+import anthropic
+
+from eam_council.council.runtime_config import RuntimeConfig, load_runtime_config
+
+_lock = threading.Lock()
+_sync_client: anthropic.Anthropic | None = None
+# httpx async pools are bound to the loop that opened them, so keep one client
+# per running loop (a CLI process has exactly one).
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anthropic.AsyncAnthropic] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _connection_limits(cfg: RuntimeConfig):
+    # Reuse the SDK's own httpx ``Limits`` type so we stay on its transport version.
+    limits_type = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+    return limits_type(
+        max_connections=cfg.http_max_connections,
+        max_keepalive_connections=cfg.http_max_keepalive_connections,
+        keepalive_expiry=cfg.http_keepalive_expiry,
+    )
+
+
+def _build_sync_client(cfg: RuntimeConfig) -> anthropic.Anthropic:
+    # Retries are owned by ``llm.create_with_retry``; disable the SDK's own layer.
+    return anthropic.Anthropic(
+        max_retries=0,
+        http_client=anthropic.DefaultHttpxClient(limits=_connection_limits(cfg)),
+    )
+
+
+def _build_async_client(cfg: RuntimeConfig) -> anthropic.AsyncAnthropic:
+    return anthropic.AsyncAnthropic(
+        max_retries=0,
+        http_client=anthropic.DefaultAsyncHttpxClient(limits=_connection_limits(cfg)),
+    )
+
+
+def get_client() -> anthropic.Anthropic:
+    """Return the shared sync client, creating it on first use."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None:
+            _sync_client = _build_sync_client(load_runtime_config())
+        return _sync_client
+
+
+def get_async_client() -> anthropic.AsyncAnthropic:
+    """Return the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            client = _build_async_client(load_runtime_config())
+            _async_clients[loop] = client
+        return client
+
+
+def reset_clients() -> None:
+    """Drop cached clients (used by tests and after config changes)."""
+    global _sync_client
+    with _lock:
+        _sync_client = None
+        _async_clients.clear()
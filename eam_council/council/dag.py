@@ -0,0 +1,246 @@
+"""A small stage-graph executor for council runs.
+
+A :class:`Stage` declares the values it reads (``inputs``), the values it
+produces (``outputs``), an optional concurrency ``group`` and a ``timeout``.
+:class:`StageGraph` starts each stage as soon as all of its inputs exist, so
+independent stages run concurrently. Stages sharing a group are limited by
+that group's entry in ``group_limits`` (unlimited by default).
+
+A stage whose ``when`` predicate is false is skipped and produces ``None`` for
+every output. A stage cut by its timeout produces whatever ``on_cut`` returns
+(``None`` by default), so downstream stages still run on degraded input. Any
+other exception cancels the stages still in flight and propagates.
+
+Every run records when each stage started and finished. The critical path is
+the chain of stages, each the latest-finishing producer of the next one's
+inputs, that ends at the last stage to finish. Skipped stages did no work and
+are looked through: the path continues at their own producers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+
+from eam_council.council.deadlines import StageOutcome, run_stage
+
+Inputs = Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node of a :class:`StageGraph`.
+
+    ``run`` receives the stage's inputs by name. With a single output it
+    returns that value; with several it returns a tuple in ``outputs`` order.
+    ``timeout`` is called when the stage starts, so it can draw on a shared
+    run deadline.
+    """
+
+    name: str
+    run: Callable[[Inputs], Awaitable[Any]]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    group: str | None = None
+    timeout: Callable[[], float | None] | None = None
+    when: Callable[[Inputs], bool] | None = None
+    on_cut: Callable[[Inputs, str], Any] | None = None
+
+
+Runner = Callable[[Stage, Callable[[], Awaitable[Any]], float | None], Awaitable[StageOutcome]]
+
+
+async def _run_with_timeout(_stage: Stage, factory: Callable[[], Awaitable[Any]], timeout: float | None) -> StageOutcome:
+    return await run_stage(factory(), timeout)
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    stage: str
+    group: str | None
+    started_ms: float
+    finished_ms: float
+    status: str  # "ok", "cut" or "skipped"
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self.finished_ms - self.started_ms
+
+
+@dataclass
+class GraphRun:
+    graph: StageGraph
+    values: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, StageTiming] = field(default_factory=dict)
+
+    def critical_path(self) -> list[str]:
+        """Stage names from the first to the last-finishing stage along the latest-finishing inputs."""
+        if not self.timings:
+            return []
+        order = {stage.name: i for i, stage in enumerate(self.graph.stages)}
+
+        def worked(names: Iterable[str]) -> set[str]:
+            """``names`` that ran, with skipped stages replaced by their producers."""
+            found: set[str] = set()
+            for name in names:
+                if name not in self.timings:
+                    continue
+                if self.timings[name].status == "skipped":
+                    found |= worked(self.graph.upstream(name))
+                else:
+                    found.add(name)
+            return found
+
+        def latest(names: Iterable[str]) -> str | None:
+            ran = worked(names)
+            return max(ran, key=lambda n: (self.timings[n].finished_ms, order[n]), default=None)
+
+        path: list[str] = []
+        name = latest(self.timings)
+        while name is not None:
+            path.append(name)
+            name = latest(self.graph.upstream(name))
+        return path[::-1]
+
+    def critical_path_ms(self) -> float:
+        path = self.critical_path()
+        return self.timings[path[-1]].finished_ms if path else 0.0
+
+    def timing_records(self) -> list[dict]:
+        """Stage timings in start order, as plain dicts for telemetry."""
+        return [
+            {
+                "stage": t.stage,
+                "group": t.group,
+                "status": t.status,
+                "started_ms": int(t.started_ms),
+                "elapsed_ms": int(t.elapsed_ms),
+            }
+            for t in sorted(self.timings.values(), key=lambda t: t.started_ms)
+        ]
+
+
+class StageGraph:
+    """A validated set of stages, runnable any number of times."""
+
+    def __init__(self, stages: Iterable[Stage], group_limits: Mapping[str, int] | None = None) -> None:
+        self.stages = list(stages)
+        self.group_limits = dict(group_limits or {})
+        self._producers: dict[str, str] = {}
+        names: set[str] = set()
+        for stage in self.stages:
+            if stage.name in names:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            names.add(stage.name)
+            for key in stage.outputs:
+                if key in self._producers:
+                    raise ValueError(f"{key!r} is produced by both {self._producers[key]} and {stage.name}")
+                self._producers[key] = stage.name
+        self._check_acyclic()
+
+    def upstream(self, name: str) -> list[str]:
+        """Names of the stages producing the inputs of stage ``name``."""
+        stage = next(s for s in self.stages if s.name == name)
+        return [self._producers[key] for key in stage.inputs if key in self._producers]
+
+    def _check_acyclic(self) -> None:
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, trail: tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError("Stage cycle: " + " -> ".join((*trail, name)))
+            state[name] = 1
+            for producer in self.upstream(name):
+                visit(producer, (*trail, name))
+            state[name] = 2
+
+        for stage in self.stages:
+            visit(stage.name, ())
+
+    async def run(
+        self,
+        initial: Mapping[str, Any] | None = None,
+        *,
+        runner: Runner | None = None,
+        timings: dict[str, StageTiming] | None = None,
+    ) -> GraphRun:
+        """Run every stage once; ``initial`` supplies inputs no stage produces.
+
+        ``runner`` wraps each stage call (for checkpointing, say) and must
+        honour the timeout; the default applies it with :func:`run_stage`.
+        ``timings`` receives each stage's timing as it finishes, before any
+        stage reading its outputs starts, so stages can report upstream
+        latencies.
+        """
+        values = dict(initial or {})
+        missing = {
+            key: stage.name
+            for stage in self.stages
+            for key in stage.inputs
+            if key not in self._producers and key not in values
+        }
+        if missing:
+            raise ValueError(f"No value for stage inputs: {missing}")
+        overlap = sorted(set(values) & set(self._producers))
+        if overlap:
+            raise ValueError(f"Initial values shadow stage outputs: {overlap}")
+
+        result = GraphRun(self, values, timings if timings is not None else {})
+        limits = {group: asyncio.Semaphore(limit) for group, limit in self.group_limits.items()}
+        origin = time.perf_counter()
+        pending = list(self.stages)
+        running: dict[asyncio.Task, Stage] = {}
+        try:
+            while pending or running:
+                for stage in [s for s in pending if all(key in values for key in s.inputs)]:
+                    pending.remove(stage)
+                    task = asyncio.create_task(
+                        self._run_stage(stage, values, runner or _run_with_timeout, limits, origin, result)
+                    )
+                    running[task] = stage
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    output = task.result()
+                    if len(stage.outputs) == 1:
+                        values[stage.outputs[0]] = output
+                    else:
+                        values.update(zip(stage.outputs, output or (None,) * len(stage.outputs)))
+        except BaseException:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+        return result
+
+    async def _run_stage(
+        self,
+        stage: Stage,
+        values: Mapping[str, Any],
+        runner: Runner,
+        limits: Mapping[str, asyncio.Semaphore],
+        origin: float,
+        result: GraphRun,
+    ) -> Any:
+        inputs = {key: values[key] for key in stage.inputs}
+        limit = limits.get(stage.group) if stage.group else None
+        async with limit if limit is not None else contextlib.nullcontext():
+            started = (time.perf_counter() - origin) * 1000
+            if stage.when is not None and not stage.when(inputs):
+                status, output = "skipped", None
+            else:
+                timeout = stage.timeout() if stage.timeout is not None else None
+                outcome = await runner(stage, lambda: stage.run(inputs), timeout)
+                if outcome.cut:
+                    status = "cut"
+                    output = stage.on_cut(inputs, outcome.reason or "cut") if stage.on_cut is not None else None
+                else:
+                    status, output = "ok", outcome.value
+            finished = (time.perf_counter() - origin) * 1000
+        result.timings[stage.name] = StageTiming(stage.name, stage.group, started, finished, status)
+        return output
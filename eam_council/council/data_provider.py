@@ -0,0 +1,288 @@
+"""EAM data behind the experts' "Available Data" block.
+
+A :class:`DataProvider` loads work orders, equipment and work centers. The
+built-in mock rows are the default. ``EAM_DATA_SOURCE`` points at a directory
+holding ``work_orders``, ``equipment`` and ``work_centers`` tables, each as
+``.jsonl``, ``.json`` (a list of objects), ``.csv`` or ``.parquet``. Parquet
+needs the optional ``pyarrow`` package.
+
+:func:`render_data_context` lists every row when the listing fits the token
+budget, which is always the case for the mock data. Otherwise it renders
+compact aggregates and fills the rest of the budget with a deterministic
+sample of exemplar rows:
+
+* counts by order type, status and priority
+* counts by equipment criticality
+* the equipment with the most orders
+* per work-center load against capacity
+
+The context string then stays the same size whether the dataset has a hundred
+rows or a hundred thousand.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Protocol
+
+from eam_council.council.token_counter import get_token_counter
+
+TABLES = ("work_orders", "equipment", "work_centers")
+SUFFIXES = (".jsonl", ".json", ".csv", ".parquet")
+TOP_VALUES = 8
+TOP_WORK_CENTERS = 10
+SAMPLE_SEED = 0
+
+Row = dict[str, Any]
+
+
+@dataclass
+class EamDataset:
+    label: str
+    work_orders: list[Row] = field(default_factory=list)
+    equipment: list[Row] = field(default_factory=list)
+    work_centers: list[Row] = field(default_factory=list)
+
+
+class DataProvider(Protocol):
+    def load(self) -> EamDataset: ...
+
+
+class MockDataProvider:
+    """The three-row sample dataset from :mod:`mock_data`."""
+
+    def load(self) -> EamDataset:
+        from eam_council.council.mock_data import MOCK_EQUIPMENT, MOCK_WORK_CENTERS, MOCK_WORK_ORDERS
+
+        return EamDataset("Mock SAP EAM Data", MOCK_WORK_ORDERS, MOCK_EQUIPMENT, MOCK_WORK_CENTERS)
+
+
+def _read_table(path: Path) -> list[Row]:
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+    if path.suffix == ".json":
+        return json.loads(path.read_text(encoding="utf-8"))
+    if path.suffix == ".csv":
+        with path.open(encoding="utf-8", newline="") as fh:
+            return list(csv.DictReader(fh))
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError(
+            f"Reading {path.name} requires pyarrow: pip install 'eam-architect-council[parquet]'"
+        ) from exc
+    return pq.read_table(path).to_pylist()
+
+
+class FileDataProvider:
+    """Tables loaded from local files, re-read only when a file changes."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._stamp: tuple | None = None
+        self._dataset: EamDataset | None = None
+
+    def _files(self) -> dict[str, Path]:
+        found = {}
+        for table in TABLES:
+            for suffix in SUFFIXES:
+                path = self.directory / f"{table}{suffix}"
+                if path.is_file():
+                    found[table] = path
+                    break
+        return found
+
+    def load(self) -> EamDataset:
+        with self._lock:
+            files = self._files()
+            stamp = tuple((t, p, p.stat().st_mtime_ns, p.stat().st_size) for t, p in files.items())
+            if self._dataset is None or stamp != self._stamp:
+                tables = {table: _read_table(path) for table, path in files.items()}
+                self._dataset = EamDataset(f"EAM Data ({self.directory.name})", **tables)
+                self._stamp = stamp
+            return self._dataset
+
+
+_providers_lock = threading.Lock()
+_providers: dict[str, DataProvider] = {}
+
+
+def get_data_provider(source: str = "") -> DataProvider:
+    """Return the provider for ``source``: a data directory, or ``""``/``"mock"`` for the mock rows."""
+    key = source.strip() or "mock"
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = MockDataProvider() if key == "mock" else FileDataProvider(Path(key))
+            _providers[key] = provider
+        return provider
+
+
+def _order_line(wo: Row) -> str:
+    return (
+        f"- {wo.get('order_id')} | Type: {wo.get('order_type')} | "
+        f"Priority: {wo.get('priority')} | Equipment: {wo.get('equipment_id')}"
+    )
+
+
+def _equipment_line(eq: Row) -> str:
+    return f"- {eq.get('equipment_id')} | {eq.get('description')} | Criticality: {eq.get('criticality')}"
+
+
+def _work_center_line(wc: Row) -> str:
+    return f"- {wc.get('work_center_id')} | {wc.get('description')} | Capacity: {wc.get('capacity_hours_per_day')}h/day"
+
+
+def _full_listing(dataset: EamDataset, budget_tokens: int) -> str | None:
+    """Every row in the original mock format, or None as soon as it exceeds the budget."""
+    counter = get_token_counter()
+    lines = [f"## {dataset.label} (for reference)\n", "### Work Orders"]
+    sections = (
+        (dataset.work_orders, _order_line, "\n### Equipment"),
+        (dataset.equipment, _equipment_line, "\n### Work Centers"),
+        (dataset.work_centers, _work_center_line, None),
+    )
+    used = counter.count("\n".join(lines))
+    for rows, render, next_title in sections:
+        for row in rows:
+            line = render(row)
+            used += counter.count(line) + 1
+            if used > budget_tokens:
+                return None
+            lines.append(line)
+        if next_title:
+            lines.append(next_title)
+    return "\n".join(lines)
+
+
+def _counts(rows: list[Row], key: str) -> str:
+    counts = Counter(str(row.get(key, "")) for row in rows)
+    top = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    text = " | ".join(f"{value or '(blank)'} {count:,}" for value, count in top[:TOP_VALUES])
+    other = sum(count for _, count in top[TOP_VALUES:])
+    return f"{text} | other {other:,}" if other else text
+
+
+def _parse_time(value: Any) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    # Compare everything as naive UTC so mixed sources do not raise.
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _aggregates(dataset: EamDataset) -> list[str]:
+    orders, equipment = dataset.work_orders, dataset.equipment
+    lines = [f"## {dataset.label} (aggregated, for reference)\n"]
+
+    hours: defaultdict[str, float] = defaultdict(float)
+    order_count: Counter[str] = Counter()
+    first: datetime | None = None
+    last: datetime | None = None
+    for wo in orders:
+        wc = str(wo.get("work_center_id", ""))
+        order_count[wc] += 1
+        start, end = _parse_time(wo.get("planned_start")), _parse_time(wo.get("planned_end"))
+        if start is None or end is None:
+            continue
+        hours[wc] += max((end - start).total_seconds(), 0.0) / 3600
+        first = start if first is None or start < first else first
+        last = end if last is None or end > last else last
+    window = f" planned {first.date()} to {last.date()}" if first and last else ""
+
+    lines.append(f"### Work Orders: {len(orders):,}{window}")
+    for key, label in (("order_type", "type"), ("status", "status"), ("priority", "priority")):
+        lines.append(f"- By {label}: {_counts(orders, key)}")
+    lines.append(f"\n### Equipment: {len(equipment):,}")
+    lines.append(f"- By criticality: {_counts(equipment, 'criticality')}")
+    busiest = Counter(str(wo.get("equipment_id", "")) for wo in orders).most_common(5)
+    if busiest:
+        lines.append("- Most orders: " + ", ".join(f"{eq} ({n:,})" for eq, n in busiest))
+
+    days = max((last - first).days + 1, 1) if first and last else 1
+    centers = {str(wc.get("work_center_id")): wc for wc in dataset.work_centers}
+    lines.append(f"\n### Work Center Load ({len(centers):,} work centers, {days} planning days)")
+    for wc_id in sorted(order_count, key=lambda w: -hours[w])[:TOP_WORK_CENTERS]:
+        capacity = _float(centers.get(wc_id, {}).get("capacity_hours_per_day")) * days
+        load = f" | {hours[wc_id] / capacity:.0%} of capacity" if capacity else ""
+        lines.append(f"- {wc_id} | {order_count[wc_id]:,} orders | {hours[wc_id]:,.0f}h planned{load}")
+    return lines
+
+
+def _sample(rows: list[Row], strata: tuple[str, ...]) -> list[Row]:
+    """Rows in sampling order: one per stratum value first, then a seeded shuffle."""
+    picked: list[int] = []
+    seen: set[tuple[str, str]] = set()
+    for i, row in enumerate(rows):
+        fresh = [(k, str(row.get(k))) for k in strata if (k, str(row.get(k))) not in seen]
+        if fresh:
+            seen.update(fresh)
+            picked.append(i)
+    chosen = set(picked)
+    rest = [i for i in range(len(rows)) if i not in chosen]
+    random.Random(SAMPLE_SEED).shuffle(rest)
+    return [rows[i] for i in picked + rest]
+
+
+_SECTION_HEADER_TOKENS = 16
+
+
+def _fill(title: str, rows: list[Row], render, budget: int) -> list[str]:
+    counter = get_token_counter()
+    budget -= _SECTION_HEADER_TOKENS
+    lines: list[str] = []
+    for row in rows:
+        line = render(row)
+        cost = counter.count(line) + 1
+        if cost > budget:
+            break
+        lines.append(line)
+        budget -= cost
+    return [f"\n### {title} ({len(lines):,} of {len(rows):,})", *lines] if lines else []
+
+
+_rendered_lock = threading.Lock()
+_rendered: tuple[EamDataset, int, str] | None = None
+
+
+def render_data_context(dataset: EamDataset, budget_tokens: int) -> str:
+    """The data block for prompts, within ``budget_tokens`` where the aggregates allow.
+
+    Memoized for the last dataset object, so repeated runs against an
+    unchanged source skip the aggregation.
+    """
+    global _rendered
+    with _rendered_lock:
+        if _rendered is not None and _rendered[0] is dataset and _rendered[1] == budget_tokens:
+            return _rendered[2]
+    listing = _full_listing(dataset, budget_tokens)
+    if listing is None:
+        counter = get_token_counter()
+        lines = _aggregates(dataset)
+        remaining = budget_tokens - counter.count("\n".join(lines))
+        orders = _sample(dataset.work_orders, ("order_type", "priority", "status"))
+        equipment = _sample(dataset.equipment, ("criticality",))
+        order_lines = _fill("Sample Work Orders", orders, _order_line, remaining * 2 // 3)
+        remaining -= counter.count("\n".join(order_lines))
+        lines += order_lines + _fill("Sample Equipment", equipment, _equipment_line, remaining)
+        listing = "\n".join(lines)
+    with _rendered_lock:
+        _rendered = (dataset, budget_tokens, listing)
+    return listing
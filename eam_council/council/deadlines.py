@@ -0,0 +1,57 @@
+"""Per-stage timeouts and an overall run deadline for council runs."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class RunDeadline:
+    """Tracks the whole-run latency bound; ``total_seconds <= 0`` means unbounded."""
+
+    total_seconds: float
+    started: float = field(default_factory=time.monotonic)
+
+    def remaining(self) -> float | None:
+        if self.total_seconds <= 0:
+            return None
+        return self.total_seconds - (time.monotonic() - self.started)
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def budget_for(self, stage_seconds: float) -> float | None:
+        """Effective timeout for a stage: its own limit capped by the run's remainder."""
+        limits = [s for s in (stage_seconds if stage_seconds > 0 else None, self.remaining()) if s is not None]
+        if not limits:
+            return None
+        return max(0.0, min(limits))
+
+
+@dataclass
+class StageOutcome:
+    value: Any = None
+    cut: bool = False
+    reason: str | None = None
+
+
+async def run_stage(awaitable: Awaitable[T], timeout: float | None) -> StageOutcome:
+    """Await ``awaitable`` within ``timeout`` seconds, cancelling it on expiry.
+
+    A zero budget (run deadline already spent) skips the stage without starting it.
+    """
+    if timeout is not None and timeout <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        return StageOutcome(cut=True, reason="skipped: run deadline reached")
+    try:
+        value = await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        return StageOutcome(cut=True, reason=f"timed out after {timeout:.0f}s")
+    return StageOutcome(value=value)
@@ -0,0 +1,176 @@
+"""Local near-duplicate index of past questions and their expert drafts.
+
+Paraphrases of the same architecture question ("schedule work orders in SAP",
+"how do we do work order scheduling with SAP EAM") would otherwise each pay
+for a full set of expert drafts. Every completed live run appends its question
+signature and drafts to ``out/draft_index.jsonl``; a later question whose
+estimated Jaccard similarity clears the threshold reuses those drafts and only
+the lead (and validator) run again.
+
+Similarity is MinHash over stemmed word unigrams and bigrams. Signatures are
+compared by linear scan, which is ample for a per-user index of a few
+thousand questions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from eam_council.council.models import SubagentDraft
+
+DEFAULT_INDEX_PATH = Path("out") / "draft_index.jsonl"
+NUM_PERMUTATIONS = 128
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"[a-z0-9_]+")
+_STOPWORDS = frozenset(
+    """
+    a an and are as at be best by can could do does for from how i in is it me of on or our
+    should so that the this to us we what when where which while who why with would you your
+    approach architect architecture build design module recommend recommended solution system way
+    """.split()
+)
+
+
+def _stem(word: str) -> str:
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def content_words(text: str) -> list[str]:
+    """Lowercased, lightly stemmed words with stopwords and generic design verbs removed."""
+    return [_stem(w) for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def shingles(text: str) -> set[str]:
+    """Content-word unigrams and bigrams."""
+    words = content_words(text)
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def _permutations() -> list[tuple[int, int]]:
+    perms = []
+    for i in range(NUM_PERMUTATIONS):
+        seed = hashlib.blake2b(f"eam-minhash-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(seed[:8], "big") % _MERSENNE_PRIME or 1
+        b = int.from_bytes(seed[8:], "big") % _MERSENNE_PRIME
+        perms.append((a, b))
+    return perms
+
+
+_PERMUTATIONS = _permutations()
+
+
+def minhash(text: str) -> list[int]:
+    """MinHash signature of ``text``'s shingles."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles(text)
+    ]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+    return [min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERMUTATIONS
+
+
+def context_digest(*parts: str) -> str:
+    """Fingerprint of the inputs drafts depend on besides the question."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+@dataclass
+class DraftMatch:
+    question: str
+    score: float
+    sap: SubagentDraft
+    general: SubagentDraft
+    agentic: SubagentDraft | None
+
+
+class DraftIndex:
+    """Append-only JSONL store of question signatures and their drafts."""
+
+    def __init__(self, path: Path = DEFAULT_INDEX_PATH) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _entries(self) -> list[dict]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # a partially written line from an interrupted run
+        return entries
+
+    def lookup(self, question: str, *, model: str, context: str, threshold: float) -> DraftMatch | None:
+        """Return the most similar prior run for the same model and context, if above ``threshold``."""
+        if not shingles(question):
+            return None
+        signature = minhash(question)
+        best: tuple[float, dict] | None = None
+        for entry in self._entries():
+            if entry.get("model") != model or entry.get("context") != context:
+                continue
+            score = similarity(signature, entry["signature"])
+            if score >= threshold and (best is None or score > best[0]):
+                best = (score, entry)
+        if best is None:
+            return None
+        score, entry = best
+        drafts = entry["drafts"]
+        return DraftMatch(
+            question=entry["question"],
+            score=score,
+            sap=SubagentDraft(**drafts["sap"]),
+            general=SubagentDraft(**drafts["general"]),
+            agentic=SubagentDraft(**drafts["agentic"]) if drafts.get("agentic") else None,
+        )
+
+    def add(
+        self,
+        question: str,
+        *,
+        model: str,
+        context: str,
+        sap: SubagentDraft,
+        general: SubagentDraft,
+        agentic: SubagentDraft | None,
+    ) -> None:
+        entry = {
+            "question": question,
+            "model": model,
+            "context": context,
+            "created": time.time(),
+            "signature": minhash(question),
+            "drafts": {
+                "sap": sap.model_dump(),
+                "general": general.model_dump(),
+                "agentic": agentic.model_dump() if agentic else None,
+            },
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry) + "\n")
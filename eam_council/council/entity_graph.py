@@ -0,0 +1,184 @@
+"""Entity graph built from ``canonical_entities.yaml``.
+
+The canonical entity model is parsed once into entities linked by their
+``foreign_key`` fields, with an index of names and synonyms: the entity name,
+its OData entity set and service, its legacy table, glossary abbreviations such
+as "WO", and an optional ``synonyms:`` list in the YAML. A question gets the
+entities it mentions plus their foreign-key neighbours (in either direction) up
+to a configurable depth, rendered one compact block per entity. A question that
+mentions no entity gets the whole catalog in the same compact form.
+
+The rendering stays YAML-shaped under the usual resource header, so the
+classification filters in :mod:`prompts` (dropping the resource for general
+questions and ``sap_internals`` for API questions) apply unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import yaml
+
+from eam_council.council.skills_loader import DEFAULT_SKILLS_ROOT, get_skills_repository, resource_header
+
+ENTITIES_SKILL = "eam_glossary_entities"
+ENTITIES_FILE = "canonical_entities.yaml"
+_RESOURCES = DEFAULT_SKILLS_ROOT / ENTITIES_SKILL / "resources"
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])")
+_GLOSSARY_TERM = re.compile(r"^\|\s*\*\*(?P<term>[^*(]+?)\s*(?:\((?P<abbr>[^)]+)\))?\*\*")
+
+
+def _normalize(text: str) -> tuple[str, ...]:
+    """Lowercase tokens with a plural ``s`` stripped, so "work orders" matches "work order"."""
+    return tuple(t[:-1] if len(t) > 3 and t.endswith("s") and not t.endswith("ss") else t for t in _TOKEN.findall(text.lower()))
+
+
+@dataclass(frozen=True)
+class Entity:
+    name: str
+    description: str
+    sap_api: dict[str, Any]
+    sap_internals: dict[str, Any]
+    fields: tuple[dict[str, Any], ...]
+    synonyms: tuple[str, ...]
+
+    @property
+    def references(self) -> set[str]:
+        """Names of the entities this one points at through ``foreign_key`` fields."""
+        return {str(f["foreign_key"]).split(".", 1)[0] for f in self.fields if f.get("foreign_key")}
+
+
+def _render_field(field: dict[str, Any]) -> str:
+    text = str(field.get("name", "?"))
+    if field.get("primary_key"):
+        text += "*"
+    detail = [str(field.get("type", ""))] if field.get("type") else []
+    if field.get("enum"):
+        detail.append("|".join(str(v) for v in field["enum"]))
+    if field.get("description"):
+        detail.append(str(field["description"]))
+    if detail:
+        text += f" ({'; '.join(detail)})"
+    if field.get("foreign_key"):
+        text += f" -> {field['foreign_key']}"
+    return text
+
+
+class EntityGraph:
+    """Entities, their foreign-key edges and a synonym index."""
+
+    def __init__(self, entities: list[Entity]) -> None:
+        self.entities = {e.name: e for e in entities}
+        self._neighbors: dict[str, set[str]] = {e.name: set() for e in entities}
+        for entity in entities:
+            for target in entity.references & self._neighbors.keys():
+                if target != entity.name:
+                    self._neighbors[entity.name].add(target)
+                    self._neighbors[target].add(entity.name)
+        self._synonyms: dict[tuple[str, ...], str] = {}
+        for entity in entities:
+            for synonym in entity.synonyms:
+                phrase = _normalize(synonym)
+                if phrase:
+                    self._synonyms.setdefault(phrase, entity.name)
+
+    @classmethod
+    def from_yaml(cls, entities_text: str, glossary_text: str = "") -> EntityGraph:
+        data = yaml.safe_load(entities_text) or {}
+        abbreviations: dict[tuple[str, ...], list[str]] = {}
+        for line in glossary_text.splitlines():
+            match = _GLOSSARY_TERM.match(line)
+            if match and match.group("abbr"):
+                abbreviations.setdefault(_normalize(match.group("term")), []).append(match.group("abbr"))
+
+        entities = []
+        for name, spec in (data.get("entities") or {}).items():
+            spec = spec or {}
+            sap_api = spec.get("sap_api") or {}
+            sap_internals = spec.get("sap_internals") or {}
+            synonyms = [name.replace("_", " "), *spec.get("synonyms", [])]
+            if sap_api.get("odata_entity_set"):
+                synonyms += [_CAMEL.sub(" ", sap_api["odata_entity_set"]), sap_api["odata_entity_set"]]
+            if sap_api.get("odata_service"):
+                synonyms.append(sap_api["odata_service"])
+            if sap_internals.get("legacy_table"):
+                synonyms.append(sap_internals["legacy_table"])
+            synonyms += abbreviations.get(_normalize(name.replace("_", " ")), [])
+            entities.append(
+                Entity(
+                    name=name,
+                    description=str(spec.get("description", "")),
+                    sap_api=sap_api,
+                    sap_internals=sap_internals,
+                    fields=tuple(spec.get("fields") or ()),
+                    synonyms=tuple(synonyms),
+                )
+            )
+        return cls(entities)
+
+    def mentioned(self, question: str) -> set[str]:
+        """Entities named in ``question`` by name or synonym."""
+        tokens = _normalize(question)
+        found = set()
+        for phrase, name in self._synonyms.items():
+            n = len(phrase)
+            if any(tokens[i : i + n] == phrase for i in range(len(tokens) - n + 1)):
+                found.add(name)
+        return found
+
+    def expand(self, names: set[str], depth: int) -> list[str]:
+        """``names`` plus their foreign-key neighbours up to ``depth`` hops, in catalog order."""
+        seen = {n for n in names if n in self.entities}
+        frontier = deque((n, 0) for n in seen)
+        while frontier:
+            name, hops = frontier.popleft()
+            if hops >= depth:
+                continue
+            for neighbor in self._neighbors[name] - seen:
+                seen.add(neighbor)
+                frontier.append((neighbor, hops + 1))
+        return [n for n in self.entities if n in seen]
+
+    def render(self, names: list[str]) -> str:
+        lines = ["entities:"]
+        for name in names:
+            entity = self.entities[name]
+            lines.append(f"  {name}: {entity.description}")
+            api = entity.sap_api
+            if api:
+                lines.append(f"    sap_api: {' / '.join(str(api[k]) for k in ('odata_service', 'odata_entity_set') if api.get(k))}")
+            internals = entity.sap_internals
+            if internals:
+                parts = [str(internals["legacy_table"])] if internals.get("legacy_table") else []
+                if internals.get("transactions"):
+                    parts.append(", ".join(str(t) for t in internals["transactions"]))
+                lines.append(f"    sap_internals: {'; '.join(parts)}")
+            if entity.fields:
+                lines.append(f"    fields: {', '.join(_render_field(f) for f in entity.fields)}")
+        return "\n".join(lines)
+
+    def context_for(self, question: str, depth: int = 1) -> str:
+        """The resource section for ``question``: mentioned entities and their neighbours."""
+        mentioned = self.mentioned(question)
+        names = self.expand(mentioned, depth) if mentioned else list(self.entities)
+        return f"{resource_header(ENTITIES_SKILL, ENTITIES_FILE)}\n{self.render(names)}"
+
+
+@lru_cache(maxsize=4)
+def _parse(entities_text: str, glossary_text: str) -> EntityGraph:
+    return EntityGraph.from_yaml(entities_text, glossary_text)
+
+
+def get_entity_graph() -> EntityGraph:
+    """The graph for the packaged skills, re-parsed only when either source file changes."""
+    repository = get_skills_repository()
+    return _parse(
+        repository.read(_RESOURCES / ENTITIES_FILE),
+        repository.read(_RESOURCES / "glossary.md"),
+    )
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import anthropic
-
-from eam_council.council.llm import create_with_retry
+from eam_council.council.clients import get_async_client
+from eam_council.council.llm import acreate_with_retry
 from eam_council.council.models import SubagentDraft
 from eam_council.council.prompts import (
     GENERAL_EAM_SUBAGENT_SEARCH_ADDENDUM,
     GENERAL_EAM_SUBAGENT_SYSTEM,
-    build_subagent_prompt,
+    build_subagent_request,
 )
+from eam_council.council.runtime_config import load_runtime_config
 from eam_council.council.web_search import GENERAL_WEB_SEARCH_TOOL, extract_text_from_response
 
 DRY_RUN_RESPONSE = """\
@@ -62,23 +62,30 @@ async def run_general_subagent(
             content=DRY_RUN_RESPONSE,
         )
 
-    client = anthropic.Anthropic()
-    user_prompt = build_subagent_prompt(question, skills_context, mock_context)
+    client = get_async_client()
+    cfg = load_runtime_config()
 
     system_prompt = GENERAL_EAM_SUBAGENT_SYSTEM
     if search_enabled:
         system_prompt += GENERAL_EAM_SUBAGENT_SEARCH_ADDENDUM
+    system, user_prompt = build_subagent_request(
+        system_prompt,
+        question,
+        skills_context,
+        mock_context,
+        cache=cfg.prompt_caching,
+    )
 
     kwargs: dict = dict(
         model=model,
-        max_tokens=4096,
-        system=system_prompt,
+        max_tokens=cfg.expert_max_tokens,
+        system=system,
         messages=[{"role": "user", "content": user_prompt}],
     )
     if search_enabled:
         kwargs["tools"] = [GENERAL_WEB_SEARCH_TOOL]
 
-    response = create_with_retry(client, **kwargs)
+    response = await acreate_with_retry(client, stage="general", **kwargs)
 
     content = extract_text_from_response(response)
     return SubagentDraft(
@@ -3,28 +3,52 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from pathlib import Path
+from typing import Awaitable, Callable
 
-import anthropic
 from rich.console import Console
 
 from eam_council.council.agentic_architecture_subagent import run_agentic_arch_subagent
+from eam_council.council.budget import plan_prompt, record_plan
+from eam_council.council.checkpoints import RunCheckpoint
+from eam_council.council.dag import Inputs, Stage, StageGraph, StageTiming
+from eam_council.council.draft_index import DraftIndex, context_digest
+from eam_council.council.entity_graph import ENTITIES_FILE, ENTITIES_SKILL, get_entity_graph
+from eam_council.council.deadlines import RunDeadline, StageOutcome, run_stage
 from eam_council.council.general_eam_subagent import run_general_subagent
 from eam_council.council.mock_data import get_mock_context
+from eam_council.council.models import SubagentDraft
 from eam_council.council.prompts import (
+    AGENTIC_ARCH_SUBAGENT_SYSTEM,
     ALIGNMENT_VALIDATOR_SYSTEM,
+    GENERAL_EAM_SUBAGENT_SEARCH_ADDENDUM,
+    GENERAL_EAM_SUBAGENT_SYSTEM,
     LEAD_AGENT_SYSTEM,
+    SAP_EAM_SUBAGENT_SEARCH_ADDENDUM,
+    SAP_EAM_SUBAGENT_SYSTEM,
     build_alignment_check_prompt,
+    build_cached_system,
+    build_conversation,
     build_lead_prompt,
+    build_lead_revision_prompt,
+    build_validation_delta_prompt,
     classify_question,
+    compact_draft,
     filter_context_for_question,
     is_agentic_question,
 )
 from eam_council.council.sap_eam_subagent import run_sap_subagent
-from eam_council.council.llm import create_with_retry
+from eam_council.council.clients import get_async_client
+from eam_council.council.llm import acreate_with_retry, astream_with_retry
+from eam_council.council.retrieval import get_retriever
+from eam_council.council.retry import RetryBudget, retry_budget_scope
+from eam_council.council.rate_limiter import CALIBRATION_PATH, Priority, get_calibrator
 from eam_council.council.runtime_config import load_runtime_config
-from eam_council.council.skills_loader import load_all_skills, load_selected_skills
-from eam_council.council.telemetry import RunTelemetry
+from eam_council.council.skills_loader import get_skills_repository, load_all_skills, load_selected_skills
+from eam_council.council.speculation import find_conflicts
+from eam_council.council.telemetry import RunTelemetry, telemetry_scope
+from eam_council.council.token_counter import get_token_counter, prime_static_prompts
 
 console = Console()
 
@@ -260,41 +284,169 @@ async def _request_clarification(
     return None
 
 
+def _mark_cut(cut_stages: list[str], telemetry: RunTelemetry, stage: str, reason: str | None) -> None:
+    reason = reason or "cut"
+    cut_stages.append(f"`{stage}` {reason}")
+    telemetry.mark_cut(stage=stage, reason=reason)
+    console.print(f"[yellow]Stage {stage} {reason}; continuing with degraded output[/yellow]")
+
+
+def _draft_or_placeholder(
+    outcome: StageOutcome,
+    stage: str,
+    agent_name: str,
+    perspective: str,
+    cut_stages: list[str],
+    telemetry: RunTelemetry,
+) -> SubagentDraft:
+    """Return the stage draft, or a placeholder so the lead can reconcile what is ready."""
+    if not outcome.cut:
+        return outcome.value
+    _mark_cut(cut_stages, telemetry, stage, outcome.reason)
+    return SubagentDraft(
+        agent_name=agent_name,
+        perspective=perspective,
+        content=f"_{agent_name} draft unavailable ({outcome.reason}). Reconcile without this perspective._",
+    )
+
+
+def _unreconciled_output(
+    question: str,
+    sap_draft: SubagentDraft,
+    general_draft: SubagentDraft,
+    agentic_draft: SubagentDraft | None,
+) -> str:
+    """Degraded answer used when the lead could not reconcile within the deadline."""
+    agentic = agentic_draft.content if agentic_draft else "Not applicable for this question."
+    return (
+        "# EAM Architecture Council -- Response\n\n"
+        f"## Question\n{question}\n\n"
+        "## Executive Summary\n"
+        "Lead reconciliation did not finish within the latency bound. "
+        "The expert drafts below are unreconciled and should be reviewed directly.\n\n"
+        f"## SAP EAM Perspective\n{sap_draft.content}\n\n"
+        f"## General EAM Perspective\n{general_draft.content}\n\n"
+        f"## Agentic Architecture Perspective\n{agentic}\n"
+    )
+
+
+def _append_run_notes(final_output: str, cut_stages: list[str], notes: list[str] | None = None) -> str:
+    """State reused drafts and cut stages so readers know how the answer was produced."""
+    lines = [f"- {note}" for note in notes or []]
+    lines += [f"- Stage {entry}" for entry in cut_stages]
+    if not lines:
+        return final_output
+    return f"{final_output.rstrip()}\n\n## Run Notes\n" + "\n".join(lines) + "\n"
+
+
+async def _checkpointed(
+    checkpoint: RunCheckpoint | None,
+    stage: str,
+    factory: Callable[[], Awaitable],
+    timeout: float | None,
+) -> StageOutcome:
+    """Return a stage's checkpointed output, or run it and checkpoint the result."""
+    if checkpoint is not None:
+        found, value = checkpoint.load_stage(stage)
+        if found:
+            console.print(f"[dim]Stage {stage} restored from checkpoint[/dim]")
+            return StageOutcome(value=value)
+    outcome = await run_stage(factory(), timeout)
+    if checkpoint is not None and not outcome.cut:
+        checkpoint.save(stage, outcome.value)
+    return outcome
+
+
 async def run_council(
     question: str,
     model: str,
     dry_run: bool = False,
     search_enabled: bool = True,
+    on_token: Callable[[str], None] | None = None,
+    run_id: str | None = None,
 ) -> str:
-    """Run the full council workflow and return the final output."""
+    """Run the full council workflow and return the final output.
+
+    When ``on_token`` is given, the first lead reconciliation is streamed to it
+    as text arrives; the return value is still the complete final output.
+
+    Live runs checkpoint every completed stage under ``out/runs/<run_id>/``.
+    Passing the ``run_id`` of an earlier, unfinished run resumes it from the
+    first stage without a checkpoint.
+    """
     cfg = load_runtime_config()
     telemetry = RunTelemetry()
+    checkpoint = None
+    if cfg.checkpoints and not dry_run:
+        checkpoint = RunCheckpoint.open(run_id, question=question, model=model, search_enabled=search_enabled)
+        console.print(f"[dim]Run id: {checkpoint.run_id}[/dim]")
+
+    try:
+        with retry_budget_scope(RetryBudget(cfg.retry_budget)), telemetry_scope(telemetry):
+            result = await _run_council(question, model, dry_run, search_enabled, on_token, telemetry, checkpoint)
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        if checkpoint is not None:
+            checkpoint.mark("interrupted")
+        raise
+    except Exception as exc:
+        if checkpoint is not None:
+            checkpoint.mark("failed", error=repr(exc))
+        raise
+    if checkpoint is not None:
+        checkpoint.mark("complete")
+    return result
+
+
+REQUIRED_SECTIONS = (
+    "Executive Summary",
+    "SAP EAM Perspective",
+    "General EAM Perspective",
+    "Agentic Architecture Perspective",
+    "Agent Suitability Decision",
+    "Impact & Worthwhile Assessment",
+    "Unified Recommendation",
+    "Assumptions & Open Questions",
+    "Decision Log",
+    "Next Agent To Build",
+)
 
-    console.print("[dim]Loading skills and resources...[/dim]")
-    if cfg.context_routing_v2:
-        classification = classify_question(question)
-        selected_skills = {"eam_council", "eam_glossary_entities"}
-        if classification != "general":
-            selected_skills.add("eam_spec_writer")
-        include_resources = {
-            "eam_glossary_entities": {"glossary.md"} if cfg.minimal_mode else {"glossary.md", "canonical_entities.yaml"},
-            "eam_council": {"output_format.md", "reconciliation_rules.md"},
-            "eam_spec_writer": {"spec_template.md"} if cfg.minimal_mode else {"spec_template.md", "example_spec_work_order_scheduling.md"},
-        }
-        skills_context = load_selected_skills(include_skills=selected_skills, include_resources=include_resources)
-    else:
-        skills_context = load_all_skills()
+# Stages whose single output is stored in the run checkpoint. The validation
+# stage checkpoints each of its rounds itself.
+CHECKPOINTED_STAGES = frozenset({"sap", "general", "agentic_speculative", "agentic", "lead", "lead_escalated"})
+
+# At most one lead call is in flight; the experts run side by side.
+STAGE_GROUP_LIMITS = {"lead": 1}
+
+
+def _has_all_sections(text: str) -> bool:
+    low = text.lower()
+    return all(s.lower() in low for s in REQUIRED_SECTIONS)
+
+
+async def _run_council(
+    question: str,
+    model: str,
+    dry_run: bool,
+    search_enabled: bool,
+    on_token: Callable[[str], None] | None,
+    telemetry: RunTelemetry,
+    checkpoint: RunCheckpoint | None,
+) -> str:
+    cfg = load_runtime_config()
+    deadline = RunDeadline(cfg.run_deadline_seconds)
+    cut_stages: list[str] = []
+    run_notes: list[str] = []
+    # Filled by the stage graph as stages finish; read back for per-stage telemetry.
+    stage_timings: dict[str, StageTiming] = {}
 
-    mock_context = "" if cfg.minimal_mode else get_mock_context()
+    def elapsed_ms(stage: str) -> int:
+        timing = stage_timings.get(stage)
+        return int(timing.elapsed_ms) if timing is not None else 0
 
     effective_search = search_enabled
     if cfg.conditional_search:
         effective_search = search_enabled and classify_question(question) == "api"
 
-    search_label = " (with web search)" if effective_search else ""
-    console.print(f"[dim]Consulting SAP EAM expert{search_label}...[/dim]")
-    console.print(f"[dim]Consulting General EAM expert{search_label}...[/dim]")
-
     agentic_mode = is_agentic_question(question)
     search_budget = cfg.search_budget
     sap_search = effective_search and search_budget > 0
@@ -304,16 +456,199 @@ async def run_council(
     if general_search:
         search_budget -= 1
 
-    sap_draft, general_draft = await asyncio.gather(
-        run_sap_subagent(question, skills_context, mock_context, model, dry_run, sap_search),
-        run_general_subagent(question, skills_context, mock_context, model, dry_run, general_search),
-    )
-    telemetry.record(stage="sap", prompt_chars=len(question) + len(skills_context) + len(mock_context), completion_chars=len(sap_draft.content), elapsed_ms=0, tool_uses=1 if sap_search else 0)
-    telemetry.record(stage="general", prompt_chars=len(question) + len(skills_context) + len(mock_context), completion_chars=len(general_draft.content), elapsed_ms=0, tool_uses=1 if general_search else 0)
+    retriever = get_retriever(Path(cfg.retrieval_index_path)) if cfg.retrieval else None
+    draft_index = DraftIndex(Path(cfg.draft_index_path)) if cfg.draft_reuse and not dry_run else None
+    client = None if dry_run else get_async_client()
+
+    def expert_timeout() -> float | None:
+        return deadline.budget_for(cfg.expert_timeout_seconds)
+
+    def lead_timeout() -> float | None:
+        return deadline.budget_for(cfg.lead_timeout_seconds)
+
+    async def _ask(
+        stage: str,
+        system: str | list[dict],
+        turns: list[str],
+        max_tokens: int,
+        on_text: Callable[[str], None] | None = None,
+    ) -> str:
+        request = dict(
+            retries=cfg.retries if cfg.enable_retry else 0,
+            priority=Priority.LEAD,
+            stage=stage,
+            model=model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=build_conversation(turns, cache=cfg.prompt_caching),
+        )
+        if on_text is None:
+            response = await acreate_with_retry(client, **request)
+        else:
+            response = await astream_with_retry(client, on_text=on_text, **request)
+        return response.content[0].text
+
+    def read_skills() -> str:
+        console.print("[dim]Loading skills and resources...[/dim]")
+        if retriever is not None:
+            skills_context = retriever.context_for(question, cfg.retrieval_expert_budget)
+        elif cfg.context_routing_v2:
+            classification = classify_question(question)
+            selected_skills = {"eam_council", "eam_glossary_entities"}
+            if classification != "general":
+                selected_skills.add("eam_spec_writer")
+            include_resources = {
+                "eam_glossary_entities": {"glossary.md"} if cfg.minimal_mode else {"glossary.md", "canonical_entities.yaml"},
+                "eam_council": {"output_format.md", "reconciliation_rules.md"},
+                "eam_spec_writer": {"spec_template.md"} if cfg.minimal_mode else {"spec_template.md", "example_spec_work_order_scheduling.md"},
+            }
+            # The entity model is rendered from the parsed graph, scoped to the question.
+            entity_graph = cfg.entity_graph and ENTITIES_FILE in include_resources[ENTITIES_SKILL]
+            if entity_graph:
+                include_resources[ENTITIES_SKILL] = include_resources[ENTITIES_SKILL] - {ENTITIES_FILE}
+            skills_context = load_selected_skills(include_skills=selected_skills, include_resources=include_resources)
+            if entity_graph:
+                entities_section = get_entity_graph().context_for(question, depth=cfg.entity_graph_depth)
+                skills_context = f"{skills_context}\n\n{entities_section}"
+        else:
+            skills_context = load_all_skills()
+        return skills_context
+
+    async def load_skills(_: Inputs) -> str:
+        # Skills and data load on worker threads so the two reads overlap.
+        return await asyncio.to_thread(read_skills)
+
+    async def load_data(_: Inputs) -> str:
+        return "" if cfg.minimal_mode else await asyncio.to_thread(get_mock_context)
+
+    async def plan_experts(v: Inputs) -> tuple[str, str, str]:
+        skills_context, mock_context = v["raw_skills_context"], v["raw_mock_context"]
+        if cfg.budget_planner:
+            # One plan for both experts keeps their shared cached prefix identical.
+            expert_plan = plan_prompt(
+                "experts",
+                cfg.expert_input_budget,
+                question=question,
+                skills_context=skills_context,
+                mock_context=mock_context,
+                fixed=(
+                    max(
+                        SAP_EAM_SUBAGENT_SYSTEM + SAP_EAM_SUBAGENT_SEARCH_ADDENDUM,
+                        GENERAL_EAM_SUBAGENT_SYSTEM + GENERAL_EAM_SUBAGENT_SEARCH_ADDENDUM,
+                        key=len,
+                    ),
+                ),
+            )
+            record_plan(telemetry, expert_plan)
+            skills_context, mock_context = expert_plan.skills_context, expert_plan.mock_context
+        prime_static_prompts()
+        get_token_counter().prime([skills_context])
+
+        lead_context = skills_context
+        if retriever is not None and cfg.retrieval_lead_budget != cfg.retrieval_expert_budget:
+            lead_context = retriever.context_for(question, cfg.retrieval_lead_budget)
+        if cfg.context_routing_v2:
+            lead_context = filter_context_for_question(lead_context, question)
+        return skills_context, mock_context, lead_context
+
+    def draft_context(v: Inputs) -> str:
+        # Question-independent: the question-scoped entity subgraph or retrieved
+        # chunks would make paraphrases miss each other.
+        settings = (cfg.minimal_mode, cfg.context_routing_v2, cfg.entity_graph, cfg.retrieval, cfg.budget_planner)
+        return context_digest(
+            get_skills_repository().fingerprint(),
+            v["raw_mock_context"],
+            str(settings),
+            str(agentic_mode),
+            str(effective_search),
+        )
+
+    async def reuse_drafts(v: Inputs):
+        match = draft_index.lookup(
+            question, model=model, context=draft_context(v), threshold=cfg.draft_reuse_threshold
+        )
+        if match is not None:
+            console.print(f"[dim]Reusing expert drafts from a similar question ({match.score:.2f})...[/dim]")
+            run_notes.append(
+                f"Expert drafts reused from a prior run of a similar question "
+                f"(similarity {match.score:.2f}): \"{match.question}\""
+            )
+        return match
+
+    search_label = " (with web search)" if effective_search else ""
+
+    async def consult_sap(v: Inputs) -> SubagentDraft:
+        console.print(f"[dim]Consulting SAP EAM expert{search_label}...[/dim]")
+        return await run_sap_subagent(question, v["skills_context"], v["mock_context"], model, dry_run, sap_search)
+
+    async def consult_general(v: Inputs) -> SubagentDraft:
+        console.print(f"[dim]Consulting General EAM expert{search_label}...[/dim]")
+        return await run_general_subagent(question, v["skills_context"], v["mock_context"], model, dry_run, general_search)
+
+    def expert_placeholder(stage: str, agent_name: str, perspective: str):
+        def on_cut(_: Inputs, reason: str) -> SubagentDraft:
+            return _draft_or_placeholder(
+                StageOutcome(cut=True, reason=reason), stage, agent_name, perspective, cut_stages, telemetry
+            )
 
-    if agentic_mode:
+        return on_cut
+
+    async def collect_drafts(v: Inputs) -> tuple[SubagentDraft, SubagentDraft]:
+        match = v["reused"]
+        if match is not None:
+            return match.sap, match.general
+        sap_draft, general_draft = v["sap_draft"], v["general_draft"]
+        prompt_chars = len(question) + len(v["skills_context"]) + len(v["mock_context"])
+        telemetry.record(stage="sap", prompt_chars=prompt_chars, completion_chars=len(sap_draft.content), elapsed_ms=elapsed_ms("sap"), tool_uses=1 if sap_search else 0)
+        telemetry.record(stage="general", prompt_chars=prompt_chars, completion_chars=len(general_draft.content), elapsed_ms=elapsed_ms("general"), tool_uses=1 if general_search else 0)
+        return sap_draft, general_draft
+
+    def needs_agentic(v: Inputs) -> bool:
+        match = v["reused"]
+        return agentic_mode and (match is None or match.agentic is None)
+
+    def agentic_context(v: Inputs, stage: str, drafts: tuple[str, ...]) -> tuple[str, str]:
+        skills_context, mock_context = v["skills_context"], v["mock_context"]
+        if cfg.budget_planner:
+            agentic_plan = plan_prompt(
+                stage,
+                cfg.expert_input_budget,
+                question=question,
+                drafts=drafts,
+                skills_context=skills_context,
+                mock_context=mock_context,
+                fixed=(AGENTIC_ARCH_SUBAGENT_SYSTEM,),
+            )
+            record_plan(telemetry, agentic_plan)
+            skills_context, mock_context = agentic_plan.skills_context, agentic_plan.mock_context
+        return skills_context, mock_context
+
+    async def speculate_agentic(v: Inputs) -> SubagentDraft:
+        console.print("[dim]Consulting Agentic Architecture expert (alongside EAM experts)...[/dim]")
+        skills_context, mock_context = agentic_context(v, "agentic_speculative", ())
+        return await run_agentic_arch_subagent(
+            question, skills_context, mock_context, model, dry_run, speculative=True
+        )
+
+    def speculation_cut(_: Inputs, reason: str) -> None:
+        console.print(f"[yellow]Speculative agentic draft {reason}; running it after the EAM drafts[/yellow]")
+        return None
+
+    async def check_agentic(v: Inputs) -> list[str]:
+        conflicts = find_conflicts(v["agentic_speculative"].content, v["sap"].content, v["general"].content)
+        telemetry.record_speculation(stage="agentic", accepted=not conflicts, conflicts=conflicts)
+        if conflicts:
+            console.print(f"[yellow]Speculative agentic draft conflicts with EAM drafts:[/yellow] {'; '.join(conflicts[:3])}")
+        return conflicts
+
+    def needs_sequential_agentic(v: Inputs) -> bool:
+        return needs_agentic(v) and (v["agentic_speculative"] is None or bool(v["agentic_conflicts"]))
+
+    async def consult_agentic(v: Inputs) -> SubagentDraft:
         console.print("[dim]Consulting Agentic Architecture expert (after EAM drafts)...[/dim]")
-        agentic_draft = await run_agentic_arch_subagent(
+        sap_draft, general_draft = v["sap"], v["general"]
+        skills_context, mock_context = agentic_context(v, "agentic", (sap_draft.content, general_draft.content))
+        return await run_agentic_arch_subagent(
             question,
             skills_context,
             mock_context,
@@ -322,108 +657,180 @@ async def run_council(
             sap_draft=sap_draft.content,
             general_draft=general_draft.content,
         )
-        telemetry.record(stage="agentic", prompt_chars=len(question) + len(skills_context) + len(mock_context) + len(sap_draft.content) + len(general_draft.content), completion_chars=len(agentic_draft.content), elapsed_ms=0)
-    else:
-        agentic_draft = None
-
-    console.print(f"[green]OK[/green] SAP expert responded ({len(sap_draft.content)} chars)")
-    console.print(f"[green]OK[/green] General expert responded ({len(general_draft.content)} chars)")
-    if agentic_draft:
-        console.print(f"[green]OK[/green] Agentic expert responded ({len(agentic_draft.content)} chars)")
-
-    console.print("[dim]Lead architect reconciling...[/dim]")
-
-    lead_skills_context = filter_context_for_question(skills_context, question) if cfg.context_routing_v2 else skills_context
-
-    if dry_run:
-        final_output = DRY_RUN_FINAL_AGENTIC if agentic_mode else DRY_RUN_FINAL
-    else:
-        client = anthropic.Anthropic()
 
+    def agentic_cut(_: Inputs, reason: str) -> None:
+        _mark_cut(cut_stages, telemetry, "agentic", reason)
+        return None
+
+    async def settle_agentic(v: Inputs) -> SubagentDraft | None:
+        match, agentic_draft = v["reused"], v["agentic_draft"]
+        prompt_chars = len(question) + len(v["skills_context"]) + len(v["mock_context"])
+        if match is not None and match.agentic is not None:
+            agentic_draft = match.agentic
+        elif agentic_draft is not None:
+            telemetry.record(stage="agentic", prompt_chars=prompt_chars + len(v["sap"].content) + len(v["general"].content), completion_chars=len(agentic_draft.content), elapsed_ms=elapsed_ms("agentic"))
+        elif v["agentic_speculative"] is not None:
+            # Accepted, or the re-run was cut and the speculative draft is all there is.
+            agentic_draft = v["agentic_speculative"]
+            telemetry.record(stage="agentic_speculative", prompt_chars=prompt_chars, completion_chars=len(agentic_draft.content), elapsed_ms=elapsed_ms("agentic_speculative"))
+        if draft_index is not None and match is None and not cut_stages:
+            draft_index.add(
+                question,
+                model=model,
+                context=draft_context(v),
+                sap=v["sap"],
+                general=v["general"],
+                agentic=agentic_draft,
+            )
+        return agentic_draft
+
+    async def prepare_lead(v: Inputs) -> tuple[str | list[dict], str]:
+        sap_draft, general_draft, agentic_draft = v["sap"], v["general"], v["agentic"]
+        console.print(f"[green]OK[/green] SAP expert responded ({len(sap_draft.content)} chars)")
+        console.print(f"[green]OK[/green] General expert responded ({len(general_draft.content)} chars)")
+        if agentic_draft:
+            console.print(f"[green]OK[/green] Agentic expert responded ({len(agentic_draft.content)} chars)")
+        console.print("[dim]Lead architect reconciling...[/dim]")
+
+        lead_skills_context = v["lead_context"]
+        if cfg.budget_planner:
+            lead_drafts = [d.content for d in (sap_draft, general_draft, agentic_draft) if d is not None]
+            if cfg.lead_compaction:
+                lead_drafts = [compact_draft(d) for d in lead_drafts]
+            lead_plan = plan_prompt(
+                "lead",
+                cfg.lead_input_budget,
+                question=question,
+                drafts=lead_drafts,
+                skills_context=lead_skills_context,
+                fixed=(LEAD_AGENT_SYSTEM,),
+            )
+            record_plan(telemetry, lead_plan)
+            lead_skills_context = lead_plan.skills_context
+
+        # With prompt caching the lead's skills context rides in the cached
+        # system prefix shared with the experts rather than in each prompt.
+        lead_system: str | list[dict] = LEAD_AGENT_SYSTEM
+        prompt_context = lead_skills_context
+        if cfg.prompt_caching:
+            lead_system = build_cached_system(LEAD_AGENT_SYSTEM, lead_skills_context)
+            prompt_context = ""
         lead_prompt = build_lead_prompt(
             question,
             sap_draft.content,
             general_draft.content,
-            lead_skills_context,
+            prompt_context,
             agentic_draft.content if agentic_draft else None,
             compact=cfg.lead_compaction,
         )
-        response = create_with_retry(
-            client,
-            retries=cfg.retries if cfg.enable_retry else 0,
-            model=model,
-            max_tokens=cfg.lead_max_tokens,
-            system=LEAD_AGENT_SYSTEM,
-            messages=[{"role": "user", "content": lead_prompt}],
+        return lead_system, lead_prompt
+
+    async def reconcile(v: Inputs) -> str:
+        if dry_run:
+            final_output = DRY_RUN_FINAL_AGENTIC if agentic_mode else DRY_RUN_FINAL
+            if on_token is not None:
+                for line in final_output.splitlines(keepends=True):
+                    on_token(line)
+            return final_output
+
+        lead_started = time.perf_counter()
+        first_token_ms: int | None = None
+
+        def _on_lead_text(text: str) -> None:
+            nonlocal first_token_ms
+            if first_token_ms is None:
+                first_token_ms = int((time.perf_counter() - lead_started) * 1000)
+            on_token(text)
+
+        final_output = await _ask(
+            "lead",
+            v["lead_system"],
+            [v["lead_prompt"]],
+            cfg.lead_max_tokens,
+            on_text=_on_lead_text if on_token is not None else None,
         )
-        final_output = response.content[0].text
-        telemetry.record(stage="lead", prompt_chars=len(lead_prompt), completion_chars=len(final_output), elapsed_ms=0)
-
-        required_sections = [
-            "Executive Summary",
-            "SAP EAM Perspective",
-            "General EAM Perspective",
-            "Agentic Architecture Perspective",
-            "Agent Suitability Decision",
-            "Impact & Worthwhile Assessment",
-            "Unified Recommendation",
-            "Assumptions & Open Questions",
-            "Decision Log",
-            "Next Agent To Build",
-        ]
-
-        def _has_all_sections(text: str) -> bool:
-            low = text.lower()
-            return all(s.lower() in low for s in required_sections)
-
-        if not _has_all_sections(final_output):
-            response = create_with_retry(
-                client,
-                retries=cfg.retries if cfg.enable_retry else 0,
-                model=model,
-                max_tokens=cfg.lead_max_tokens_escalated,
-                system=LEAD_AGENT_SYSTEM,
-                messages=[{"role": "user", "content": lead_prompt}],
-            )
-            final_output = response.content[0].text
-
-        for _ in range(2):
-            check_prompt = build_alignment_check_prompt(
-                question,
-                sap_draft.content,
-                general_draft.content,
-                final_output,
-                agentic_draft.content if agentic_draft else None,
-            )
-            check = create_with_retry(
-                client,
-                retries=cfg.retries if cfg.enable_retry else 0,
-                model=model,
-                max_tokens=400,
-                system=ALIGNMENT_VALIDATOR_SYSTEM,
-                messages=[{"role": "user", "content": check_prompt}],
+        telemetry.record(
+            stage="lead",
+            prompt_chars=len(v["lead_prompt"]),
+            completion_chars=len(final_output),
+            elapsed_ms=int((time.perf_counter() - lead_started) * 1000),
+            ttft_ms=first_token_ms,
+        )
+        return final_output
+
+    def cut_and_skip(stage: str):
+        def on_cut(_: Inputs, reason: str) -> None:
+            _mark_cut(cut_stages, telemetry, stage, reason)
+            return None
+
+        return on_cut
+
+    def needs_escalation(v: Inputs) -> bool:
+        return not dry_run and v["lead_output"] is not None and not _has_all_sections(v["lead_output"])
+
+    async def escalate(v: Inputs) -> str:
+        return await _ask("lead_escalated", v["lead_system"], [v["lead_prompt"]], cfg.lead_max_tokens_escalated)
+
+    async def validate(v: Inputs) -> str:
+        final_output = v["lead_escalated"] if v["lead_escalated"] is not None else v["lead_output"]
+        sap_draft, general_draft, agentic_draft = v["sap"], v["general"], v["agentic"]
+        lead_system = v["lead_system"]
+
+        # Follow-up rounds continue two conversations instead of rebuilding
+        # full prompts: the validator sees only the clarified draft and a diff
+        # of the candidate, the lead only the clarified draft. With prompt
+        # caching the earlier turns are read back from the cache.
+        validator_turns: list[str] = []
+        lead_turns = [v["lead_prompt"]]
+        for round_no in range(2):
+            if not validator_turns:
+                validator_turns.append(
+                    build_alignment_check_prompt(
+                        question,
+                        sap_draft.content,
+                        general_draft.content,
+                        final_output,
+                        agentic_draft.content if agentic_draft else None,
+                    )
+                )
+            check = await _checkpointed(
+                checkpoint,
+                f"validator_round_{round_no + 1}",
+                lambda: _ask("validator", ALIGNMENT_VALIDATOR_SYSTEM, validator_turns, 400),
+                deadline.budget_for(cfg.validator_timeout_seconds),
             )
-            verdict = check.content[0].text
-            needs_fix, target, reason = _validator_needs_clarification(verdict)
+            if check.cut:
+                _mark_cut(cut_stages, telemetry, f"validator_round_{round_no + 1}", check.reason)
+                break
+            needs_fix, target, reason = _validator_needs_clarification(check.value)
             if not needs_fix or not target:
                 break
 
             console.print(
                 f"[yellow]Validation flagged misalignment[/yellow] -> requesting clarification from {target} expert"
             )
-            updated = await _request_clarification(
-                target=target,
-                reason=reason,
-                question=question,
-                skills_context=skills_context,
-                mock_context=mock_context,
-                model=model,
-                dry_run=dry_run,
-                search_enabled=False,
-                sap_draft=sap_draft.content,
-                general_draft=general_draft.content,
-                agentic_draft=agentic_draft.content if agentic_draft else None,
+            clarification = await _checkpointed(
+                checkpoint,
+                f"clarification_round_{round_no + 1}",
+                lambda: _request_clarification(
+                    target=target,
+                    reason=reason,
+                    question=question,
+                    skills_context=v["skills_context"],
+                    mock_context=v["mock_context"],
+                    model=model,
+                    dry_run=dry_run,
+                    search_enabled=False,
+                    sap_draft=sap_draft.content,
+                    general_draft=general_draft.content,
+                    agentic_draft=agentic_draft.content if agentic_draft else None,
+                ),
+                deadline.budget_for(cfg.expert_timeout_seconds),
             )
+            if clarification.cut:
+                _mark_cut(cut_stages, telemetry, f"clarification_{target}", clarification.reason)
+                break
+            updated = clarification.value
 
             if updated is None:
                 break
@@ -435,25 +842,181 @@ async def run_council(
             elif target == "agentic":
                 agentic_draft = updated
 
-            lead_prompt = build_lead_prompt(
-                question,
-                sap_draft.content,
-                general_draft.content,
-                lead_skills_context,
-                agentic_draft.content if agentic_draft else None,
-                compact=True,
+            lead_turns += [final_output, build_lead_revision_prompt(target, reason, compact_draft(updated.content))]
+            revised = await _checkpointed(
+                checkpoint,
+                f"lead_revision_{round_no + 1}",
+                lambda: _ask("lead", lead_system, lead_turns, cfg.lead_max_tokens),
+                deadline.budget_for(cfg.lead_timeout_seconds),
             )
-            response = create_with_retry(
-                client,
-                retries=cfg.retries if cfg.enable_retry else 0,
-                model=model,
-                max_tokens=cfg.lead_max_tokens,
-                system=LEAD_AGENT_SYSTEM,
-                messages=[{"role": "user", "content": lead_prompt}],
-            )
-            final_output = response.content[0].text
+            if revised.cut:
+                _mark_cut(cut_stages, telemetry, f"lead_revision_{round_no + 1}", revised.reason)
+                break
+            validator_turns += [
+                check.value,
+                build_validation_delta_prompt(target, reason, updated.content, final_output, revised.value),
+            ]
+            final_output = revised.value
+        return final_output
+
+    # The whole council as one graph. Values flow between stages by name; a
+    # stage starts as soon as everything it reads has been produced.
+    graph = StageGraph(
+        [
+            Stage("skills", load_skills, outputs=("raw_skills_context",)),
+            Stage("data", load_data, outputs=("raw_mock_context",)),
+            Stage(
+                "context",
+                plan_experts,
+                inputs=("raw_skills_context", "raw_mock_context"),
+                outputs=("skills_context", "mock_context", "lead_context"),
+            ),
+            Stage(
+                "reuse",
+                reuse_drafts,
+                inputs=("raw_mock_context",),
+                outputs=("reused",),
+                when=lambda _: draft_index is not None,
+            ),
+            Stage(
+                "sap",
+                consult_sap,
+                inputs=("skills_context", "mock_context", "reused"),
+                outputs=("sap_draft",),
+                group="experts",
+                timeout=expert_timeout,
+                when=lambda v: v["reused"] is None,
+                on_cut=expert_placeholder("sap", "SAP EAM Expert", "SAP-specific"),
+            ),
+            Stage(
+                "general",
+                consult_general,
+                inputs=("skills_context", "mock_context", "reused"),
+                outputs=("general_draft",),
+                group="experts",
+                timeout=expert_timeout,
+                when=lambda v: v["reused"] is None,
+                on_cut=expert_placeholder("general", "General EAM Expert", "Industry-standard"),
+            ),
+            Stage(
+                "drafts",
+                collect_drafts,
+                inputs=("reused", "sap_draft", "general_draft", "skills_context", "mock_context"),
+                outputs=("sap", "general"),
+            ),
+            # Pipelined mode: the agentic expert starts with the EAM experts and
+            # is re-run after them only if its draft conflicts with theirs.
+            Stage(
+                "agentic_speculative",
+                speculate_agentic,
+                inputs=("reused", "skills_context", "mock_context"),
+                outputs=("agentic_speculative",),
+                group="experts",
+                timeout=expert_timeout,
+                when=lambda v: cfg.pipelined_agentic and needs_agentic(v),
+                on_cut=speculation_cut,
+            ),
+            Stage(
+                "agentic_check",
+                check_agentic,
+                inputs=("agentic_speculative", "sap", "general"),
+                outputs=("agentic_conflicts",),
+                when=lambda v: v["agentic_speculative"] is not None,
+            ),
+            Stage(
+                "agentic",
+                consult_agentic,
+                inputs=("reused", "sap", "general", "skills_context", "mock_context", "agentic_speculative", "agentic_conflicts"),
+                outputs=("agentic_draft",),
+                group="experts",
+                timeout=expert_timeout,
+                when=needs_sequential_agentic,
+                on_cut=agentic_cut,
+            ),
+            Stage(
+                "agentic_settled",
+                settle_agentic,
+                inputs=(
+                    "reused",
+                    "agentic_draft",
+                    "agentic_speculative",
+                    "sap",
+                    "general",
+                    "skills_context",
+                    "mock_context",
+                    "raw_mock_context",
+                ),
+                outputs=("agentic",),
+            ),
+            Stage(
+                "lead_prompt",
+                prepare_lead,
+                inputs=("lead_context", "sap", "general", "agentic"),
+                outputs=("lead_system", "lead_prompt"),
+            ),
+            Stage(
+                "lead",
+                reconcile,
+                inputs=("lead_system", "lead_prompt"),
+                outputs=("lead_output",),
+                group="lead",
+                timeout=lead_timeout,
+                on_cut=cut_and_skip("lead"),
+            ),
+            Stage(
+                "lead_escalated",
+                escalate,
+                inputs=("lead_system", "lead_prompt", "lead_output"),
+                outputs=("lead_escalated",),
+                group="lead",
+                timeout=lead_timeout,
+                when=needs_escalation,
+                on_cut=cut_and_skip("lead_escalated"),
+            ),
+            Stage(
+                "validation",
+                validate,
+                inputs=(
+                    "lead_system",
+                    "lead_prompt",
+                    "lead_output",
+                    "lead_escalated",
+                    "sap",
+                    "general",
+                    "agentic",
+                    "skills_context",
+                    "mock_context",
+                ),
+                outputs=("validated",),
+                group="lead",
+                when=lambda v: not dry_run and v["lead_output"] is not None,
+            ),
+        ],
+        group_limits=STAGE_GROUP_LIMITS,
+    )
+
+    async def execute(stage: Stage, factory: Callable[[], Awaitable], timeout: float | None) -> StageOutcome:
+        return await _checkpointed(
+            checkpoint if stage.name in CHECKPOINTED_STAGES else None, stage.name, factory, timeout
+        )
+
+    run = await graph.run(runner=execute, timings=stage_timings)
+    telemetry.record_schedule(timings=run.timing_records(), critical_path=run.critical_path())
+    values = run.values
+
+    for key in ("validated", "lead_escalated", "lead_output"):
+        if values[key] is not None:
+            final_output = values[key]
+            break
+    else:
+        final_output = _unreconciled_output(question, values["sap"], values["general"], values["agentic"])
 
+    final_output = _append_run_notes(final_output, cut_stages, run_notes)
     telemetry.write_json(Path("out") / "telemetry_latest.json")
+    calibrator = get_calibrator()
+    # Only runs that reported plausible API usage update the persisted factors.
+    if not dry_run and telemetry.usage and calibrator.observed:
+        calibrator.save(CALIBRATION_PATH)
 
     console.print("[green]OK[/green] Reconciliation complete")
     return final_output
@@ -2,85 +2,338 @@
 
 from __future__ import annotations
 
-import threading
+import asyncio
+import inspect
 import time
-from collections import deque
-from typing import Any
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
+from eam_council.council.cassette import get_cassette
+from eam_council.council.rate_limiter import (
+    Priority,
+    RateLimiter,
+    Reservation,
+    get_calibrator,
+    get_rate_limiter,
+)
+from eam_council.council.response_cache import ResponseCache, get_response_cache
+from eam_council.council.retry import RetryPolicy, classify_error, get_circuit_breaker
 from eam_council.council.runtime_config import load_runtime_config
+from eam_council.council.telemetry import current_telemetry
+from eam_council.council.token_counter import get_token_counter
 
-_WINDOW_SECONDS = 60.0
-_lock = threading.Lock()
-_usage_events: deque[tuple[float, int]] = deque()
 
+def _estimate_prompt_tokens(kwargs: dict[str, Any]) -> int:
+    """Prompt-side token estimate from cached per-segment counts."""
+    return get_token_counter().count_payload(kwargs)
 
-def _prune_old_events(now: float) -> None:
-    cutoff = now - _WINDOW_SECONDS
-    while _usage_events and _usage_events[0][0] < cutoff:
-        _usage_events.popleft()
 
+def _estimate_tokens(kwargs: dict[str, Any]) -> int:
+    """Rough token estimate from request payload and completion budget."""
+    max_tokens = int(kwargs.get("max_tokens", 0) or 0)
+    return _estimate_prompt_tokens(kwargs) + max_tokens
 
-def _current_usage(now: float) -> int:
-    _prune_old_events(now)
-    return sum(tokens for _, tokens in _usage_events)
 
+def _usage_breakdown(response: Any) -> dict[str, int] | None:
+    """Return the token counts reported in ``response.usage``, split by cache traffic."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    try:
+        return {
+            "input_tokens": int(getattr(usage, "input_tokens", 0) or 0),
+            "output_tokens": int(getattr(usage, "output_tokens", 0) or 0),
+            "cache_read_tokens": int(getattr(usage, "cache_read_input_tokens", 0) or 0),
+            "cache_write_tokens": int(getattr(usage, "cache_creation_input_tokens", 0) or 0),
+        }
+    except (TypeError, ValueError):
+        return None
 
-def _wait_for_capacity(requested_tokens: int, tokens_per_minute: int) -> None:
-    if tokens_per_minute <= 0:
-        return
 
-    # Avoid deadlocking when one request is larger than the budget.
-    requested_tokens = min(requested_tokens, tokens_per_minute)
+class _Throttle:
+    """Books a calibrated reservation and reconciles it with ``response.usage``."""
 
-    while True:
-        with _lock:
-            now = time.monotonic()
-            in_window = _current_usage(now)
-            if in_window + requested_tokens <= tokens_per_minute:
-                _usage_events.append((now, requested_tokens))
-                return
+    def __init__(self, stage: str, priority: Priority, kwargs: dict[str, Any]) -> None:
+        cfg = load_runtime_config()
+        self.stage = stage
+        self.priority = priority
+        self.prompt_estimate = _estimate_prompt_tokens(kwargs)
+        self.max_tokens = int(kwargs.get("max_tokens", 0) or 0)
+        self.limiter: RateLimiter | None = None
+        if cfg.enable_tpm_throttle:
+            self.limiter = get_rate_limiter(
+                cfg.tokens_per_minute,
+                backend=cfg.limiter_backend,
+                path=Path(cfg.limiter_path) if cfg.limiter_path else None,
+            )
+        self.reservation: Reservation | None = None
 
-            oldest_ts = _usage_events[0][0] if _usage_events else now
-            sleep_for = max(0.01, _WINDOW_SECONDS - (now - oldest_ts))
-        time.sleep(sleep_for)
+    @property
+    def requested(self) -> int:
+        return get_calibrator().reserve(self.stage, self.prompt_estimate, self.max_tokens)
 
+    def acquire_blocking(self) -> None:
+        if self.limiter is not None:
+            self.reservation = self.limiter.acquire_blocking(self.requested, self.priority)
 
-def _estimate_tokens(kwargs: dict[str, Any]) -> int:
-    """Rough token estimate from request payload and completion budget."""
-    text_parts: list[str] = []
+    async def acquire(self) -> None:
+        if self.limiter is not None:
+            self.reservation = await self.limiter.acquire(self.requested, self.priority)
 
-    system = kwargs.get("system")
-    if isinstance(system, str):
-        text_parts.append(system)
+    def settle(self, response: Any) -> None:
+        breakdown = _usage_breakdown(response)
+        if breakdown is None:
+            return
+        telemetry = current_telemetry()
+        if telemetry is not None:
+            telemetry.record_usage(stage=self.stage, **breakdown)
+        input_tokens = breakdown["input_tokens"] + breakdown["cache_read_tokens"] + breakdown["cache_write_tokens"]
+        output_tokens = breakdown["output_tokens"]
+        get_calibrator().observe(
+            self.stage,
+            estimated_prompt_tokens=self.prompt_estimate,
+            max_tokens=self.max_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        if self.limiter is not None and self.reservation is not None:
+            # Cache reads do not count against the input-tokens-per-minute limit.
+            billed = input_tokens - breakdown["cache_read_tokens"]
+            self.limiter.settle(self.reservation, billed + output_tokens)
+            self.reservation = None
 
-    for msg in kwargs.get("messages", []) or []:
-        content = msg.get("content") if isinstance(msg, dict) else None
-        if isinstance(content, str):
-            text_parts.append(content)
+    def release(self) -> None:
+        """Return the whole reservation when the call failed or was cancelled."""
+        if self.limiter is not None and self.reservation is not None:
+            self.limiter.settle(self.reservation, 0)
+            self.reservation = None
 
-    prompt_chars = sum(len(p) for p in text_parts)
-    prompt_tokens = max(1, prompt_chars // 4)
-    max_tokens = int(kwargs.get("max_tokens", 0) or 0)
-    return prompt_tokens + max_tokens
+
+def _cache_lookup(stage: str, kwargs: dict[str, Any]) -> tuple[ResponseCache | None, Any]:
+    """Return ``(cache, cached_response)``; the cache is None when off or bypassed."""
+    cache = get_response_cache(load_runtime_config())
+    if cache is None or not cache.enabled_for(stage):
+        return None, None
+    response = cache.get(kwargs)
+    telemetry = current_telemetry()
+    if telemetry is not None:
+        telemetry.record_response_cache(stage=stage, hit=response is not None)
+    return cache, response
+
+
+def _call_create(client: Any, kwargs: dict[str, Any]) -> Any:
+    cassette = get_cassette(load_runtime_config())
+    if cassette is not None and cassette.replaying:
+        return cassette.replay(kwargs)
+
+    started = time.perf_counter()
+    response = client.messages.create(**kwargs)
+    if cassette is not None and cassette.recording:
+        cassette.record(kwargs, response, time.perf_counter() - started)
+    return response
 
 
-def create_with_retry(client: Any, *, retries: int = 2, **kwargs: Any) -> Any:
+def create_with_retry(
+    client: Any,
+    *,
+    retries: int = 2,
+    priority: Priority = Priority.EXPERT,
+    stage: str = "default",
+    **kwargs: Any,
+) -> Any:
+    cache, cached = _cache_lookup(stage, kwargs)
+    if cached is not None:
+        return cached
+
+    throttle = _Throttle(stage, priority, kwargs)
+    throttle.acquire_blocking()
+
+    try:
+        response = _retry(lambda: _call_create(client, kwargs), retries)
+    except BaseException:
+        throttle.release()
+        raise
+    throttle.settle(response)
+    if cache is not None:
+        cache.put(kwargs, response)
+    return response
+
+
+def _retry(send: Callable[[], Any], retries: int) -> Any:
+    """Shared sync retry loop: breaker check and policy backoff."""
     cfg = load_runtime_config()
-    if cfg.enable_tpm_throttle:
-        _wait_for_capacity(
-            requested_tokens=_estimate_tokens(kwargs),
-            tokens_per_minute=cfg.tokens_per_minute,
-        )
+    policy = RetryPolicy.from_config(cfg, retries)
+    breaker = get_circuit_breaker(cfg)
+    attempt = 0
+    while True:
+        breaker.before_call()
+        try:
+            response = send()
+        except Exception as exc:  # noqa: BLE001
+            breaker.record_failure(classify_error(exc))
+            delay = policy.next_delay(attempt, exc)
+            if delay is None:
+                raise
+            attempt += 1
+            time.sleep(delay)
+        else:
+            breaker.record_success()
+            return response
+
+
+async def _acall_create(client: Any, kwargs: dict[str, Any]) -> Any:
+    """Await ``client.messages.create``, offloading sync clients to a worker thread.
 
-    last_exc: Exception | None = None
-    for attempt in range(retries + 1):
+    With a cassette configured, calls are answered from (or recorded to) disk.
+    """
+    cassette = get_cassette(load_runtime_config())
+    if cassette is not None and cassette.replaying:
+        return await cassette.areplay(kwargs)
+
+    started = time.perf_counter()
+    create = client.messages.create
+    if inspect.iscoroutinefunction(inspect.unwrap(create)):
+        response = await create(**kwargs)
+    else:
+        response = await asyncio.to_thread(create, **kwargs)
+    if cassette is not None and cassette.recording:
+        cassette.record(kwargs, response, time.perf_counter() - started)
+    return response
+
+
+async def _acall_stream(client: Any, kwargs: dict[str, Any], on_text: Callable[[str], None]) -> Any:
+    """Stream ``client.messages.stream`` (or its cassette replay) into ``on_text``."""
+    cassette = get_cassette(load_runtime_config())
+    if cassette is not None and cassette.replaying:
+        return await cassette.areplay_stream(kwargs, on_text)
+
+    started = time.perf_counter()
+    chunks: list[str] = []
+    ttft: float | None = None
+    async with client.messages.stream(**kwargs) as stream:
+        async for text in stream.text_stream:
+            if ttft is None:
+                ttft = time.perf_counter() - started
+            chunks.append(text)
+            on_text(text)
+        response = await stream.get_final_message()
+    if cassette is not None and cassette.recording:
+        cassette.record(kwargs, response, time.perf_counter() - started, chunks=chunks, ttft=ttft)
+    return response
+
+
+async def _aretry(
+    send: Callable[[], Awaitable[Any]],
+    throttle: _Throttle,
+    retries: int,
+    can_retry: Callable[[], bool] | None = None,
+) -> Any:
+    """Shared async retry loop: breaker check, policy backoff, usage settlement.
+
+    The throttle's reservation is returned if the call fails for good or is
+    cancelled (a stage timeout, say), so it does not hold other callers back.
+    """
+    try:
+        response = await _aretry_calls(send, retries, can_retry)
+    except BaseException:
+        throttle.release()
+        raise
+    throttle.settle(response)
+    return response
+
+
+async def _aretry_calls(
+    send: Callable[[], Awaitable[Any]],
+    retries: int,
+    can_retry: Callable[[], bool] | None,
+) -> Any:
+    cfg = load_runtime_config()
+    policy = RetryPolicy.from_config(cfg, retries)
+    breaker = get_circuit_breaker(cfg)
+    attempt = 0
+    while True:
+        breaker.before_call()
         try:
-            return client.messages.create(**kwargs)
+            response = await send()
+        except asyncio.CancelledError:
+            breaker.abandon()
+            raise
         except Exception as exc:  # noqa: BLE001
-            last_exc = exc
-            if attempt >= retries:
+            breaker.record_failure(classify_error(exc))
+            if can_retry is not None and not can_retry():
                 raise
-            time.sleep(min(2**attempt, 4))
-    if last_exc:
-        raise last_exc
-    raise RuntimeError("create_with_retry failed unexpectedly")
+            delay = policy.next_delay(attempt, exc)
+            if delay is None:
+                raise
+            attempt += 1
+            await asyncio.sleep(delay)
+        else:
+            breaker.record_success()
+            return response
+
+
+async def acreate_with_retry(
+    client: Any,
+    *,
+    retries: int = 2,
+    priority: Priority = Priority.EXPERT,
+    stage: str = "default",
+    **kwargs: Any,
+) -> Any:
+    """Async counterpart of :func:`create_with_retry` that never blocks the event loop.
+
+    ``priority`` selects the limiter lane; lead/validator calls should pass
+    ``Priority.LEAD`` so they are not queued behind speculative or batch work.
+    ``stage`` keys the learned estimate correction and the usage reconciliation.
+    """
+    cache, cached = _cache_lookup(stage, kwargs)
+    if cached is not None:
+        return cached
+
+    throttle = _Throttle(stage, priority, kwargs)
+    await throttle.acquire()
+    response = await _aretry(lambda: _acall_create(client, kwargs), throttle, retries)
+    if cache is not None:
+        cache.put(kwargs, response)
+    return response
+
+
+async def astream_with_retry(
+    client: Any,
+    *,
+    on_text: Callable[[str], None],
+    retries: int = 2,
+    priority: Priority = Priority.EXPERT,
+    stage: str = "default",
+    **kwargs: Any,
+) -> Any:
+    """Stream a message, forwarding text deltas to ``on_text`` as they arrive.
+
+    Returns the final message, shaped like a ``messages.create`` response.
+    Failures are only retried before the first delta has been emitted, so
+    callers never see duplicated partial output. A response-cache hit is
+    forwarded as a single delta.
+    """
+    cache, cached = _cache_lookup(stage, kwargs)
+    if cached is not None:
+        on_text("".join(getattr(block, "text", "") for block in cached.content))
+        return cached
+
+    throttle = _Throttle(stage, priority, kwargs)
+    await throttle.acquire()
+    emitted = False
+
+    def _forward(text: str) -> None:
+        nonlocal emitted
+        emitted = True
+        on_text(text)
+
+    response = await _aretry(
+        lambda: _acall_stream(client, kwargs, _forward),
+        throttle,
+        retries,
+        can_retry=lambda: not emitted,
+    )
+    if cache is not None:
+        cache.put(kwargs, response)
+    return response
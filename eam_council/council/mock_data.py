@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from eam_council.council.data_provider import get_data_provider, render_data_context
+from eam_council.council.runtime_config import load_runtime_config
+
 MOCK_WORK_ORDERS = [
     {
         "order_id": "WO-001234",
@@ -79,18 +82,7 @@ MOCK_WORK_CENTERS = [
 
 
 def get_mock_context() -> str:
-    """Return mock SAP data as a formatted context string."""
-    lines = ["## Mock SAP EAM Data (for reference)\n"]
-    lines.append("### Work Orders")
-    for wo in MOCK_WORK_ORDERS:
-        lines.append(f"- {wo['order_id']} | Type: {wo['order_type']} | "
-                      f"Priority: {wo['priority']} | Equipment: {wo['equipment_id']}")
-    lines.append("\n### Equipment")
-    for eq in MOCK_EQUIPMENT:
-        lines.append(f"- {eq['equipment_id']} | {eq['description']} | "
-                      f"Criticality: {eq['criticality']}")
-    lines.append("\n### Work Centers")
-    for wc in MOCK_WORK_CENTERS:
-        lines.append(f"- {wc['work_center_id']} | {wc['description']} | "
-                      f"Capacity: {wc['capacity_hours_per_day']}h/day")
-    return "\n".join(lines)
+    """Return the configured EAM data (mock rows by default) as a formatted context string."""
+    cfg = load_runtime_config()
+    dataset = get_data_provider(cfg.data_source).load()
+    return render_data_context(dataset, cfg.data_token_budget)
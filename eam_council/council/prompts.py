@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import difflib
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from eam_council.council.token_counter import get_token_counter
+
+CACHE_CONTROL = {"type": "ephemeral"}
 
 SAP_EAM_SUBAGENT_SYSTEM = """\
 You are the SAP EAM Expert on the EAM Architecture Council.
@@ -164,15 +172,56 @@ Return exactly one of these formats:
 """
 
 
+def build_cached_system(system_prompt: str, skills_context: str) -> list[dict[str, Any]]:
+    """System blocks with the shared skills context as a cacheable prefix.
+
+    The context block comes first so every stage that sends the same filtered
+    context (experts, agentic, lead) reads one cache entry; the role prompt is
+    a second breakpoint reused by repeated calls of the same role.
+    """
+    return [
+        {
+            "type": "text",
+            "text": f"## Skills & Resources Context\n{skills_context}",
+            "cache_control": CACHE_CONTROL,
+        },
+        {"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL},
+    ]
+
+
+def build_subagent_request(
+    system_prompt: str,
+    question: str,
+    skills_context: str,
+    mock_context: str,
+    *,
+    cache: bool,
+) -> tuple[str | list[dict[str, Any]], str]:
+    """Return ``(system, user_prompt)`` for an expert call.
+
+    With ``cache`` the filtered skills context moves into the cached system
+    prefix and the user turn carries only the per-question parts.
+    """
+    if not cache:
+        return system_prompt, build_subagent_prompt(question, skills_context, mock_context)
+    filtered_context = filter_context_for_question(skills_context, question)
+    return (
+        build_cached_system(system_prompt, filtered_context),
+        build_subagent_prompt(question, skills_context, mock_context, include_context=False),
+    )
+
+
 def build_agentic_with_domain_prompt(
     question: str,
     skills_context: str,
     mock_context: str,
     sap_draft: str,
     general_draft: str,
+    *,
+    include_context: bool = True,
 ) -> str:
     """Build prompt for Agentic expert after EAM drafts are available."""
-    base = build_subagent_prompt(question, skills_context, mock_context)
+    base = build_subagent_prompt(question, skills_context, mock_context, include_context=include_context)
     return (
         f"{base}\n\n"
         f"## Upstream Domain Drafts\n"
@@ -182,6 +231,23 @@ def build_agentic_with_domain_prompt(
     )
 
 
+def build_agentic_speculative_prompt(
+    question: str,
+    skills_context: str,
+    mock_context: str,
+    *,
+    include_context: bool = True,
+) -> str:
+    """Build prompt for Agentic expert while the EAM drafts are still being written."""
+    base = build_subagent_prompt(question, skills_context, mock_context, include_context=include_context)
+    return (
+        f"{base}\n\n"
+        f"The SAP and General EAM drafts are being written in parallel and are not available to you. "
+        f"Keep to agent architecture and end with a `### Domain Assumptions` list naming every SAP API, "
+        f"transaction and EAM process your design relies on, so it can be checked against those drafts."
+    )
+
+
 def build_alignment_check_prompt(
     question: str,
     sap_draft: str,
@@ -203,6 +269,69 @@ def build_alignment_check_prompt(
     )
 
 
+DRAFT_LABELS = {"sap": "SAP", "general": "General", "agentic": "Agentic"}
+
+
+def build_conversation(turns: list[str], *, cache: bool) -> list[dict[str, Any]]:
+    """Alternating user/assistant messages, starting with the user.
+
+    With ``cache`` the first and the latest user turns are cache breakpoints,
+    so a follow-up round re-reads the original (large) turn and the previous
+    round from the prompt cache and pays full price only for its delta.
+    """
+    messages: list[dict[str, Any]] = []
+    last_user = len(turns) - 1 if len(turns) % 2 else len(turns) - 2
+    for i, text in enumerate(turns):
+        role = "user" if i % 2 == 0 else "assistant"
+        if cache and role == "user" and i in (0, last_user):
+            messages.append({"role": role, "content": [{"type": "text", "text": text, "cache_control": CACHE_CONTROL}]})
+        else:
+            messages.append({"role": role, "content": text})
+    return messages
+
+
+def candidate_diff(previous: str, current: str) -> str:
+    """Unified diff between two candidate outputs."""
+    lines = difflib.unified_diff(
+        previous.splitlines(), current.splitlines(), "previous", "revised", n=2, lineterm=""
+    )
+    return "\n".join(lines)
+
+
+def build_validation_delta_prompt(
+    target: str,
+    reason: str | None,
+    updated_draft: str,
+    previous_output: str,
+    revised_output: str,
+) -> str:
+    """Follow-up validator turn: only the clarified draft and the output diff."""
+    label = DRAFT_LABELS.get(target, target)
+    unchanged = ", ".join(f"{v} draft" for k, v in DRAFT_LABELS.items() if k != target)
+    return (
+        f"## Updated {label} Draft\n"
+        f"Replaces the {label} draft above, after a clarification for: {reason or 'misalignment'}\n\n"
+        f"{updated_draft}\n\n"
+        f"## Candidate Final Output Diff\n"
+        f"Changes to the candidate you assessed above:\n```diff\n{candidate_diff(previous_output, revised_output)}\n```\n\n"
+        f"The question and the other drafts ({unchanged}) are unchanged. "
+        f"Assess the revised candidate in the same format."
+    )
+
+
+def build_lead_revision_prompt(target: str, reason: str | None, updated_draft: str) -> str:
+    """Follow-up lead turn after a clarification: only the updated draft."""
+    label = DRAFT_LABELS.get(target, target)
+    return (
+        f"## Clarification from the {label} Expert\n"
+        f"The validator flagged: {reason or 'misalignment with the other experts'}\n"
+        f"Updated {label} draft (replaces the one above):\n\n{updated_draft}\n\n"
+        f"The question, the other drafts and the context are unchanged. Revise your output to "
+        f"reflect this clarification and return the complete final council output in the "
+        f"required format. Include ALL required sections."
+    )
+
+
 _DATA_KEYWORDS = re.compile(
     r"\b(migrat|abap|table[s]?\b|custom code|debug|data dictionary|"
     r"legacy|extract|etl|bw\b|hana view)",
@@ -227,43 +356,55 @@ def classify_question(question: str) -> str:
     return "api"
 
 
+_SECTION_START = re.compile(r"(?m)^(?==== SKILL: |--- Resource: )")
+
+
+def split_sections(skills_context: str) -> list[str]:
+    """Split a context string into its skill/resource sections (header line + body)."""
+    return [section for section in _SECTION_START.split(skills_context) if section]
+
+
+def _drop_yaml_block(section: str, key: str) -> str:
+    """Remove every ``key:`` mapping (the key line and everything indented under it)."""
+    kept: list[str] = []
+    block_indent: int | None = None
+    for line in section.split("\n"):
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        if block_indent is not None:
+            if not stripped or indent > block_indent:
+                continue
+            block_indent = None
+        if stripped.startswith(f"{key}:"):
+            block_indent = indent
+            continue
+        kept.append(line)
+    return "\n".join(kept)
+
+
+@lru_cache(maxsize=32)
 def _filter_skills_context(skills_context: str, classification: str) -> str:
-    """Filter the skills context based on question classification."""
+    """Filter the skills context based on question classification.
+
+    Memoized per (context, classification): the repository returns the same
+    context string for a given skills version and selection, so each variant
+    is computed once per process.
+    """
     if classification == "data":
         return skills_context
 
+    sections = split_sections(skills_context)
     if classification == "general":
-        lines = skills_context.split("\n")
-        filtered: list[str] = []
-        skip = False
-        for line in lines:
-            if "--- Resource:" in line and "canonical_entities" in line:
-                skip = True
-                continue
-            if skip and line.startswith("--- Resource:"):
-                skip = False
-            if skip and line.startswith("=== SKILL:"):
-                skip = False
-            if not skip:
-                filtered.append(line)
-        return "\n".join(filtered)
-
-    lines = skills_context.split("\n")
-    filtered = []
-    skip_internals = False
-    for line in lines:
-        if "sap_internals:" in line:
-            skip_internals = True
-            continue
-        if skip_internals:
-            stripped = line.lstrip()
-            indent = len(line) - len(stripped)
-            if stripped and indent <= 4 and not stripped.startswith("-"):
-                skip_internals = False
-            else:
-                continue
-        filtered.append(line)
-    return "\n".join(filtered)
+        return "".join(
+            section
+            for section in sections
+            if not (section.startswith("--- Resource:") and "canonical_entities" in section.split("\n", 1)[0])
+        )
+
+    return "".join(
+        _drop_yaml_block(section, "sap_internals") if "sap_internals:" in section else section
+        for section in sections
+    )
 
 
 def filter_context_for_question(skills_context: str, question: str) -> str:
@@ -271,22 +412,231 @@ def filter_context_for_question(skills_context: str, question: str) -> str:
     return _filter_skills_context(skills_context, classify_question(question))
 
 
-def build_subagent_prompt(question: str, skills_context: str, mock_context: str) -> str:
-    """Build the user prompt for a subagent."""
-    filtered_context = filter_context_for_question(skills_context, question)
+def build_subagent_prompt(
+    question: str,
+    skills_context: str,
+    mock_context: str,
+    *,
+    include_context: bool = True,
+) -> str:
+    """Build the user prompt for a subagent.
+
+    ``include_context=False`` omits the skills block when it is sent as the
+    cached system prefix instead (see :func:`build_cached_system`).
+    """
+    context_block = ""
+    if include_context:
+        filtered_context = filter_context_for_question(skills_context, question)
+        context_block = f"## Skills & Resources Context\n{filtered_context}\n\n"
     return (
         f"## Question\n{question}\n\n"
-        f"## Skills & Resources Context\n{filtered_context}\n\n"
+        f"{context_block}"
         f"## Available Data\n{mock_context}\n\n"
         f"Provide your expert draft response now."
     )
 
 
-def compact_draft(text: str, max_chars: int = 1800) -> str:
-    """Light compaction utility for lead prompts."""
-    if len(text) <= max_chars:
+DRAFT_TOKEN_BUDGET = 450
+TRUNCATION_MARKER = "[...truncated for cost control...]"
+
+API_IDENTIFIER = re.compile(r"\b[A-Z][A-Z0-9]*(?:_[A-Z0-9]+)+\b")
+_KEY_LINE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s")
+_SENTENCE = re.compile(r".+?(?:[.!?](?=\s|$)|$)")
+
+
+def split_sentences(line: str) -> list[str]:
+    """Sentences of one line, split after terminal punctuation."""
+    return [m.group(0).strip() for m in _SENTENCE.finditer(line) if m.group(0).strip()]
+
+
+# Sections whose every bullet keeps its lead sentence.
+_LISTED_SECTION = re.compile(r"risk|assumption|constraint|open question", re.IGNORECASE)
+
+
+@dataclass
+class _DraftLine:
+    full: str
+    indent: str = ""
+    sentences: list[str] = field(default_factory=list)
+    lead: bool = False  # the first sentence is protected
+    listed: bool = False  # a bullet of a risks or assumptions section
+    rank: int = 0  # upgrade order: 1 bullets and paragraph leads, 2 the rest
+    keep: set[int] = field(default_factory=set)  # sentences in the core
+    clipped: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def core(self) -> str:
+        if not self.sentences:
+            return self.full
+        kept = [self.clipped.get(i, sentence) for i, sentence in enumerate(self.sentences) if i in self.keep]
+        return self.indent + " ".join(kept) if kept else ""
+
+
+def _parse_draft(text: str) -> list[list[_DraftLine]]:
+    """Split a draft into heading-led sections of classified lines.
+
+    The first sentence of each section is a protected lead, and so is the
+    first sentence of every bullet in a risks or assumptions section.
+    """
+    sections: list[list[_DraftLine]] = [[]]
+    previous_blank = True
+    has_lead = False
+    listed = False
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            if sections[-1]:
+                sections.append([])
+            sections[-1].append(_DraftLine(line))
+            has_lead = False
+            listed = bool(_LISTED_SECTION.search(stripped))
+        elif not stripped:
+            sections[-1].append(_DraftLine(line))
+        else:
+            bullet = bool(_KEY_LINE.match(line))
+            sections[-1].append(
+                _DraftLine(
+                    line,
+                    indent=line[: len(line) - len(line.lstrip())],
+                    sentences=split_sentences(line),
+                    lead=not has_lead or (listed and bullet),
+                    listed=listed and bullet,
+                    rank=1 if previous_blank or bullet else 2,
+                )
+            )
+            has_lead = True
+        previous_blank = not stripped
+    return sections
+
+
+def _clip(line: str, budget: int, tokens: int) -> str:
+    """Cut ``line`` to about ``budget`` of its ``tokens``, at a word boundary."""
+    cut = line[: len(line) * budget // max(tokens, 1)]
+    space = cut.rfind(" ")
+    if len(cut) < len(line) and not line[len(cut)].isspace():
+        cut = cut[:space] if space > 0 else ""
+    # Never cut mid-word, and keep at least the first word.
+    first_word = re.match(r"\W*\w+\S*", line)
+    if first_word and len(cut.rstrip()) < first_word.end():
+        cut = first_word.group(0)
+    return cut.rstrip(" ,;:-") + "..."
+
+
+def _through_identifiers(sentence: str) -> str:
+    """``sentence`` cut just after its last API identifier."""
+    end = list(API_IDENTIFIER.finditer(sentence))[-1].end()
+    return sentence if len(sentence.rstrip(".!?")) <= end else sentence[:end] + "..."
+
+
+def _identifiers_only(sentence: str) -> str:
+    """The API identifiers of ``sentence``, after its bullet marker if any."""
+    bullet = _KEY_LINE.match(sentence)
+    return (bullet.group(0) if bullet else "") + ", ".join(dict.fromkeys(API_IDENTIFIER.findall(sentence)))
+
+
+def compact_draft(text: str, max_tokens: int = DRAFT_TOKEN_BUDGET) -> str:
+    """Shrink a draft to about ``max_tokens`` while keeping every section.
+
+    The core is built within the budget in priority order: headings, then
+    every sentence naming an API identifier (``API_MAINTORDER_SRV``), then
+    the lead sentence of each section and of every risk or assumption bullet.
+    Identifier sentences are never dropped: when they do not all fit they are
+    cut after their last identifier, and at worst reduced to the identifiers.
+    Leads that do not all fit are clipped at a word boundary to an equal share
+    of what is left, section leads before risk or assumption bullets, and
+    dropped in that order (last first) if even that overshoots.
+    The remaining budget is shared between sections in proportion to what
+    they would add, and each section restores bullets and paragraph leads
+    before other lines. A draft that fits, or would not shrink, is returned
+    unchanged. Deterministic: the same draft and budget give the same result.
+    """
+    counter = get_token_counter()
+    original_tokens = counter.count(text)
+    if original_tokens <= max_tokens:
         return text
-    return text[:max_chars] + "\n\n[...truncated for cost control...]"
+
+    sections = _parse_draft(text)
+    lines = [line for section in sections for line in section]
+    # Line breaks and the marker count too.
+    budget = max_tokens - counter.count(TRUNCATION_MARKER) - 2
+    used = sum(counter.count(line.full) + 1 for line in lines if not line.sentences)
+
+    named = [(line, i) for line in lines for i, sentence in enumerate(line.sentences) if API_IDENTIFIER.search(sentence)]
+    for shorten in (None, _through_identifiers, _identifiers_only):
+        forms = [line.sentences[i] if shorten is None else shorten(line.sentences[i]) for line, i in named]
+        named_cost = sum(counter.count(form) + 1 for form in forms)
+        if used + named_cost <= budget:
+            break
+    for (line, i), form in zip(named, forms):
+        line.keep.add(i)
+        if form != line.sentences[i]:
+            line.clipped[i] = form
+    used += named_cost
+
+    leads = [line for line in lines if line.lead and 0 not in line.keep]
+    # Leads are kept whole when they fit in what is left. Otherwise section
+    # leads are clipped to an equal share of what the risk and assumption
+    # bullets leave, or, when that is too little, every lead is.
+    lead_tokens = {id(line): counter.count(line.sentences[0]) for line in leads}
+    limit = {id(line): lead_tokens[id(line)] for line in leads}
+    if used + sum(lead_tokens.values()) + len(leads) > budget:
+        prose = [line for line in leads if not line.listed]
+        listed_cost = sum(lead_tokens[id(line)] + 1 for line in leads if line.listed)
+        share = (budget - used - listed_cost) // max(len(prose), 1) - 1
+        to_clip = prose if share >= 3 else leads
+        if to_clip is leads:
+            share = max((budget - used) // max(len(leads), 1) - 1, 1)
+        limit.update((id(line), share) for line in to_clip)
+    for line in leads:
+        line.keep.add(0)
+        if lead_tokens[id(line)] > limit[id(line)]:
+            line.clipped[0] = _clip(line.sentences[0], limit[id(line)], lead_tokens[id(line)])
+        used += counter.count(line.clipped.get(0, line.sentences[0])) + 1
+    for line in sorted(reversed(leads), key=lambda line: line.listed):
+        if used <= budget:
+            break
+        used -= counter.count(line.clipped.pop(0, line.sentences[0])) + 1
+        line.keep.discard(0)
+    # Spend what the leads left on restoring shortened identifier sentences.
+    for line, i in named:
+        for form in (line.sentences[i], _through_identifiers(line.sentences[i])):
+            if i not in line.clipped or form == line.clipped[i]:
+                break
+            grow = counter.count(form) - counter.count(line.clipped[i])
+            if used + grow <= budget:
+                if form == line.sentences[i]:
+                    del line.clipped[i]
+                else:
+                    line.clipped[i] = form
+                used += grow
+                break
+
+    extra = [sum(counter.count(line.full) - counter.count(line.core) for line in section) for section in sections]
+    spare = max(budget - used, 0)
+    total_extra = sum(extra) or 1
+
+    kept: list[str] = []
+    for section, section_extra in zip(sections, extra):
+        share = spare * section_extra // total_extra
+        chosen = [line.core for line in section]
+        for wanted in (1, 2):
+            for i, line in enumerate(section):
+                if line.rank != wanted or chosen[i] == line.full or share <= 0:
+                    continue
+                cost = counter.count(line.full) - counter.count(chosen[i])
+                if cost <= share:
+                    chosen[i] = line.full
+                    share -= cost
+                elif not chosen[i] and share >= 8:
+                    chosen[i] = _clip(line.full, share, cost)
+                    share = 0
+        kept.extend(c for c, line in zip(chosen, section) if c or not line.full.strip())
+
+    compacted = re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+    if compacted == re.sub(r"\n{3,}", "\n\n", text).strip():
+        return text
+    result = f"{compacted}\n\n{TRUNCATION_MARKER}"
+    return result if counter.count(result) < original_tokens else text
 
 
 def build_lead_prompt(
@@ -309,12 +659,15 @@ def build_lead_prompt(
     if agentic_draft:
         agentic_block = f"## Agentic Architecture Expert Draft\n{agentic_draft}\n\n"
 
+    # An empty context means it travels in the cached system prefix instead.
+    context_block = f"## Skills & Resources Context\n{skills_context}\n\n" if skills_context else ""
+
     return (
         f"## Original Question\n{question}\n\n"
         f"## SAP EAM Expert Draft\n{sap_draft}\n\n"
         f"## General EAM Expert Draft\n{general_draft}\n\n"
         f"{agentic_block}"
-        f"## Skills & Resources Context\n{skills_context}\n\n"
+        f"{context_block}"
         f"Reconcile the expert drafts and produce the final council output "
         f"in the required format. Include ALL required sections."
     )
@@ -0,0 +1,403 @@
+"""Token-bucket TPM limiter with asyncio-native waiting and priority lanes.
+
+The bucket holds up to ``tokens_per_minute`` tokens and refills continuously at
+``tokens_per_minute / 60`` tokens per second, which mirrors how the Anthropic API
+meters its own limits. Accounting is O(1): a single float plus a timestamp.
+
+Async callers queue in per-priority FIFO lanes and only the waiting coroutine
+is suspended; the event loop keeps serving other stages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import Callable
+
+CALIBRATION_PATH = Path("out") / "token_calibration.json"
+DEFAULT_SHARED_BUCKET_PATH = Path("out") / "tpm_bucket.sqlite3"
+
+
+class Priority(IntEnum):
+    """Scheduling lanes; lower values are served first."""
+
+    LEAD = 0  # lead reconciliation, escalation and validator calls
+    EXPERT = 1  # first-pass and clarification expert drafts
+    BACKGROUND = 2  # speculative or batch work
+
+
+@dataclass
+class Reservation:
+    """Tokens booked against the bucket for one request."""
+
+    tokens: int
+    priority: Priority
+
+
+class TokenBucket:
+    """Thread-safe token bucket sized to a tokens-per-minute budget."""
+
+    def __init__(self, tokens_per_minute: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = max(1, tokens_per_minute)
+        self.rate_per_second = self.capacity / 60.0
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.capacity), self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def try_take(self, tokens: int) -> float:
+        """Take ``tokens`` if available and return 0, else return seconds to wait."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return max(0.001, (tokens - self._tokens) / self.rate_per_second)
+
+    def refund(self, tokens: int) -> None:
+        """Return unused tokens to the bucket."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(float(self.capacity), self._tokens + tokens)
+
+    def debit(self, tokens: int) -> None:
+        """Charge tokens that were used beyond a reservation; may go negative."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+
+class SqliteTokenBucket:
+    """Token bucket persisted in SQLite so every local process shares one budget.
+
+    Each operation is a single short ``BEGIN IMMEDIATE`` transaction on one row,
+    so concurrent CLI and eval processes serialize for microseconds, not for the
+    duration of their API calls. Wall-clock time is used because monotonic
+    clocks are not comparable across processes.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int,
+        path: Path,
+        name: str = "anthropic",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.capacity = max(1, tokens_per_minute)
+        self.rate_per_second = self.capacity / 60.0
+        self.path = path
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS token_bucket ("
+            "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def _update(self, change: Callable[[float], tuple[float, float]]) -> float:
+        """Run ``change(tokens) -> (new_tokens, result)`` atomically on the refilled row."""
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                now = self._clock()
+                row = cur.execute(
+                    "SELECT tokens, updated FROM token_bucket WHERE name = ?", (self.name,)
+                ).fetchone()
+                if row is None:
+                    tokens = float(self.capacity)
+                else:
+                    elapsed = max(0.0, now - row[1])
+                    tokens = min(float(self.capacity), row[0] + elapsed * self.rate_per_second)
+                tokens, result = change(tokens)
+                cur.execute(
+                    "INSERT INTO token_bucket (name, tokens, updated) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                    (self.name, tokens, now),
+                )
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            return result
+
+    def try_take(self, tokens: int) -> float:
+        def _take(current: float) -> tuple[float, float]:
+            if current >= tokens:
+                return current - tokens, 0.0
+            return current, max(0.001, (tokens - current) / self.rate_per_second)
+
+        return self._update(_take)
+
+    def refund(self, tokens: int) -> None:
+        self._update(lambda current: (min(float(self.capacity), current + tokens), 0.0))
+
+    def debit(self, tokens: int) -> None:
+        self._update(lambda current: (current - tokens, 0.0))
+
+    def available(self) -> float:
+        return self._update(lambda current: (current, current))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class _Waiter:
+    tokens: int
+    future: asyncio.Future
+
+
+class RateLimiter:
+    """Priority-aware front end over a :class:`TokenBucket` or :class:`SqliteTokenBucket`.
+
+    Priority lanes are per process; the bucket they draw from may be shared.
+    """
+
+    def __init__(self, bucket: TokenBucket | SqliteTokenBucket) -> None:
+        self.bucket = bucket
+        self._lanes: dict[Priority, deque[_Waiter]] = {p: deque() for p in Priority}
+        self._timer: asyncio.TimerHandle | None = None
+
+    def _clamp(self, tokens: int) -> int:
+        # Avoid deadlocking when one request is larger than the budget.
+        return max(1, min(tokens, self.bucket.capacity))
+
+    def _head(self) -> tuple[deque[_Waiter], _Waiter] | None:
+        for priority in Priority:
+            lane = self._lanes[priority]
+            while lane and lane[0].future.done():
+                lane.popleft()
+            if lane:
+                return lane, lane[0]
+        return None
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while True:
+            head = self._head()
+            if head is None:
+                return
+            lane, waiter = head
+            wait = self.bucket.try_take(waiter.tokens)
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+            lane.popleft()
+            waiter.future.set_result(None)
+
+    async def acquire(self, tokens: int, priority: Priority = Priority.EXPERT) -> Reservation:
+        """Suspend the calling coroutine until ``tokens`` can be booked."""
+        tokens = self._clamp(tokens)
+        reservation = Reservation(tokens=tokens, priority=priority)
+        if self._head() is None and self.bucket.try_take(tokens) == 0:
+            return reservation
+
+        waiter = _Waiter(tokens=tokens, future=asyncio.get_running_loop().create_future())
+        self._lanes[priority].append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.bucket.refund(tokens)
+            else:
+                try:
+                    self._lanes[priority].remove(waiter)
+                except ValueError:
+                    pass
+            self._dispatch()
+            raise
+        return reservation
+
+    def settle(self, reservation: Reservation, actual_tokens: int) -> None:
+        """Correct a reservation once the real usage is known.
+
+        Over-reserved tokens go back to the bucket immediately (and may wake
+        queued waiters); under-reserved tokens are charged so later calls pay.
+        """
+        delta = reservation.tokens - actual_tokens
+        if delta > 0:
+            self.bucket.refund(delta)
+        elif delta < 0:
+            self.bucket.debit(-delta)
+        reservation.tokens = actual_tokens
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._dispatch()
+
+    def acquire_blocking(self, tokens: int, priority: Priority = Priority.EXPERT) -> Reservation:
+        """Thread-blocking variant for synchronous callers."""
+        tokens = self._clamp(tokens)
+        while True:
+            wait = self.bucket.try_take(tokens)
+            if wait == 0:
+                return Reservation(tokens=tokens, priority=priority)
+            time.sleep(wait)
+
+
+class EstimateCalibrator:
+    """Per-stage correction factors learned from actual ``response.usage``.
+
+    ``input_factor`` scales the prompt-size heuristic; ``output_factor`` is the
+    share of ``max_tokens`` a stage really generates. Both are EWMAs so a few
+    outliers do not swing reservations, and both are clamped to a sane range.
+    Input observations whose ratio to the estimate is implausible (a fake or
+    replayed client, say) are ignored altogether.
+    """
+
+    INPUT_FACTOR_RANGE = (0.5, 2.0)
+    OUTPUT_FACTOR_RANGE = (0.25, 1.0)
+    PLAUSIBLE_INPUT_RATIO = (0.2, 5.0)
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        self.alpha = alpha
+        self._input: dict[str, float] = {}
+        self._output: dict[str, float] = {}
+        self._observed = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _clamp(value: float, bounds: tuple[float, float]) -> float:
+        return min(max(value, bounds[0]), bounds[1])
+
+    @property
+    def observed(self) -> bool:
+        """Whether a plausible observation was learned since this calibrator was created."""
+        with self._lock:
+            return self._observed
+
+    def factors(self, stage: str) -> tuple[float, float]:
+        with self._lock:
+            return self._input.get(stage, 1.0), self._output.get(stage, 1.0)
+
+    def reserve(self, stage: str, prompt_tokens: int, max_tokens: int) -> int:
+        """Return the calibrated number of tokens to book for a request."""
+        input_factor, output_factor = self.factors(stage)
+        return max(1, round(prompt_tokens * input_factor + max_tokens * output_factor))
+
+    def observe(
+        self,
+        stage: str,
+        *,
+        estimated_prompt_tokens: int,
+        max_tokens: int,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> None:
+        if estimated_prompt_tokens <= 0:
+            return
+        ratio = input_tokens / estimated_prompt_tokens
+        low, high = self.PLAUSIBLE_INPUT_RATIO
+        if not low <= ratio <= high:
+            return
+        with self._lock:
+            prev = self._input.get(stage, 1.0)
+            self._input[stage] = self._clamp(prev + self.alpha * (ratio - prev), self.INPUT_FACTOR_RANGE)
+            if max_tokens > 0:
+                ratio = min(1.0, output_tokens / max_tokens)
+                prev = self._output.get(stage, 1.0)
+                self._output[stage] = self._clamp(prev + self.alpha * (ratio - prev), self.OUTPUT_FACTOR_RANGE)
+            self._observed = True
+
+    def save(self, path: Path) -> None:
+        """Persist learned factors so the next process starts calibrated."""
+        with self._lock:
+            payload = {"input": dict(self._input), "output": dict(self._output)}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    def load(self, path: Path) -> None:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            loaded_input = {k: float(v) for k, v in payload.get("input", {}).items()}
+            loaded_output = {k: float(v) for k, v in payload.get("output", {}).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self._input.update({k: self._clamp(v, self.INPUT_FACTOR_RANGE) for k, v in loaded_input.items()})
+            self._output.update({k: self._clamp(v, self.OUTPUT_FACTOR_RANGE) for k, v in loaded_output.items()})
+
+
+_limiter_lock = threading.Lock()
+_calibrator: EstimateCalibrator | None = None
+
+
+def get_calibrator() -> EstimateCalibrator:
+    """Return the process-wide calibrator, seeded from recorded usage on disk."""
+    global _calibrator
+    with _limiter_lock:
+        if _calibrator is None:
+            _calibrator = EstimateCalibrator()
+            _calibrator.load(CALIBRATION_PATH)
+        return _calibrator
+
+
+_limiter: RateLimiter | None = None
+_limiter_key: tuple | None = None
+
+
+def _build_bucket(tokens_per_minute: int, backend: str, path: Path | None) -> TokenBucket | SqliteTokenBucket:
+    if backend == "sqlite":
+        return SqliteTokenBucket(tokens_per_minute, path or DEFAULT_SHARED_BUCKET_PATH)
+    return TokenBucket(tokens_per_minute)
+
+
+def get_rate_limiter(
+    tokens_per_minute: int,
+    backend: str = "memory",
+    path: Path | None = None,
+) -> RateLimiter | None:
+    """Return the process-wide limiter, rebuilding it if the budget or backend changed.
+
+    ``backend="sqlite"`` draws from a bucket file shared by all local processes.
+    A budget of zero or less means no throttling, and no limiter is returned.
+    """
+    global _limiter, _limiter_key
+    if tokens_per_minute <= 0:
+        return None
+    key = (tokens_per_minute, backend, path)
+    with _limiter_lock:
+        if _limiter is None or _limiter_key != key:
+            _reset_locked()
+            _limiter = RateLimiter(_build_bucket(tokens_per_minute, backend, path))
+            _limiter_key = key
+        return _limiter
+
+
+def _reset_locked() -> None:
+    global _limiter, _limiter_key
+    if _limiter is not None and isinstance(_limiter.bucket, SqliteTokenBucket):
+        _limiter.bucket.close()
+    _limiter = None
+    _limiter_key = None
+
+
+def reset_rate_limiter() -> None:
+    with _limiter_lock:
+        _reset_locked()
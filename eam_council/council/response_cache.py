@@ -0,0 +1,151 @@
+"""Opt-in content-addressed cache of Anthropic responses.
+
+Re-running a question with the same model, prompts and skills re-pays every
+stage; with ``EAM_RESPONSE_CACHE`` on, :mod:`eam_council.council.llm` answers
+identical requests from ``<dir>/<hash>.json.z`` instead. Entries are zlib
+compressed JSON, expire after a TTL, and the directory is trimmed to a size cap
+by evicting the least recently used entries (recency is the file mtime, touched
+on every hit). The cache keeps a running total of the bytes it stores and scans
+the directory only on the first write and when that total passes the cap; the
+scan also picks up entries written by other processes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable
+
+from eam_council.council.cassette import deserialize_response, request_key, serialize_response
+from eam_council.council.runtime_config import RuntimeConfig
+
+# Only the fields that determine the model's answer; retry/priority/stage are not sent.
+KEY_FIELDS = ("model", "system", "messages", "tools", "max_tokens")
+SUFFIX = ".json.z"
+
+
+def cache_key(kwargs: dict[str, Any]) -> str:
+    return request_key({name: kwargs[name] for name in KEY_FIELDS if name in kwargs})
+
+
+class ResponseCache:
+    """On-disk response store with a TTL, an LRU size cap and per-stage bypass."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int,
+        ttl_seconds: float,
+        bypass: frozenset[str] = frozenset(),
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.bypass = bypass
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._total: int | None = None  # bytes on disk as of the last scan, plus our writes
+        self.scans = 0
+
+    def enabled_for(self, stage: str) -> bool:
+        return stage.lower() not in self.bypass
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, kwargs: dict[str, Any]) -> Any | None:
+        """Return the cached response for ``kwargs``, or None on a miss or expiry."""
+        path = self._path(cache_key(kwargs))
+        with self._lock:
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                return None
+            try:
+                entry = json.loads(zlib.decompress(data))
+            except (zlib.error, ValueError):
+                self._remove(path, len(data))
+                return None
+            now = self._clock()
+            if self.ttl_seconds > 0 and now - entry["created"] > self.ttl_seconds:
+                self._remove(path, len(data))
+                return None
+            os.utime(path, (now, now))
+        return deserialize_response(entry["response"])
+
+    def put(self, kwargs: dict[str, Any], response: Any) -> None:
+        entry = {"created": self._clock(), "response": serialize_response(response)}
+        data = zlib.compress(json.dumps(entry, separators=(",", ":"), default=str).encode("utf-8"))
+        path = self._path(cache_key(kwargs))
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+            now = self._clock()
+            os.utime(path, (now, now))
+            if self._total is not None:
+                self._total += len(data) - replaced
+            self._evict()
+
+    def _remove(self, path: Path, size: int) -> None:
+        path.unlink(missing_ok=True)
+        if self._total is not None:
+            self._total -= size
+
+    def _evict(self) -> None:
+        if self.max_bytes <= 0 or (self._total is not None and self._total <= self.max_bytes):
+            return
+        self.scans += 1
+        entries = []
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total = total
+
+
+_cache_lock = threading.Lock()
+_cache: ResponseCache | None = None
+_cache_key: tuple | None = None
+
+
+def get_response_cache(cfg: RuntimeConfig) -> ResponseCache | None:
+    """Return the configured response cache, or None when it is off."""
+    global _cache, _cache_key
+    if not cfg.response_cache:
+        return None
+    key = (
+        cfg.response_cache_dir,
+        cfg.response_cache_max_mb,
+        cfg.response_cache_ttl_seconds,
+        cfg.response_cache_bypass,
+    )
+    with _cache_lock:
+        if _cache is None or _cache_key != key:
+            _cache = ResponseCache(
+                Path(cfg.response_cache_dir),
+                max_bytes=int(cfg.response_cache_max_mb * 1024 * 1024),
+                ttl_seconds=cfg.response_cache_ttl_seconds,
+                bypass=cfg.response_cache_bypass,
+            )
+            _cache_key = key
+        return _cache
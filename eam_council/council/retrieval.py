@@ -0,0 +1,196 @@
+"""BM25 chunk retrieval over skill files under a token budget.
+
+Whole-file routing either sends a resource in full or not at all. With
+``EAM_RETRIEVAL`` on, every SKILL.md and resource (including skills the
+router never selects, such as ``eam_reliability_expert``) is split into
+heading-delimited chunks: markdown ``#`` headings, and top-level keys in YAML.
+The chunks are ranked against the question with BM25, and the best-scoring ones
+that fit the stage's token budget are rendered back in file order under the
+usual ``=== SKILL:`` / ``--- Resource:`` headers.
+
+The index is built once per skills version and persisted to
+``out/skills_index.json``. It is rebuilt when the skills content hash changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from eam_council.council.draft_index import content_words
+from eam_council.council.skills_loader import get_skills_repository, resource_header, skill_header
+from eam_council.council.token_counter import get_token_counter
+
+DEFAULT_INDEX_PATH = Path("out") / "skills_index.json"
+INDEX_VERSION = 1
+MAX_CHUNK_CHARS = 1600
+
+# Always sent: the council's own output contract and reconciliation rules.
+PINNED_FILES = frozenset(
+    {
+        ("eam_council", "SKILL.md"),
+        ("eam_council", "output_format.md"),
+        ("eam_council", "reconciliation_rules.md"),
+    }
+)
+
+_MD_SPLIT = re.compile(r"(?m)^(?=#{1,4} )")
+_YAML_SPLIT = re.compile(r"(?m)^(?= {0,2}[A-Za-z_][\w-]*:\s*$)")
+_K1 = 1.5
+_B = 0.75
+
+
+@dataclass
+class Chunk:
+    skill: str
+    file: str
+    order: int
+    heading: str
+    text: str
+    tokens: int
+
+
+def _split_long(text: str) -> list[str]:
+    if len(text) <= MAX_CHUNK_CHARS:
+        return [text]
+    pieces: list[str] = []
+    current = ""
+    for line in text.splitlines(keepends=True):
+        if current and len(current) + len(line) > MAX_CHUNK_CHARS:
+            pieces.append(current)
+            current = ""
+        current += line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_file(file_name: str, text: str) -> list[tuple[str, str]]:
+    """Split a skill file into ``(heading, text)`` chunks."""
+    splitter = _YAML_SPLIT if file_name.endswith((".yaml", ".yml")) else _MD_SPLIT
+    chunks: list[tuple[str, str]] = []
+    for part in splitter.split(text):
+        if not part.strip():
+            continue
+        heading = part.strip().split("\n", 1)[0].strip("#: ").strip()
+        chunks.extend((heading, piece) for piece in _split_long(part) if piece.strip())
+    return chunks
+
+
+def _terms(text: str) -> list[str]:
+    words = content_words(text)
+    # Identifiers such as API_MAINTORDER_SRV also match their parts.
+    return words + [part for w in words if "_" in w for part in w.split("_") if len(part) > 2]
+
+
+class SkillsRetriever:
+    """BM25 index over skill chunks."""
+
+    def __init__(self, chunks: list[Chunk], fingerprint: str) -> None:
+        self.chunks = chunks
+        self.fingerprint = fingerprint
+        self._tf = [Counter(_terms(f"{c.heading}\n{c.text}")) for c in chunks]
+        self._lengths = [sum(tf.values()) for tf in self._tf]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        df: Counter[str] = Counter()
+        for tf in self._tf:
+            df.update(tf.keys())
+        n = len(chunks)
+        self._idf = {term: math.log(1 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()}
+
+    @classmethod
+    def build(cls) -> SkillsRetriever:
+        repository = get_skills_repository()
+        chunks: list[Chunk] = []
+        counter = get_token_counter()
+        for skill in repository.layout():
+            for path in (skill.skill_md, *skill.resources):
+                for heading, text in chunk_file(path.name, repository.read(path)):
+                    chunks.append(Chunk(skill.name, path.name, len(chunks), heading, text, counter.count(text)))
+        return cls(chunks, skills_fingerprint())
+
+    def scores(self, question: str) -> list[float]:
+        query = set(_terms(question))
+        result = []
+        for tf, length in zip(self._tf, self._lengths):
+            score = 0.0
+            for term in query:
+                freq = tf.get(term)
+                if freq:
+                    norm = _K1 * (1 - _B + _B * length / (self._avg_length or 1))
+                    score += self._idf[term] * freq * (_K1 + 1) / (freq + norm)
+            result.append(score)
+        return result
+
+    def select(self, question: str, budget_tokens: int) -> list[Chunk]:
+        """Pinned chunks, then the best-ranked chunks that still fit ``budget_tokens``."""
+        selected = [c for c in self.chunks if (c.skill, c.file) in PINNED_FILES]
+        remaining = budget_tokens - sum(c.tokens for c in selected)
+        ranked = sorted(zip(self.scores(question), self.chunks), key=lambda pair: -pair[0])
+        for score, chunk in ranked:
+            if score <= 0:
+                break
+            if (chunk.skill, chunk.file) in PINNED_FILES or chunk.tokens > remaining:
+                continue
+            selected.append(chunk)
+            remaining -= chunk.tokens
+        return sorted(selected, key=lambda c: c.order)
+
+    def context_for(self, question: str, budget_tokens: int) -> str:
+        """Render the selected chunks as a skills context string."""
+        sections: list[str] = []
+        current: tuple[str, str] | None = None
+        for chunk in self.select(question, budget_tokens):
+            if (chunk.skill, chunk.file) != current:
+                current = (chunk.skill, chunk.file)
+                header = skill_header(chunk.skill) if chunk.file == "SKILL.md" else resource_header(chunk.skill, chunk.file)
+                sections.append(header)
+            sections.append(chunk.text.strip("\n"))
+        return "\n\n".join(sections)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": INDEX_VERSION, "fingerprint": self.fingerprint, "chunks": [asdict(c) for c in self.chunks]}
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> SkillsRetriever | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return cls([Chunk(**c) for c in data["chunks"]], data["fingerprint"])
+
+
+def skills_fingerprint() -> str:
+    context = get_skills_repository().assemble()
+    return hashlib.blake2b(context.encode("utf-8"), digest_size=16).hexdigest()
+
+
+_retriever_lock = threading.Lock()
+_retriever: SkillsRetriever | None = None
+
+
+def get_retriever(path: Path = DEFAULT_INDEX_PATH) -> SkillsRetriever:
+    """Return the index for the current skills, loading or rebuilding the persisted copy."""
+    global _retriever
+    with _retriever_lock:
+        fingerprint = skills_fingerprint()
+        if _retriever is not None and _retriever.fingerprint == fingerprint:
+            return _retriever
+        retriever = SkillsRetriever.load(path)
+        if retriever is None or retriever.fingerprint != fingerprint:
+            retriever = SkillsRetriever.build()
+            retriever.save(path)
+        _retriever = retriever
+        return retriever
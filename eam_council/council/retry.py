@@ -0,0 +1,226 @@
+"""Retry policy for Anthropic calls: error classes, jittered backoff, budget, breaker."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Callable, Iterator
+
+import anthropic
+
+from eam_council.council.runtime_config import RuntimeConfig
+
+# 429 = rate limited, 529 = API overloaded.
+OVERLOAD_STATUS = frozenset({429, 529})
+RETRYABLE_STATUS = frozenset({408, 409, 500, 502, 503, 504})
+
+
+class ErrorClass(Enum):
+    RETRYABLE = "retryable"
+    OVERLOADED = "overloaded"
+    FATAL = "fatal"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the API while the backend is known to be overloaded."""
+
+
+def classify_error(exc: BaseException) -> ErrorClass:
+    """Split failures into overload, transient and fatal (never-retry) classes."""
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        if status in OVERLOAD_STATUS:
+            return ErrorClass.OVERLOADED
+        if status in RETRYABLE_STATUS or status >= 500:
+            return ErrorClass.RETRYABLE
+        return ErrorClass.FATAL
+    if isinstance(exc, (anthropic.APIConnectionError, ConnectionError, TimeoutError)):
+        return ErrorClass.RETRYABLE
+    return ErrorClass.FATAL
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Read the server's ``retry-after-ms`` / ``retry-after`` hint, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    raw_ms = headers.get("retry-after-ms")
+    if raw_ms is not None:
+        try:
+            return max(0.0, float(raw_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    raw = headers.get("retry-after")
+    if raw is None:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryBudget:
+    """Caps the total number of retries spent across all calls in one council run."""
+
+    limit: int
+    used: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+
+_current_budget: contextvars.ContextVar[RetryBudget | None] = contextvars.ContextVar(
+    "eam_retry_budget", default=None
+)
+
+
+@contextlib.contextmanager
+def retry_budget_scope(budget: RetryBudget) -> Iterator[RetryBudget]:
+    """Bind ``budget`` to every call made in this context (including gathered tasks)."""
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+class CircuitBreaker:
+    """Opens after consecutive overload errors and fails fast until a cooldown passes.
+
+    After the cooldown one trial call is let through (half-open); success closes
+    the breaker, another overload re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.cooldown_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            state = self._state()
+            if state == "open" or (state == "half_open" and self._trial_in_flight):
+                raise CircuitOpenError(
+                    "Anthropic API circuit open after repeated overload errors; failing fast"
+                )
+            if state == "half_open":
+                self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def abandon(self) -> None:
+        """Release a half-open trial slot when the call was cancelled, not answered."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self, error_class: ErrorClass) -> None:
+        with self._lock:
+            self._trial_in_flight = False
+            if error_class is not ErrorClass.OVERLOADED:
+                return
+            self._failures += 1
+            if self.failure_threshold > 0 and self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Full-jitter exponential backoff that honors server retry-after hints."""
+
+    max_retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    max_retry_after: float = 60.0
+
+    @classmethod
+    def from_config(cls, cfg: RuntimeConfig, retries: int) -> RetryPolicy:
+        return cls(
+            max_retries=retries,
+            base_delay=cfg.retry_base_delay,
+            max_delay=cfg.retry_max_delay,
+        )
+
+    def backoff(self, attempt: int, exc: BaseException, rng: random.Random | None = None) -> float:
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        delay = (rng or random).uniform(0.0, ceiling)
+        hint = retry_after_seconds(exc)
+        if hint is not None:
+            delay = max(delay, min(hint, self.max_retry_after))
+        return delay
+
+    def next_delay(self, attempt: int, exc: BaseException) -> float | None:
+        """Return how long to sleep before retrying, or None to re-raise now."""
+        if isinstance(exc, CircuitOpenError):
+            return None
+        if classify_error(exc) is ErrorClass.FATAL or attempt >= self.max_retries:
+            return None
+        budget = _current_budget.get()
+        if budget is not None and not budget.try_spend():
+            return None
+        return self.backoff(attempt, exc)
+
+
+_breaker_lock = threading.Lock()
+_breaker: CircuitBreaker | None = None
+
+
+def get_circuit_breaker(cfg: RuntimeConfig) -> CircuitBreaker:
+    """Return the process-wide breaker shared by every stage."""
+    global _breaker
+    with _breaker_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker(cfg.breaker_threshold, cfg.breaker_cooldown_seconds)
+        return _breaker
+
+
+def reset_circuit_breaker() -> None:
+    global _breaker
+    with _breaker_lock:
+        _breaker = None
+
@@ -16,6 +16,16 @@ def _env_bool(name: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
 def _env_int(name: str, default: int) -> int:
     raw = os.environ.get(name)
     if raw is None:
@@ -26,6 +36,11 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+def _env_csv(name: str) -> frozenset[str]:
+    raw = os.environ.get(name, "")
+    return frozenset(part.strip().lower() for part in raw.split(",") if part.strip())
+
+
 @dataclass(frozen=True)
 class RuntimeConfig:
     context_routing_v2: bool = True
@@ -33,12 +48,53 @@ class RuntimeConfig:
     conditional_search: bool = True
     search_budget: int = 3
     lead_compaction: bool = True
+    prompt_caching: bool = True
+    expert_max_tokens: int = 4096
     lead_max_tokens: int = 4096
     lead_max_tokens_escalated: int = 8192
     enable_retry: bool = True
     retries: int = 2
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 8.0
+    retry_budget: int = 6
+    breaker_threshold: int = 5
+    breaker_cooldown_seconds: float = 30.0
     enable_tpm_throttle: bool = True
     tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
+    limiter_backend: str = "memory"
+    limiter_path: str = ""
+    expert_timeout_seconds: float = 120.0
+    lead_timeout_seconds: float = 180.0
+    validator_timeout_seconds: float = 45.0
+    run_deadline_seconds: float = 420.0
+    cassette_mode: str = "off"
+    cassette_dir: str = "out/cassettes"
+    cassette_replay_latency: bool = False
+    response_cache: bool = False
+    response_cache_dir: str = "out/response_cache"
+    response_cache_max_mb: float = 256.0
+    response_cache_ttl_seconds: float = 7 * 24 * 3600.0
+    response_cache_bypass: frozenset[str] = frozenset()
+    checkpoints: bool = True
+    skills_bundle: bool = True
+    draft_reuse: bool = False
+    draft_reuse_threshold: float = 0.7
+    draft_index_path: str = "out/draft_index.jsonl"
+    data_source: str = ""
+    data_token_budget: int = 1500
+    budget_planner: bool = False
+    expert_input_budget: int = 12000
+    lead_input_budget: int = 16000
+    entity_graph: bool = True
+    entity_graph_depth: int = 1
+    retrieval: bool = False
+    retrieval_expert_budget: int = 4000
+    retrieval_lead_budget: int = 4000
+    retrieval_index_path: str = "out/skills_index.json"
+    pipelined_agentic: bool = False
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 60.0
 
 
 def load_runtime_config() -> RuntimeConfig:
@@ -48,10 +104,51 @@ def load_runtime_config() -> RuntimeConfig:
         conditional_search=_env_bool("EAM_CONDITIONAL_SEARCH", True),
         search_budget=_env_int("EAM_SEARCH_BUDGET", 3),
         lead_compaction=_env_bool("EAM_LEAD_COMPACTION", True),
+        prompt_caching=_env_bool("EAM_PROMPT_CACHING", True),
+        expert_max_tokens=_env_int("EAM_EXPERT_MAX_TOKENS", 4096),
         lead_max_tokens=_env_int("EAM_LEAD_MAX_TOKENS", 4096),
         lead_max_tokens_escalated=_env_int("EAM_LEAD_MAX_TOKENS_ESCALATED", 8192),
         enable_retry=_env_bool("EAM_ENABLE_RETRY", True),
         retries=_env_int("EAM_RETRIES", 2),
+        retry_base_delay=_env_float("EAM_RETRY_BASE_DELAY", 0.5),
+        retry_max_delay=_env_float("EAM_RETRY_MAX_DELAY", 8.0),
+        retry_budget=_env_int("EAM_RETRY_BUDGET", 6),
+        breaker_threshold=_env_int("EAM_BREAKER_THRESHOLD", 5),
+        breaker_cooldown_seconds=_env_float("EAM_BREAKER_COOLDOWN", 30.0),
         enable_tpm_throttle=_env_bool("EAM_ENABLE_TPM_THROTTLE", True),
         tokens_per_minute=_env_int("EAM_TOKENS_PER_MINUTE", DEFAULT_TOKENS_PER_MINUTE),
+        limiter_backend=os.environ.get("EAM_LIMITER_BACKEND", "memory").strip().lower(),
+        limiter_path=os.environ.get("EAM_LIMITER_PATH", ""),
+        expert_timeout_seconds=_env_float("EAM_EXPERT_TIMEOUT_SECONDS", 120.0),
+        lead_timeout_seconds=_env_float("EAM_LEAD_TIMEOUT_SECONDS", 180.0),
+        validator_timeout_seconds=_env_float("EAM_VALIDATOR_TIMEOUT_SECONDS", 45.0),
+        run_deadline_seconds=_env_float("EAM_RUN_DEADLINE_SECONDS", 420.0),
+        cassette_mode=os.environ.get("EAM_CASSETTE_MODE", "off").strip().lower(),
+        cassette_dir=os.environ.get("EAM_CASSETTE_DIR", "out/cassettes"),
+        cassette_replay_latency=_env_bool("EAM_CASSETTE_REPLAY_LATENCY", False),
+        response_cache=_env_bool("EAM_RESPONSE_CACHE", False),
+        response_cache_dir=os.environ.get("EAM_RESPONSE_CACHE_DIR", "out/response_cache"),
+        response_cache_max_mb=_env_float("EAM_RESPONSE_CACHE_MAX_MB", 256.0),
+        response_cache_ttl_seconds=_env_float("EAM_RESPONSE_CACHE_TTL_SECONDS", 7 * 24 * 3600.0),
+        response_cache_bypass=_env_csv("EAM_RESPONSE_CACHE_BYPASS"),
+        checkpoints=_env_bool("EAM_CHECKPOINTS", True),
+        skills_bundle=_env_bool("EAM_SKILLS_BUNDLE", True),
+        draft_reuse=_env_bool("EAM_DRAFT_REUSE", False),
+        draft_reuse_threshold=_env_float("EAM_DRAFT_REUSE_THRESHOLD", 0.7),
+        draft_index_path=os.environ.get("EAM_DRAFT_INDEX_PATH", "out/draft_index.jsonl"),
+        data_source=os.environ.get("EAM_DATA_SOURCE", ""),
+        data_token_budget=_env_int("EAM_DATA_TOKEN_BUDGET", 1500),
+        budget_planner=_env_bool("EAM_BUDGET_PLANNER", False),
+        expert_input_budget=_env_int("EAM_EXPERT_INPUT_BUDGET", 12000),
+        lead_input_budget=_env_int("EAM_LEAD_INPUT_BUDGET", 16000),
+        entity_graph=_env_bool("EAM_ENTITY_GRAPH", True),
+        entity_graph_depth=_env_int("EAM_ENTITY_GRAPH_DEPTH", 1),
+        retrieval=_env_bool("EAM_RETRIEVAL", False),
+        retrieval_expert_budget=_env_int("EAM_RETRIEVAL_EXPERT_BUDGET", 4000),
+        retrieval_lead_budget=_env_int("EAM_RETRIEVAL_LEAD_BUDGET", 4000),
+        retrieval_index_path=os.environ.get("EAM_RETRIEVAL_INDEX_PATH", "out/skills_index.json"),
+        pipelined_agentic=_env_bool("EAM_PIPELINED_AGENTIC", False),
+        http_max_connections=_env_int("EAM_HTTP_MAX_CONNECTIONS", 20),
+        http_max_keepalive_connections=_env_int("EAM_HTTP_MAX_KEEPALIVE", 10),
+        http_keepalive_expiry=_env_float("EAM_HTTP_KEEPALIVE_EXPIRY", 60.0),
     )
@@ -0,0 +1,179 @@
+"""Precompiled skills bundle for fast cold start.
+
+``python -m eam_council.council.skills_bundle`` compiles the skills tree into
+one file next to it (``eam_council/skills.bundle``)::
+
+    header   struct "<6sHI": magic, format version, index length
+    index    JSON: directory mtimes, and per file its path, payload offset and
+             length, mtime/size, content hash and token counts
+    payload  the UTF-8 file contents, back to back
+
+At start-up the bundle is memory-mapped and checked against the tree with one
+``stat`` per directory and file (no reads). A current bundle seeds the
+:class:`~eam_council.council.skills_loader.SkillsRepository` and the token
+counter; a missing, corrupt or stale one is ignored and the loader falls back
+to the directory walk.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+from eam_council.council.skills_loader import (
+    DEFAULT_SKILLS_ROOT,
+    CachedFile,
+    SkillLayout,
+    SkillsRepository,
+    resource_header,
+    skill_header,
+)
+from eam_council.council.token_counter import digest, get_token_counter, split_segments
+
+MAGIC = b"EAMSKB"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sHI")
+
+
+def default_bundle_path(skills_root: Path = DEFAULT_SKILLS_ROOT) -> Path:
+    return skills_root.parent / f"{skills_root.name}.bundle"
+
+
+def _segment_counts(section: str) -> list[tuple[str, int]]:
+    """Token counts of a section's segments, both mid-context and as the last section."""
+    counter = get_token_counter()
+    seen: dict[str, int] = {}
+    for text in (section, f"{section}\n\n"):
+        for segment in split_segments(text):
+            seen[digest(segment)] = counter.count_segment(segment)
+    return list(seen.items())
+
+
+def build_bundle(skills_root: Path = DEFAULT_SKILLS_ROOT, path: Path | None = None) -> Path:
+    """Compile ``skills_root`` into a bundle file and return its path."""
+    skills_root = skills_root.resolve()
+    path = path or default_bundle_path(skills_root)
+    repository = SkillsRepository(skills_root)
+    layout = repository.layout()
+
+    payload = bytearray()
+    files: list[dict[str, Any]] = []
+    for skill in layout:
+        entries = [(skill_header(skill.name), skill.skill_md, None)]
+        entries += [(resource_header(skill.name, p.name), p, p.name) for p in skill.resources]
+        for header, file_path, resource in entries:
+            text = repository.read(file_path)
+            data = text.encode("utf-8")
+            stat = file_path.stat()
+            section = f"{header}\n{text}"
+            files.append(
+                {
+                    "skill": skill.name,
+                    "resource": resource,
+                    "path": file_path.relative_to(skills_root).as_posix(),
+                    "offset": len(payload),
+                    "length": len(data),
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "digest": repository.digest(file_path),
+                    "tokens": get_token_counter().count(section),
+                    "segments": _segment_counts(section),
+                }
+            )
+            payload += data
+
+    index = {
+        "dirs": [[d.relative_to(skills_root).as_posix(), mtime_ns] for d, mtime_ns in repository.dir_stamp()],
+        "files": files,
+    }
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(_HEADER.pack(MAGIC, FORMAT_VERSION, len(index_bytes)) + index_bytes + payload)
+    tmp.replace(path)
+    return path
+
+
+def _read_index(buf: mmap.mmap) -> tuple[dict[str, Any], int] | None:
+    if len(buf) < _HEADER.size:
+        return None
+    magic, version, index_len = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    start = _HEADER.size
+    try:
+        index = json.loads(buf[start : start + index_len])
+    except ValueError:
+        return None
+    return index, start + index_len
+
+
+def _is_current(skills_root: Path, index: dict[str, Any]) -> bool:
+    try:
+        for rel, mtime_ns in index["dirs"]:
+            if (skills_root / rel).stat().st_mtime_ns != mtime_ns:
+                return False
+        for entry in index["files"]:
+            stat = (skills_root / entry["path"]).stat()
+            if (stat.st_mtime_ns, stat.st_size) != (entry["mtime_ns"], entry["size"]):
+                return False
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
+
+
+def _decode(skills_root: Path, index: dict[str, Any], buf: mmap.mmap, payload_start: int):
+    """Layout, directory stamp, file contents and segment counts from a bundle index."""
+    files: dict[Path, CachedFile] = {}
+    layout: list[SkillLayout] = []
+    segments: list[tuple[str, int]] = []
+    for entry in index["files"]:
+        file_path = skills_root / entry["path"]
+        start = payload_start + entry["offset"]
+        text = buf[start : start + entry["length"]].decode("utf-8")
+        files[file_path] = CachedFile(entry["mtime_ns"], entry["size"], entry["digest"], text)
+        if entry["resource"] is None:
+            layout.append(SkillLayout(entry["skill"], file_path, ()))
+        else:
+            last = layout[-1]
+            layout[-1] = SkillLayout(last.name, last.skill_md, last.resources + (file_path,))
+        segments += [(str(segment_digest), int(count)) for segment_digest, count in entry["segments"]]
+    stamp = tuple((skills_root / rel, int(mtime_ns)) for rel, mtime_ns in index["dirs"])
+    return tuple(layout), stamp, files, segments
+
+
+def seed_from_bundle(repository: SkillsRepository, path: Path | None = None) -> bool:
+    """Seed ``repository`` (and the token counter) from a current bundle.
+
+    Returns False, leaving the repository to walk the directory, when the
+    bundle is missing, unreadable, malformed or older than the skills tree.
+    Nothing is seeded unless the whole index decodes.
+    """
+    skills_root = repository.skills_root
+    path = path or default_bundle_path(skills_root)
+    try:
+        with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            parsed = _read_index(buf)
+            if parsed is None:
+                return False
+            index, payload_start = parsed
+            if not _is_current(skills_root, index):
+                return False
+            layout, stamp, files, segments = _decode(skills_root, index, buf, payload_start)
+    except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError):
+        return False
+
+    repository.seed(layout, stamp, files)
+    counter = get_token_counter()
+    for segment_digest, count in segments:
+        counter.seed(segment_digest, count)
+    return True
+
+
+if __name__ == "__main__":
+    root = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else DEFAULT_SKILLS_ROOT
+    written = build_bundle(root)
+    print(f"Wrote {written} ({written.stat().st_size} bytes)")
@@ -1,9 +1,24 @@
-"""Load SKILL.md files and their resources into a structured context string."""
+"""Load SKILL.md files and their resources into a structured context string.
+
+Reads go through a :class:`SkillsRepository` that keeps file contents in
+memory. Each call re-stats the files it needs: a file whose mtime and size are
+unchanged is served from memory, and a touched file is re-read but only
+replaces the cached text when its content hash differs. Assembled context
+strings are memoized per ``(include_skills, include_resources)`` selection and
+rebuilt only when one of their files changed.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
+from eam_council.council.runtime_config import load_runtime_config
+
+DEFAULT_SKILLS_ROOT = Path(__file__).resolve().parent.parent / "skills"
+
 
 def _iter_skill_dirs(skills_root: Path):
     for skill_dir in sorted(skills_root.iterdir()):
@@ -28,44 +43,192 @@ def _get_support_dir(skill_dir: Path) -> Path | None:
     return None
 
 
+@dataclass
+class CachedFile:
+    mtime_ns: int
+    size: int
+    digest: str
+    text: str
+
+
+@dataclass(frozen=True)
+class SkillLayout:
+    name: str
+    skill_md: Path
+    resources: tuple[Path, ...]
+
+
+def skill_header(skill: str) -> str:
+    return f"=== SKILL: {skill} ==="
+
+
+def resource_header(skill: str, file_name: str) -> str:
+    return f"--- Resource: {skill}/{file_name} ---"
+
+
+_Selection = tuple[frozenset[str] | None, frozenset[tuple[str, frozenset[str]]] | None]
+
+
+class SkillsRepository:
+    """In-memory cache of one skills tree with per-file invalidation."""
+
+    def __init__(self, skills_root: Path) -> None:
+        self.skills_root = skills_root
+        self._files: dict[Path, CachedFile] = {}
+        self._layout: tuple[SkillLayout, ...] = ()
+        self._layout_stamp: tuple[tuple[Path, int], ...] | None = None
+        self._assembled: dict[_Selection, tuple[tuple, str]] = {}
+        self._lock = threading.RLock()
+        self.reads = 0
+
+    def dir_stamp(self) -> tuple[tuple[Path, int], ...]:
+        """mtimes of every directory the layout was built from (entries added/removed)."""
+        dirs = [self.skills_root]
+        for skill in self._layout:
+            dirs.append(skill.skill_md.parent)
+            support = _get_support_dir(skill.skill_md.parent)
+            if support is not None:
+                dirs.append(support)
+        return tuple((d, d.stat().st_mtime_ns) for d in dirs)
+
+    def layout(self) -> tuple[SkillLayout, ...]:
+        with self._lock:
+            try:
+                if self._layout_stamp is not None and self.dir_stamp() == self._layout_stamp:
+                    return self._layout
+            except FileNotFoundError:
+                pass
+            layout = []
+            for skill_dir in _iter_skill_dirs(self.skills_root):
+                support_dir = _get_support_dir(skill_dir)
+                resources: tuple[Path, ...] = ()
+                if support_dir is not None:
+                    resources = tuple(p for p in sorted(support_dir.iterdir()) if p.is_file())
+                layout.append(SkillLayout(skill_dir.name, skill_dir / "SKILL.md", resources))
+            self._layout = tuple(layout)
+            self._layout_stamp = self.dir_stamp()
+            return self._layout
+
+    def seed(
+        self,
+        layout: tuple[SkillLayout, ...],
+        layout_stamp: tuple[tuple[Path, int], ...],
+        files: dict[Path, CachedFile],
+    ) -> None:
+        """Install a pre-validated layout and file contents (see :mod:`skills_bundle`)."""
+        with self._lock:
+            self._layout = layout
+            self._layout_stamp = layout_stamp
+            self._files.update(files)
+
+    def read(self, path: Path) -> str:
+        """Return the text of ``path``, re-reading only if its mtime or size changed."""
+        with self._lock:
+            stat = path.stat()
+            cached = self._files.get(path)
+            if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                return cached.text
+            # Normalize CRLF and lone CR line endings as text-mode reads do, so digests do not depend on them.
+            text = path.read_bytes().decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            self.reads += 1
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+            if cached is not None and cached.digest == digest:
+                cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+                return cached.text
+            self._files[path] = CachedFile(stat.st_mtime_ns, stat.st_size, digest, text)
+            return text
+
+    def digest(self, path: Path) -> str:
+        """Content hash of ``path`` (of its line-normalized text), reading it if needed."""
+        with self._lock:
+            self.read(path)
+            return self._files[path].digest
+
+    def fingerprint(self) -> str:
+        """Content hash of the whole tree: every skill and resource file."""
+        with self._lock:
+            h = hashlib.blake2b(digest_size=16)
+            for skill in self.layout():
+                for path in (skill.skill_md, *skill.resources):
+                    h.update(f"{path.relative_to(self.skills_root).as_posix()}\0{self.digest(path)}\0".encode("utf-8"))
+            return h.hexdigest()
+
+    def _selected(
+        self,
+        include_skills: set[str] | None,
+        include_resources: dict[str, set[str]] | None,
+    ) -> list[tuple[str, Path]]:
+        """``(header, path)`` pairs in context order for a selection."""
+        selected: list[tuple[str, Path]] = []
+        for skill in self.layout():
+            if include_skills is not None and skill.name not in include_skills:
+                continue
+            selected.append((skill_header(skill.name), skill.skill_md))
+            include_for_skill = None if include_resources is None else include_resources.get(skill.name)
+            for res_file in skill.resources:
+                if include_for_skill is not None and res_file.name not in include_for_skill:
+                    continue
+                selected.append((resource_header(skill.name, res_file.name), res_file))
+        return selected
+
+    def assemble(
+        self,
+        include_skills: set[str] | None = None,
+        include_resources: dict[str, set[str]] | None = None,
+    ) -> str:
+        """Return the formatted context string for a selection, memoized until a file changes."""
+        key: _Selection = (
+            frozenset(include_skills) if include_skills is not None else None,
+            frozenset((k, frozenset(v)) for k, v in include_resources.items())
+            if include_resources is not None
+            else None,
+        )
+        with self._lock:
+            selected = self._selected(include_skills, include_resources)
+            texts = [self.read(path) for _, path in selected]
+            fingerprint = tuple((path, self._files[path].digest) for _, path in selected)
+            memo = self._assembled.get(key)
+            if memo is not None and memo[0] == fingerprint:
+                return memo[1]
+            context = "\n\n".join(f"{header}\n{text}" for (header, _), text in zip(selected, texts))
+            self._assembled[key] = (fingerprint, context)
+            return context
+
+    def inventory(self) -> dict[str, list[str]]:
+        return {skill.name: [p.name for p in skill.resources] for skill in self.layout()}
+
+
+_repositories_lock = threading.Lock()
+_repositories: dict[Path, SkillsRepository] = {}
+
+
+def reset_skills_repositories() -> None:
+    with _repositories_lock:
+        _repositories.clear()
+
+
+def get_skills_repository(skills_root: Path | None = None) -> SkillsRepository:
+    """Return the process-wide repository for ``skills_root`` (default: packaged skills)."""
+    root = (skills_root or DEFAULT_SKILLS_ROOT).resolve()
+    with _repositories_lock:
+        repository = _repositories.get(root)
+        if repository is None:
+            repository = _repositories[root] = SkillsRepository(root)
+            if load_runtime_config().skills_bundle:
+                from eam_council.council.skills_bundle import seed_from_bundle
+
+                seed_from_bundle(repository)
+        return repository
+
+
 def list_skill_inventory(skills_root: Path | None = None) -> dict[str, list[str]]:
     """Return skill -> resource-file mapping for routing decisions."""
-    if skills_root is None:
-        skills_root = Path(__file__).resolve().parent.parent / "skills"
-
-    inventory: dict[str, list[str]] = {}
-    for skill_dir in _iter_skill_dirs(skills_root):
-        resources: list[str] = []
-        support_dir = _get_support_dir(skill_dir)
-        if support_dir is not None:
-            resources = [p.name for p in sorted(support_dir.iterdir()) if p.is_file()]
-        inventory[skill_dir.name] = resources
-    return inventory
+    return get_skills_repository(skills_root).inventory()
 
 
 def load_all_skills(skills_root: Path | None = None) -> str:
     """Read all skills and their resources, returning a formatted context string."""
-    if skills_root is None:
-        skills_root = Path(__file__).resolve().parent.parent / "skills"
-
-    sections: list[str] = []
-
-    for skill_dir in _iter_skill_dirs(skills_root):
-        skill_md = skill_dir / "SKILL.md"
-
-        skill_text = skill_md.read_text(encoding="utf-8")
-        sections.append(f"=== SKILL: {skill_dir.name} ===\n{skill_text}")
-
-        support_dir = _get_support_dir(skill_dir)
-        if support_dir is not None:
-            for res_file in sorted(support_dir.iterdir()):
-                if res_file.is_file():
-                    content = res_file.read_text(encoding="utf-8")
-                    sections.append(
-                        f"--- Resource: {skill_dir.name}/{res_file.name} ---\n{content}"
-                    )
-
-    return "\n\n".join(sections)
+    return get_skills_repository(skills_root).assemble()
 
 
 def load_selected_skills(
@@ -79,30 +242,4 @@ def load_selected_skills(
     If ``include_skills`` is None, include all skills. If ``include_resources`` has
     an entry for a skill, include only those resource file names for that skill.
     """
-    if skills_root is None:
-        skills_root = Path(__file__).resolve().parent.parent / "skills"
-
-    sections: list[str] = []
-
-    for skill_dir in _iter_skill_dirs(skills_root):
-        skill_name = skill_dir.name
-        if include_skills is not None and skill_name not in include_skills:
-            continue
-
-        skill_text = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
-        sections.append(f"=== SKILL: {skill_name} ===\n{skill_text}")
-
-        support_dir = _get_support_dir(skill_dir)
-        if support_dir is None:
-            continue
-
-        include_for_skill = None if include_resources is None else include_resources.get(skill_name)
-        for res_file in sorted(support_dir.iterdir()):
-            if not res_file.is_file():
-                continue
-            if include_for_skill is not None and res_file.name not in include_for_skill:
-                continue
-            content = res_file.read_text(encoding="utf-8")
-            sections.append(f"--- Resource: {skill_name}/{res_file.name} ---\n{content}")
-
-    return "\n\n".join(sections)
+    return get_skills_repository(skills_root).assemble(include_skills, include_resources)
@@ -0,0 +1,83 @@
+"""Local check of a speculative agentic draft against the finished EAM drafts.
+
+In pipelined mode (``EAM_PIPELINED_AGENTIC``) the agentic expert starts at
+the same time as the SAP and General experts, without their drafts. Once
+those drafts exist, :func:`find_conflicts` decides whether the speculative
+draft can stand. It makes no API call. It flags:
+
+* API identifiers or transaction codes the agentic draft relies on that
+  neither EAM draft names;
+* identifiers an EAM draft names in a sentence that rejects them ("not
+  supported", "deprecated", "avoid" ...);
+* items under the agentic draft's *Domain Assumptions* heading that share
+  several content words with such a rejecting sentence.
+
+Any conflict sends the agentic expert through the sequential path: it is
+re-run with both drafts as upstream constraints.
+"""
+
+from __future__ import annotations
+
+import re
+
+from eam_council.council.draft_index import content_words
+from eam_council.council.prompts import API_IDENTIFIER, split_sentences
+
+# SAP PM/EAM transaction families (orders, plans, equipment, locations, task
+# lists, measuring points, BOMs, work centers, materials). A generic
+# letters-plus-digits pattern would also flag order types such as PM01.
+_TRANSACTION = re.compile(r"\b(?:IW|IP|IE|IL|IA|IK|IB|CR|MM|MB|ME)\d{2,3}[A-Z]?\b")
+_REJECTION = re.compile(
+    r"\b(?:not supported|unsupported|deprecated|obsolete|avoid|do not|don't|must not|should not|never|"
+    r"not available|not recommended|no longer|instead of)\b",
+    re.IGNORECASE,
+)
+_HEADING = re.compile(r"^\s*#+\s*(.*)$")
+_BULLET = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.*)$")
+
+# Shared content words for an assumption to count as contradicted.
+ASSUMPTION_OVERLAP = 3
+
+
+def _terms(text: str) -> set[str]:
+    return set(API_IDENTIFIER.findall(text)) | set(_TRANSACTION.findall(text))
+
+
+def _rejections(text: str) -> list[str]:
+    return [s for line in text.splitlines() for s in split_sentences(line) if _REJECTION.search(s)]
+
+
+def _assumptions(text: str) -> list[str]:
+    """Bullets under any heading that mentions assumptions."""
+    items: list[str] = []
+    inside = False
+    for line in text.splitlines():
+        heading = _HEADING.match(line)
+        if heading:
+            inside = "assumption" in heading.group(1).lower()
+            continue
+        bullet = _BULLET.match(line)
+        if inside and bullet:
+            items.append(bullet.group(1).strip())
+    return items
+
+
+def find_conflicts(agentic_draft: str, sap_draft: str, general_draft: str) -> list[str]:
+    """Reasons the speculative ``agentic_draft`` disagrees with the EAM drafts; empty if none."""
+    domain = f"{sap_draft}\n{general_draft}"
+    named = _terms(domain)
+    used = _terms(agentic_draft)
+    rejections = _rejections(domain)
+
+    conflicts = [f"{term} is not named by either EAM draft" for term in sorted(used - named)]
+    conflicts += [
+        f"{term} is rejected by an EAM draft"
+        for term in sorted(used & named)
+        if any(term in sentence for sentence in rejections)
+    ]
+    rejected_words = [set(content_words(sentence)) for sentence in rejections]
+    for assumption in _assumptions(agentic_draft):
+        words = set(content_words(assumption))
+        if any(len(words & rejected) >= ASSUMPTION_OVERLAP for rejected in rejected_words):
+            conflicts.append(f"assumption contradicted: {assumption[:80]}")
+    return conflicts
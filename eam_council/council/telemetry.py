@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 
 @dataclass
@@ -15,12 +18,20 @@ class StageMetric:
     completion_chars: int
     elapsed_ms: int
     tool_uses: int = 0
+    ttft_ms: int | None = None
 
 
 @dataclass
 class RunTelemetry:
     started_at: float = field(default_factory=time.time)
     stages: list[StageMetric] = field(default_factory=list)
+    cut_stages: list[dict] = field(default_factory=list)
+    usage: dict[str, dict[str, int]] = field(default_factory=dict)
+    response_cache: dict[str, dict[str, int]] = field(default_factory=dict)
+    budgets: dict[str, dict] = field(default_factory=dict)
+    stage_timings: list[dict] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)
+    speculation: dict[str, dict] = field(default_factory=dict)
 
     def record(
         self,
@@ -30,6 +41,7 @@ class RunTelemetry:
         completion_chars: int,
         elapsed_ms: int,
         tool_uses: int = 0,
+        ttft_ms: int | None = None,
     ) -> None:
         self.stages.append(
             StageMetric(
@@ -38,9 +50,58 @@ class RunTelemetry:
                 completion_chars=completion_chars,
                 elapsed_ms=elapsed_ms,
                 tool_uses=tool_uses,
+                ttft_ms=ttft_ms,
             )
         )
 
+    def mark_cut(self, *, stage: str, reason: str) -> None:
+        """Record a stage that was skipped or cancelled by a timeout/deadline."""
+        self.cut_stages.append({"stage": stage, "reason": reason})
+
+    def record_usage(
+        self,
+        *,
+        stage: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> None:
+        """Accumulate billed token usage (including prompt-cache traffic) per stage."""
+        totals = self.usage.setdefault(
+            stage,
+            {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0, "cache_write_tokens": 0},
+        )
+        totals["calls"] += 1
+        totals["input_tokens"] += input_tokens
+        totals["output_tokens"] += output_tokens
+        totals["cache_read_tokens"] += cache_read_tokens
+        totals["cache_write_tokens"] += cache_write_tokens
+
+    def record_response_cache(self, *, stage: str, hit: bool) -> None:
+        counts = self.response_cache.setdefault(stage, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+
+    def record_budget(self, *, stage: str, budget_tokens: int, used_tokens: int, dropped: dict[str, int]) -> None:
+        """Record a stage's planned input size and the prompt parts dropped to fit it."""
+        self.budgets[stage] = {
+            "budget_tokens": budget_tokens,
+            "used_tokens": used_tokens,
+            "dropped": dict(dropped),
+        }
+
+    def record_schedule(self, *, timings: list[dict], critical_path: list[str]) -> None:
+        """Record when each orchestration stage ran and the chain that bounded the run."""
+        self.stage_timings = [dict(t) for t in timings]
+        self.critical_path = list(critical_path)
+
+    def record_speculation(self, *, stage: str, accepted: bool, conflicts: list[str]) -> None:
+        """Record whether a speculative draft was kept or conflicted with its upstream drafts."""
+        self.speculation[stage] = {"accepted": accepted, "conflicts": list(conflicts)}
+
+    def _usage_total(self, key: str) -> int:
+        return sum(u[key] for u in self.usage.values())
+
     def summarize(self) -> dict:
         return {
             "duration_ms": int((time.time() - self.started_at) * 1000),
@@ -48,9 +109,42 @@ class RunTelemetry:
             "total_prompt_chars": sum(s.prompt_chars for s in self.stages),
             "total_completion_chars": sum(s.completion_chars for s in self.stages),
             "total_tool_uses": sum(s.tool_uses for s in self.stages),
+            "total_input_tokens": self._usage_total("input_tokens"),
+            "total_output_tokens": self._usage_total("output_tokens"),
+            "total_cache_read_tokens": self._usage_total("cache_read_tokens"),
+            "total_cache_write_tokens": self._usage_total("cache_write_tokens"),
             "stages": [s.__dict__ for s in self.stages],
+            "usage": {stage: dict(u) for stage, u in self.usage.items()},
+            "response_cache_hits": sum(c["hits"] for c in self.response_cache.values()),
+            "response_cache_misses": sum(c["misses"] for c in self.response_cache.values()),
+            "response_cache": {stage: dict(c) for stage, c in self.response_cache.items()},
+            "budgets": {stage: dict(b) for stage, b in self.budgets.items()},
+            "cut_stages": list(self.cut_stages),
+            "stage_timings": [dict(t) for t in self.stage_timings],
+            "critical_path": list(self.critical_path),
+            "speculation": {stage: dict(s) for stage, s in self.speculation.items()},
         }
 
     def write_json(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(json.dumps(self.summarize(), indent=2), encoding="utf-8")
+
+
+_current_telemetry: contextvars.ContextVar[RunTelemetry | None] = contextvars.ContextVar(
+    "eam_run_telemetry", default=None
+)
+
+
+def current_telemetry() -> RunTelemetry | None:
+    """Telemetry of the council run in progress, if any."""
+    return _current_telemetry.get()
+
+
+@contextlib.contextmanager
+def telemetry_scope(telemetry: RunTelemetry) -> Iterator[RunTelemetry]:
+    """Bind ``telemetry`` so API calls made in this context report their usage to it."""
+    token = _current_telemetry.set(telemetry)
+    try:
+        yield telemetry
+    finally:
+        _current_telemetry.reset(token)
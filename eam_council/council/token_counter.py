@@ -0,0 +1,151 @@
+"""Memoized token estimation for prompt payloads.
+
+Prompts are split into segments at the context section markers
+(``=== SKILL:``, ``--- Resource:`` and ``## `` headings). Each segment is counted
+once and cached by content hash, so the large static parts (system prompts,
+skill files) cost a dictionary lookup on every later call and only the dynamic
+parts (question, drafts) are scanned.
+
+The per-segment heuristic is shape-aware rather than a flat chars/4: words,
+digit runs, punctuation runs and indentation are costed separately, which
+tracks YAML and markdown tables much more closely. Residual per-stage bias is
+corrected from recorded ``response.usage`` by
+:class:`~eam_council.council.rate_limiter.EstimateCalibrator`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+_SEGMENT_SPLIT = re.compile(r"(?m)^(?==== SKILL: |--- Resource: |## )")
+_PIECES = re.compile(r"[A-Za-z]+|\d+|\n|[ \t]+|_+|[^\w\s]+|[^\x00-\x7f]")
+
+
+def _count_uncached(text: str) -> int:
+    tokens = 0
+    for piece in _PIECES.findall(text):
+        first = piece[0]
+        if first.isalpha() and first.isascii():
+            # Common words are one token; long identifiers split every ~8 chars.
+            tokens += 1 + (len(piece) - 1) // 8
+        elif first.isdigit():
+            tokens += (len(piece) + 2) // 3
+        elif first == "\n":
+            tokens += 1
+        elif first in " \t":
+            # A single space merges into the next word; indentation runs do not.
+            tokens += (len(piece) + 2) // 4
+        elif first == "_":
+            tokens += 1
+        elif first.isascii():
+            tokens += (len(piece) + 1) // 2
+        else:
+            tokens += 1
+    return tokens
+
+
+def digest(text: str) -> str:
+    """Cache key of a text segment, as used by :meth:`TokenCounter.seed`."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def split_segments(text: str) -> list[str]:
+    """Split a composed prompt into independently cacheable segments."""
+    return [seg for seg in _SEGMENT_SPLIT.split(text) if seg]
+
+
+class TokenCounter:
+    """Content-hash memoized token estimator with a bounded LRU cache."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: str) -> int | None:
+        with self._lock:
+            count = self._cache.get(key)
+            if count is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return count
+
+    def _store(self, key: str, count: int) -> None:
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = count
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def count_segment(self, text: str) -> int:
+        key = digest(text)
+        count = self._lookup(key)
+        if count is None:
+            count = _count_uncached(text)
+            self._store(key, count)
+        return count
+
+    def count(self, text: str) -> int:
+        """Estimate tokens for ``text`` as the sum of its cached segment counts."""
+        if not text:
+            return 0
+        return sum(self.count_segment(seg) for seg in split_segments(text))
+
+    def prime(self, texts: Iterable[str]) -> None:
+        """Pre-count static texts (system prompts, skill files) ahead of use."""
+        for text in texts:
+            self.count(text)
+
+    def seed(self, text_digest: str, count: int) -> None:
+        """Install a precomputed count for a segment digest."""
+        with self._lock:
+            self._cache[text_digest] = count
+
+    def count_payload(self, kwargs: dict[str, Any]) -> int:
+        """Estimate prompt tokens for a ``messages.create`` payload."""
+        total = 0
+        for text in _payload_texts(kwargs):
+            total += self.count(text)
+        return max(1, total)
+
+
+def _content_texts(content: Any) -> Iterable[str]:
+    if isinstance(content, str):
+        yield content
+        return
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and isinstance(block.get("text"), str):
+                yield block["text"]
+
+
+def _payload_texts(kwargs: dict[str, Any]) -> Iterable[str]:
+    yield from _content_texts(kwargs.get("system"))
+    for msg in kwargs.get("messages", []) or []:
+        if isinstance(msg, dict):
+            yield from _content_texts(msg.get("content"))
+
+
+_counter = TokenCounter()
+
+
+def get_token_counter() -> TokenCounter:
+    return _counter
+
+
+def prime_static_prompts() -> None:
+    """Count the static system prompts from ``prompts.py`` once per process."""
+    from eam_council.council import prompts
+
+    _counter.prime(
+        value
+        for name, value in vars(prompts).items()
+        if name.isupper() and isinstance(value, str)
+    )
@@ -0,0 +1,95 @@
+"""Benchmark the data provider on synthetic 10k/100k-row datasets.
+
+    python eval/bench_data_provider.py [rows ...]
+
+For each size, writes work orders, equipment and work centers as CSV and as
+JSONL to a temporary directory. It then times a cold load plus render and a
+warm render (file unchanged), and reports the size of the rendered context
+against the token budget.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eam_council.council.data_provider import FileDataProvider, render_data_context  # noqa: E402
+from eam_council.council.token_counter import get_token_counter  # noqa: E402
+
+BUDGET = 1500
+
+
+def synthetic_tables(rows: int, seed: int = 7) -> dict[str, list[dict]]:
+    rng = random.Random(seed)
+    centers = [
+        {"work_center_id": f"WC-{i:03d}", "description": f"Maintenance Team {i}", "plant": f"PLT{i % 4 + 1}", "capacity_hours_per_day": 8.0 * (1 + i % 3)}
+        for i in range(25)
+    ]
+    equipment = [
+        {"equipment_id": f"EQ-{i:06d}", "description": f"Asset {i}", "func_loc_id": f"PLT1-AREA{i % 9}", "criticality": rng.choice("AABBBCCCC"), "manufacturer": rng.choice(["Siemens", "ABB", "Bosch"])}
+        for i in range(max(rows // 20, 1))
+    ]
+    base = datetime(2026, 1, 1)
+    orders = []
+    for i in range(rows):
+        start = base + timedelta(hours=rng.randrange(24 * 180))
+        orders.append(
+            {
+                "order_id": f"WO-{i:07d}",
+                "order_type": rng.choice(["PM01", "PM02", "PM02", "PM03"]),
+                "priority": rng.choice([1, 2, 3, 3, 4]),
+                "status": rng.choice(["CRTD", "REL", "REL", "TECO", "CLSD"]),
+                "equipment_id": rng.choice(equipment)["equipment_id"],
+                "func_loc_id": "PLT1-AREA1",
+                "planned_start": start.isoformat(),
+                "planned_end": (start + timedelta(hours=rng.choice([1, 2, 4, 8]))).isoformat(),
+                "work_center_id": rng.choice(centers)["work_center_id"],
+            }
+        )
+    return {"work_orders": orders, "equipment": equipment, "work_centers": centers}
+
+
+def write_tables(directory: Path, tables: dict[str, list[dict]], suffix: str) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, rows in tables.items():
+        path = directory / f"{name}{suffix}"
+        if suffix == ".csv":
+            with path.open("w", encoding="utf-8", newline="") as fh:
+                writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+
+
+def bench(rows: int, suffix: str, root: Path) -> None:
+    directory = root / f"{rows}{suffix.replace('.', '_')}"
+    write_tables(directory, synthetic_tables(rows), suffix)
+    provider = FileDataProvider(directory)
+
+    started = time.perf_counter()
+    context = render_data_context(provider.load(), BUDGET)
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    render_data_context(provider.load(), BUDGET)
+    warm_ms = (time.perf_counter() - started) * 1000
+
+    tokens = get_token_counter().count(context)
+    print(f"{rows:>8,} rows {suffix:<6} cold {cold_ms:8.1f} ms   warm {warm_ms:7.1f} ms   context {tokens:,} tokens (budget {BUDGET:,})")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            for suffix in (".csv", ".jsonl"):
+                bench(size, suffix, Path(tmp))
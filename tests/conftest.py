@@ -0,0 +1,14 @@
+"""Shared fixtures: every test runs in its own working directory.
+
+Council runs write ``out/`` (telemetry, checkpoints, caches) relative to the
+cwd, so each test gets a fresh ``tmp_path`` instead of the repository root.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
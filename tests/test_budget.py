@@ -0,0 +1,77 @@
+"""Per-stage token budget planner."""
+
+from __future__ import annotations
+
+from eam_council.council.budget import PartPriority, plan_prompt
+from eam_council.council.token_counter import get_token_counter
+
+SKILLS = (
+    "=== SKILL: eam_council ===\ncouncil rules\n\n"
+    "--- Resource: eam_council/output_format.md ---\n" + "format line\n" * 40 + "\n"
+    "--- Resource: eam_council/reconciliation_rules.md ---\nshort rules\n\n"
+    "=== SKILL: eam_spec_writer ===\nspec skill"
+)
+
+
+def _tokens(text: str) -> int:
+    return get_token_counter().count(text)
+
+
+def test_generous_budget_keeps_everything_unchanged():
+    plan = plan_prompt("experts", 100_000, question="q?", skills_context=SKILLS, mock_context="mock rows")
+    assert plan.dropped == []
+    assert plan.skills_context == SKILLS
+    assert plan.mock_context == "mock rows"
+
+
+def test_fills_by_priority_and_drops_lower_priority_parts():
+    question = "How should work orders be scheduled?"
+    drafts = ("sap draft " * 20, "general draft " * 20)
+    skills_only = sum(_tokens(s) for s in ("=== SKILL: eam_council ===\ncouncil rules\n\n", "=== SKILL: eam_spec_writer ===\nspec skill"))
+    budget = _tokens(question) + sum(map(_tokens, drafts)) + skills_only + _tokens("--- Resource: eam_council/reconciliation_rules.md ---\nshort rules\n\n")
+
+    plan = plan_prompt("lead", budget, question=question, drafts=drafts, skills_context=SKILLS, mock_context="mock rows")
+
+    assert plan.used_tokens <= budget
+    # The large resource does not fit; the smaller one after it still does. Mock data never does.
+    assert [p.name for p in plan.dropped] == ["eam_council/output_format.md", "mock_data"]
+    assert plan.skills_context.startswith("=== SKILL: eam_council ===")
+    assert "short rules" in plan.skills_context and "format line" not in plan.skills_context
+    assert plan.skills_context.endswith("spec skill")
+    assert plan.mock_context == ""
+
+
+def test_question_and_drafts_are_always_kept():
+    plan = plan_prompt("lead", 1, question="q?", drafts=("a long draft " * 50,), skills_context=SKILLS)
+    assert [p.priority for p in plan.kept] == [PartPriority.QUESTION, PartPriority.DRAFTS]
+    assert plan.over_budget
+    assert plan.skills_context == ""
+
+
+def test_dropped_parts_are_recorded_in_telemetry(monkeypatch, tmp_path):
+    import asyncio
+    import json
+    from pathlib import Path
+
+    from eam_council.council import lead_agent
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EAM_BUDGET_PLANNER", "true")
+    monkeypatch.setenv("EAM_EXPERT_INPUT_BUDGET", "1")
+    monkeypatch.setattr(lead_agent, "get_mock_context", lambda: "mock rows")
+    seen: dict[str, tuple] = {}
+
+    async def fake_sap(question, skills_context, mock_context, *_args, **_kwargs):
+        seen["sap"] = (skills_context, mock_context)
+        return lead_agent.SubagentDraft(agent_name="SAP", perspective="sap", content="sap draft")
+
+    monkeypatch.setattr(lead_agent, "run_sap_subagent", fake_sap)
+
+    asyncio.run(lead_agent.run_council(question="Which API reads work orders?", model="dummy", dry_run=True, search_enabled=False))
+
+    assert seen["sap"] == ("", "")
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    experts = telemetry["budgets"]["experts"]
+    assert experts["budget_tokens"] == 1
+    assert "eam_council" in experts["dropped"] and "mock_data" in experts["dropped"]
+    assert telemetry["budgets"]["lead"]["dropped"] == {}
@@ -0,0 +1,100 @@
+"""Record/replay cassette tests: full council runs offline at recorded timings."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from eam_council.council import clients, lead_agent
+from eam_council.council.cassette import Cassette, CassetteMissError, request_key
+from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+
+
+class _RecordingMessages:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        text = "ALIGNED" if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM else f"answer #{self.calls}"
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=usage)
+
+
+class _OfflineMessages:
+    async def create(self, **_kwargs):
+        raise AssertionError("replay must not reach the network")
+
+
+def _run(question: str = "How should we schedule work orders?") -> str:
+    return asyncio.run(
+        lead_agent.run_council(question=question, model="dummy", dry_run=False, search_enabled=False)
+    )
+
+
+@pytest.fixture
+def cassette_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setenv("EAM_CASSETTE_DIR", str(tmp_path / "cassettes"))
+    return tmp_path / "cassettes"
+
+
+def _use_messages(monkeypatch, messages) -> None:
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=messages))
+
+
+def test_request_key_is_order_independent():
+    assert request_key({"model": "m", "max_tokens": 1}) == request_key({"max_tokens": 1, "model": "m"})
+    assert request_key({"model": "m"}) != request_key({"model": "n"})
+
+
+def test_recorded_council_run_replays_offline(monkeypatch, cassette_env):
+    monkeypatch.setenv("EAM_CASSETTE_MODE", "record")
+    _use_messages(monkeypatch, _RecordingMessages())
+    recorded = _run()
+    assert any(cassette_env.iterdir())
+
+    monkeypatch.setenv("EAM_CASSETTE_MODE", "replay")
+    _use_messages(monkeypatch, _OfflineMessages())
+    assert _run() == recorded
+
+
+def test_replay_miss_is_reported(monkeypatch, cassette_env):
+    monkeypatch.setenv("EAM_CASSETTE_MODE", "replay")
+    _use_messages(monkeypatch, _OfflineMessages())
+    with pytest.raises(CassetteMissError):
+        _run("A question nobody recorded")
+
+
+def test_replay_can_reimpose_recorded_latency(tmp_path):
+    cassette = Cassette(tmp_path, "record")
+    kwargs = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+    response = SimpleNamespace(content=[SimpleNamespace(type="text", text="hello")])
+    cassette.record(kwargs, response, elapsed=0.2)
+
+    fast = Cassette(tmp_path, "replay")
+    started = time.perf_counter()
+    assert asyncio.run(fast.areplay(kwargs)).content[0].text == "hello"
+    assert time.perf_counter() - started < 0.1
+
+    paced = Cassette(tmp_path, "replay", replay_latency=True)
+    started = time.perf_counter()
+    asyncio.run(paced.areplay(kwargs))
+    assert time.perf_counter() - started >= 0.2
+
+
+def test_streamed_call_replays_its_deltas(tmp_path):
+    cassette = Cassette(tmp_path, "record")
+    kwargs = {"model": "m", "messages": [{"role": "user", "content": "stream"}]}
+    response = SimpleNamespace(content=[SimpleNamespace(type="text", text="abcdef")])
+    cassette.record(kwargs, response, elapsed=0.05, chunks=["ab", "cd", "ef"], ttft=0.01)
+
+    received: list[str] = []
+    replayed = asyncio.run(Cassette(tmp_path, "replay", replay_latency=True).areplay_stream(kwargs, received.append))
+    assert received == ["ab", "cd", "ef"]
+    assert replayed.content[0].text == "abcdef"
@@ -0,0 +1,133 @@
+"""Stage checkpointing and resume of interrupted or failed council runs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from eam_council.council.models import SubagentDraft
+
+
+class _LeadError(Exception):
+    status_code = 400
+
+
+def _setup(monkeypatch, tmp_path, create):
+    from eam_council.council import clients, lead_agent
+
+    expert_calls: list[str] = []
+
+    async def fake_sap(*_args, **_kwargs):
+        expert_calls.append("sap")
+        return SubagentDraft(agent_name="SAP", perspective="sap", content="sap draft")
+
+    async def fake_general(*_args, **_kwargs):
+        expert_calls.append("general")
+        return SubagentDraft(agent_name="General", perspective="gen", content="general draft")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setattr(lead_agent, "run_sap_subagent", fake_sap)
+    monkeypatch.setattr(lead_agent, "run_general_subagent", fake_general)
+    monkeypatch.setattr(
+        clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=SimpleNamespace(create=create))
+    )
+    return expert_calls
+
+
+def _run(run_id: str) -> str:
+    from eam_council.council import lead_agent
+
+    return asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=False,
+            search_enabled=False,
+            run_id=run_id,
+        )
+    )
+
+
+def test_failed_lead_resumes_without_repeating_expert_calls(monkeypatch, tmp_path):
+    from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+
+    lead_fails = [True]
+
+    async def create(**kwargs):
+        if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM:
+            text = "ALIGNED"
+        elif lead_fails[0]:
+            raise _LeadError("bad request")
+        else:
+            text = "reconciled answer"
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+
+    expert_calls = _setup(monkeypatch, tmp_path, create)
+
+    with pytest.raises(_LeadError):
+        _run("run-1")
+    run_dir = tmp_path / "out" / "runs" / "run-1"
+    assert json.loads((run_dir / "meta.json").read_text())["status"] == "failed"
+    assert (run_dir / "sap.json").exists() and (run_dir / "general.json").exists()
+
+    lead_fails[0] = False
+    output = _run("run-1")
+
+    assert output.startswith("reconciled answer")
+    assert expert_calls == ["sap", "general"]
+    assert json.loads((run_dir / "meta.json").read_text())["status"] == "complete"
+    assert (run_dir / "lead.json").exists()
+
+
+def test_interrupt_marks_run_resumable(monkeypatch, tmp_path):
+    async def create(**_kwargs):
+        raise asyncio.CancelledError  # what asyncio.run delivers to the run on Ctrl-C
+
+    _setup(monkeypatch, tmp_path, create)
+
+    with pytest.raises(asyncio.CancelledError):
+        _run("run-2")
+    run_dir = tmp_path / "out" / "runs" / "run-2"
+    assert json.loads((run_dir / "meta.json").read_text())["status"] == "interrupted"
+    assert (run_dir / "sap.json").exists()
+
+
+def test_resume_rejects_a_different_question(tmp_path):
+    from eam_council.council.checkpoints import RunCheckpoint
+
+    RunCheckpoint.open("run-3", question="q1", model="m", search_enabled=False, root=tmp_path)
+    with pytest.raises(ValueError, match="question"):
+        RunCheckpoint.open("run-3", question="q2", model="m", search_enabled=False, root=tmp_path)
+    with pytest.raises(ValueError, match="model"):
+        RunCheckpoint.open("run-3", question="q1", model="other", search_enabled=False, root=tmp_path)
+    with pytest.raises(ValueError, match="search"):
+        RunCheckpoint.open("run-3", question="q1", model="m", search_enabled=True, root=tmp_path)
+
+
+def test_cli_resume_restores_search_setting_and_reports_mismatches(monkeypatch, capsys):
+    from eam_council import cli
+    from eam_council.council.checkpoints import RunCheckpoint
+
+    RunCheckpoint.open("run-4", question="q1", model="m", search_enabled=False)
+    calls: list[dict] = []
+
+    async def fake_run_council(**kwargs):
+        calls.append(kwargs)
+        return "answer"
+
+    monkeypatch.setattr(cli, "run_council", fake_run_council)
+    monkeypatch.setattr("sys.argv", ["eam_council", "--resume", "run-4"])
+    cli.main()
+    assert calls[0]["question"] == "q1"
+    assert calls[0]["model"] == "m"
+    assert calls[0]["search_enabled"] is False
+
+    monkeypatch.setattr("sys.argv", ["eam_council", "other question", "--resume", "run-4"])
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main()
+    assert exit_info.value.code == 1
+    assert "different question" in capsys.readouterr().out
@@ -0,0 +1,40 @@
+"""Tests for the process-wide pooled Anthropic client provider."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from eam_council.council import clients
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    clients.reset_clients()
+    yield
+    clients.reset_clients()
+
+
+def test_sync_client_is_shared():
+    assert clients.get_client() is clients.get_client()
+
+
+def test_async_client_is_shared_within_a_loop():
+    async def _two_stages():
+        return clients.get_async_client(), clients.get_async_client()
+
+    first, second = asyncio.run(_two_stages())
+    assert first is second
+    assert first.max_retries == 0
+
+
+def test_connection_limits_follow_runtime_config(monkeypatch):
+    monkeypatch.setenv("EAM_HTTP_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("EAM_HTTP_MAX_KEEPALIVE", "3")
+    from eam_council.council.runtime_config import load_runtime_config
+
+    limits = clients._connection_limits(load_runtime_config())
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 3
@@ -15,10 +15,95 @@ def test_filter_context_general_removes_canonical_entities():
     assert "glossary.md" in out
 
 
+def _long_draft() -> str:
+    filler = "This paragraph elaborates the design in considerable detail. " * 12
+    return (
+        "## SAP EAM Expert Draft\n\n"
+        f"### Recommendation\nUse the published OData services. {filler}\n\n"
+        f"### Relevant SAP APIs & Services\n- API_MAINTORDER_SRV for orders. {filler}\n"
+        f"- API_EQUIPMENT_SRV for assets.\n\n"
+        f"### Integration Approach\n{filler}\n{filler}\n\n"
+        "### Risks & Constraints\n- Capacity leveling is coarse.\n- Cross-plant scheduling needs config.\n\n"
+        "### Assumptions\n- S/4HANA 2023 or later.\n"
+    )
+
+
 def test_build_lead_prompt_compacts_long_drafts():
-    long_text = "x" * 2500
+    long_text = _long_draft()
     prompt = build_lead_prompt("q", long_text, long_text, "skills", compact=True)
     assert "[...truncated for cost control...]" in prompt
+    assert len(prompt) < 2 * len(long_text)
+
+
+def test_compact_draft_keeps_every_section_and_api_identifier():
+    from eam_council.council.prompts import compact_draft
+    from eam_council.council.token_counter import get_token_counter
+
+    draft = _long_draft()
+    compacted = compact_draft(draft, max_tokens=200)
+
+    assert compacted == compact_draft(draft, max_tokens=200)
+    assert get_token_counter().count(compacted) < get_token_counter().count(draft) / 2
+    for heading in ("### Recommendation", "### Integration Approach", "### Risks & Constraints", "### Assumptions"):
+        assert heading in compacted
+    assert "API_MAINTORDER_SRV" in compacted and "API_EQUIPMENT_SRV" in compacted
+    assert "- Capacity leveling is coarse." in compacted
+    assert "- S/4HANA 2023 or later." in compacted
+    assert compacted.endswith("[...truncated for cost control...]")
+    assert compact_draft("short draft") == "short draft"
+
+
+def test_compact_draft_keeps_risk_bullets_and_never_grows():
+    from eam_council.council.prompts import TRUNCATION_MARKER, compact_draft
+    from eam_council.council.sap_eam_subagent import DRY_RUN_RESPONSE
+    from eam_council.council.token_counter import get_token_counter
+
+    counter = get_token_counter()
+    compacted = compact_draft(DRY_RUN_RESPONSE, max_tokens=300)
+    risks = DRY_RUN_RESPONSE.split("### Risks & Constraints\n", 1)[1].split("\n\n", 1)[0]
+    for bullet in risks.splitlines():
+        assert bullet in compacted
+    assert counter.count(compacted) <= 300
+
+    # Clipped text ends at a word boundary.
+    tight = compact_draft(DRY_RUN_RESPONSE * 4, max_tokens=450)
+    for line in tight.splitlines():
+        if line.endswith("..."):
+            words = line[:-3].split()
+            assert words[-1] in DRY_RUN_RESPONSE.split()
+    assert counter.count(tight) < counter.count(DRY_RUN_RESPONSE * 4) // 3
+
+    # A draft that cannot shrink comes back unchanged, without the marker.
+    table = "\n".join(f"| API_SERVICE_{i}_SRV |" for i in range(600))
+    assert counter.count(compact_draft(table, max_tokens=5)) <= counter.count(table)
+    for draft in (DRY_RUN_RESPONSE, DRY_RUN_RESPONSE * 4, table, "## Only\n- one line"):
+        for budget in (1, 50, 450):
+            out = compact_draft(draft, max_tokens=budget)
+            assert counter.count(out) <= counter.count(draft)
+            assert out == draft or out.endswith(TRUNCATION_MARKER)
+
+
+def test_compact_draft_keeps_every_identifier_under_a_tight_budget():
+    from eam_council.council.prompts import compact_draft
+    from eam_council.council.token_counter import get_token_counter
+
+    counter = get_token_counter()
+    filler = "This paragraph elaborates the design in considerable detail. " * 6
+    names = "ORDER EQUIPMENT FUNCLOC PLAN WORKCENTER NOTIFICATION MEASPOINT TASKLIST MATERIAL BOM CONFIRM PERMIT"
+    services = [f"API_{name}_SRV" for name in names.split()]
+    apis = "".join(f"- Integrate the scheduler with {api} through its OData entity sets. {filler}\n" for api in services)
+    draft = (
+        f"## Draft\n\n### Recommendation\nUse published OData services only. {filler}\n\n"
+        f"### Relevant APIs\n{apis}\n### Risks\n- Capacity leveling is coarse.\n"
+    )
+    assert counter.count(draft) > 1000
+
+    for budget in (120, 250, 450):
+        compacted = compact_draft(draft, max_tokens=budget)
+        assert counter.count(compacted) <= budget
+        for service in services:
+            assert f"- {service}" in compacted or f"with {service}" in compacted
+    assert "- Capacity leveling is coarse." in compact_draft(draft, max_tokens=250)
 
 
 def test_load_selected_skills_subset():
@@ -39,3 +124,27 @@ def test_build_lead_prompt_includes_agentic_draft_section_when_present():
     )
     assert "## Agentic Architecture Expert Draft" in prompt
     assert "agentic draft" in prompt
+
+
+def test_filter_context_api_strips_sap_internals_blocks_only():
+    ctx = (
+        "=== SKILL: eam_glossary_entities ===\nfoo\n\n"
+        "--- Resource: eam_glossary_entities/canonical_entities.yaml ---\n"
+        "entities:\n"
+        "  - name: WorkOrder\n"
+        "    sap_internals:\n"
+        "      legacy_table: AUFK\n"
+        "      transactions: [IW31]\n"
+        "    fields:\n"
+        "      - name: order_id\n"
+    )
+    out = filter_context_for_question(ctx, "Which SAP API exposes work orders?")
+    assert "sap_internals" not in out and "AUFK" not in out
+    assert "    fields:\n      - name: order_id" in out
+    assert "  - name: WorkOrder" in out
+
+
+def test_filtered_variants_are_computed_once():
+    ctx = load_selected_skills(include_skills={"eam_glossary_entities"})
+    first = filter_context_for_question(ctx, "Create an organizational roadmap")
+    assert filter_context_for_question(ctx, "Build a change management strategy") is first
@@ -0,0 +1,161 @@
+"""Tests for the stage-graph executor."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+def _sleeper(seconds: float, value=None):
+    async def run(_inputs):
+        await asyncio.sleep(seconds)
+        return value
+
+    return run
+
+
+def test_independent_stages_overlap_and_critical_path_follows_slowest_branch():
+    import time
+
+    from eam_council.council.dag import Stage, StageGraph
+
+    async def join(inputs):
+        return inputs["fast"] + inputs["slow"]
+
+    graph = StageGraph(
+        [
+            Stage("fast", _sleeper(0.05, 1), outputs=("fast",)),
+            Stage("slow", _sleeper(0.2, 2), outputs=("slow",)),
+            Stage("join", join, inputs=("fast", "slow"), outputs=("total",)),
+        ]
+    )
+
+    started = time.perf_counter()
+    run = asyncio.run(graph.run())
+    elapsed = time.perf_counter() - started
+
+    assert run.values["total"] == 3
+    assert elapsed < 0.2 + 0.05 * 0.8
+    assert run.critical_path() == ["slow", "join"]
+    assert run.critical_path_ms() >= 200
+    assert [t["stage"] for t in run.timing_records()][-1] == "join"
+
+
+def test_group_limit_serializes_stages_in_the_group():
+    from eam_council.council.dag import Stage, StageGraph
+
+    graph = StageGraph(
+        [
+            Stage("a", _sleeper(0.05), outputs=("a",), group="lead"),
+            Stage("b", _sleeper(0.05), outputs=("b",), group="lead"),
+        ],
+        group_limits={"lead": 1},
+    )
+
+    run = asyncio.run(graph.run())
+
+    first, second = sorted(run.timings.values(), key=lambda t: t.started_ms)
+    assert second.started_ms >= first.finished_ms
+
+
+def test_skipped_and_cut_stages_feed_fallbacks_downstream():
+    from eam_council.council.dag import Stage, StageGraph
+
+    cut_reasons: list[str] = []
+
+    def on_cut(_inputs, reason):
+        cut_reasons.append(reason)
+        return "placeholder"
+
+    async def collect(inputs):
+        return (inputs["optional"], inputs["draft"])
+
+    graph = StageGraph(
+        [
+            Stage("optional", _sleeper(0, "ran"), outputs=("optional",), when=lambda _: False),
+            Stage("draft", _sleeper(5, "late"), outputs=("draft",), timeout=lambda: 0.05, on_cut=on_cut),
+            Stage("collect", collect, inputs=("optional", "draft"), outputs=("result",)),
+        ]
+    )
+
+    run = asyncio.run(graph.run())
+
+    assert run.values["result"] == (None, "placeholder")
+    assert cut_reasons == ["timed out after 0s"]
+    assert run.timings["optional"].status == "skipped"
+    assert run.timings["draft"].status == "cut"
+
+
+def test_critical_path_looks_through_skipped_stages():
+    from eam_council.council.dag import Stage, StageGraph
+
+    timings = {}
+
+    async def report(_inputs):
+        return timings["slow"].elapsed_ms
+
+    graph = StageGraph(
+        [
+            Stage("slow", _sleeper(0.05, 1), outputs=("a",)),
+            Stage("fast", _sleeper(0, 2), outputs=("b",)),
+            Stage("check", _sleeper(0), inputs=("a",), outputs=("checked",), when=lambda _: False),
+            Stage("report", report, inputs=("checked", "b"), outputs=("reported",)),
+            Stage("tail", _sleeper(0), inputs=("reported",), outputs=("done",), when=lambda _: False),
+        ]
+    )
+
+    run = asyncio.run(graph.run(timings=timings))
+
+    assert run.critical_path() == ["slow", "report"]
+    assert run.values["reported"] >= 50
+    assert run.timings is timings
+
+
+def test_multiple_outputs_and_initial_values():
+    from eam_council.council.dag import Stage, StageGraph
+
+    async def split(inputs):
+        return inputs["text"].upper(), len(inputs["text"])
+
+    graph = StageGraph([Stage("split", split, inputs=("text",), outputs=("upper", "length"))])
+
+    run = asyncio.run(graph.run({"text": "abc"}))
+
+    assert run.values["upper"] == "ABC"
+    assert run.values["length"] == 3
+
+
+def test_failing_stage_cancels_stages_in_flight():
+    from eam_council.council.dag import Stage, StageGraph
+
+    cancelled: list[bool] = []
+
+    async def slow(_inputs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def broken(_inputs):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    graph = StageGraph([Stage("slow", slow, outputs=("a",)), Stage("broken", broken, outputs=("b",))])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(graph.run())
+    assert cancelled == [True]
+
+
+def test_graph_definition_errors_are_reported():
+    from eam_council.council.dag import Stage, StageGraph
+
+    noop = _sleeper(0)
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph([Stage("a", noop, inputs=("y",), outputs=("x",)), Stage("b", noop, inputs=("x",), outputs=("y",))])
+    with pytest.raises(ValueError, match="produced by both"):
+        StageGraph([Stage("a", noop, outputs=("x",)), Stage("b", noop, outputs=("x",))])
+    with pytest.raises(ValueError, match="No value"):
+        asyncio.run(StageGraph([Stage("a", noop, inputs=("missing",))]).run())
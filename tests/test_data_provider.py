@@ -0,0 +1,96 @@
+"""Pluggable EAM data provider with aggregation under a token budget."""
+
+from __future__ import annotations
+
+import csv
+import json
+
+import pytest
+
+from eam_council.council.data_provider import FileDataProvider, render_data_context
+from eam_council.council.token_counter import get_token_counter
+
+
+def _write_csv(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _orders(n):
+    return [
+        {
+            "order_id": f"WO-{i:06d}",
+            "order_type": ("PM01", "PM02", "PM03")[i % 3],
+            "priority": i % 4 + 1,
+            "status": "REL" if i % 2 else "CRTD",
+            "equipment_id": f"EQ-{i % 50:03d}",
+            "planned_start": "2026-03-01T08:00:00",
+            "planned_end": "2026-03-01T10:00:00",
+            "work_center_id": f"WC-{i % 2}",
+        }
+        for i in range(n)
+    ]
+
+
+def test_mock_data_is_listed_in_full(monkeypatch):
+    from eam_council.council.mock_data import get_mock_context
+
+    monkeypatch.delenv("EAM_DATA_SOURCE", raising=False)
+    context = get_mock_context()
+    assert context.startswith("## Mock SAP EAM Data (for reference)\n")
+    assert "- WO-001234 | Type: PM02 | Priority: 1 | Equipment: EQ-5001" in context
+    assert "- WC-MECH-01 | Mechanical Maintenance Team A | Capacity: 8.0h/day" in context
+
+
+def test_large_dataset_is_aggregated_within_budget(tmp_path, monkeypatch):
+    _write_csv(tmp_path / "work_orders.csv", _orders(10_000))
+    (tmp_path / "equipment.jsonl").write_text(
+        "".join(json.dumps({"equipment_id": f"EQ-{i:03d}", "description": "Pump", "criticality": "ABC"[i % 3]}) + "\n" for i in range(50)),
+        encoding="utf-8",
+    )
+    (tmp_path / "work_centers.json").write_text(
+        json.dumps([{"work_center_id": "WC-0", "capacity_hours_per_day": 8}, {"work_center_id": "WC-1", "capacity_hours_per_day": 16}]),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("EAM_DATA_SOURCE", str(tmp_path))
+    monkeypatch.setenv("EAM_DATA_TOKEN_BUDGET", "800")
+
+    from eam_council.council.mock_data import get_mock_context
+
+    context = get_mock_context()
+    assert get_token_counter().count(context) <= 800
+    assert "### Work Orders: 10,000 planned 2026-03-01 to 2026-03-01" in context
+    assert "- By type: PM01 3,334 | PM02 3,333 | PM03 3,333" in context
+    assert "- By criticality: A 17 | B 17 | C 16" in context
+    assert "- WC-0 | 5,000 orders | 10,000h planned | 125000% of capacity" in context
+    assert "### Sample Work Orders (" in context and "### Sample Equipment (" in context
+    assert get_mock_context() is context  # memoized while the files are unchanged
+
+
+def test_file_provider_reloads_changed_files(tmp_path):
+    _write_csv(tmp_path / "work_orders.csv", _orders(3))
+    provider = FileDataProvider(tmp_path)
+    first = provider.load()
+    assert provider.load() is first
+    assert render_data_context(first, 1500).startswith(f"## EAM Data ({tmp_path.name}) (for reference)")
+
+    _write_csv(tmp_path / "work_orders.csv", _orders(5))
+    assert len(provider.load().work_orders) == 5
+
+
+def test_parquet_without_pyarrow_raises_a_clear_error(tmp_path, monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def _no_pyarrow(name, *args, **kwargs):
+        if name.startswith("pyarrow"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    (tmp_path / "work_orders.parquet").write_bytes(b"PAR1")
+    monkeypatch.setattr(builtins, "__import__", _no_pyarrow)
+    with pytest.raises(RuntimeError, match="requires pyarrow"):
+        FileDataProvider(tmp_path).load()
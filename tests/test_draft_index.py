@@ -0,0 +1,92 @@
+"""Near-duplicate question detection and expert draft reuse."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from eam_council.council.draft_index import DraftIndex, minhash, similarity
+from eam_council.council.models import SubagentDraft
+
+
+def _draft(name: str) -> SubagentDraft:
+    return SubagentDraft(agent_name=name, perspective=name, content=f"{name} draft")
+
+
+def test_paraphrases_score_above_unrelated_questions():
+    base = minhash("How should we architect a work order scheduling module for SAP EAM?")
+    paraphrase = minhash("What is the best architecture for work order scheduling in SAP EAM?")
+    unrelated = minhash("How should we architect IoT predictive maintenance for pumps?")
+
+    assert similarity(base, paraphrase) >= 0.7
+    assert similarity(base, unrelated) < 0.2
+
+
+def test_lookup_requires_same_model_and_context(tmp_path):
+    index = DraftIndex(tmp_path / "index.jsonl")
+    question = "How do we design work order scheduling with SAP EAM?"
+    index.add(question, model="m", context="ctx", sap=_draft("sap"), general=_draft("general"), agentic=None)
+
+    match = index.lookup(question, model="m", context="ctx", threshold=0.7)
+    assert match is not None and match.sap.content == "sap draft" and match.score == 1.0
+    assert index.lookup(question, model="other", context="ctx", threshold=0.7) is None
+    assert index.lookup(question, model="m", context="changed-skills", threshold=0.7) is None
+
+
+def test_similar_question_reuses_drafts_and_reruns_only_lead(monkeypatch, tmp_path):
+    from eam_council.council import clients, lead_agent
+    from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+
+    expert_calls: list[str] = []
+
+    async def fake_sap(*_args, **_kwargs):
+        expert_calls.append("sap")
+        return _draft("sap")
+
+    async def fake_general(*_args, **_kwargs):
+        expert_calls.append("general")
+        return _draft("general")
+
+    class _Messages:
+        def __init__(self):
+            self.lead_prompts: list[str] = []
+
+        async def create(self, **kwargs):
+            if kwargs["system"] != ALIGNMENT_VALIDATOR_SYSTEM:
+                content = kwargs["messages"][0]["content"]
+                self.lead_prompts.append(content if isinstance(content, str) else content[0]["text"])
+            text = "ALIGNED" if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM else "lead answer"
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+
+    messages = _Messages()
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setenv("EAM_DRAFT_REUSE", "1")
+    monkeypatch.setenv("EAM_DRAFT_INDEX_PATH", str(tmp_path / "index.jsonl"))
+    monkeypatch.setattr(lead_agent, "run_sap_subagent", fake_sap)
+    monkeypatch.setattr(lead_agent, "run_general_subagent", fake_general)
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=messages))
+
+    def ask(question: str) -> str:
+        return asyncio.run(
+            lead_agent.run_council(question=question, model="dummy", dry_run=False, search_enabled=False)
+        )
+
+    first_question = "How should we architect a work order scheduling module for SAP EAM?"
+    first = ask(first_question)
+    second = ask("What is the best architecture for work order scheduling in SAP EAM?")
+
+    assert expert_calls == ["sap", "general"]
+    assert "Run Notes" not in first
+    assert "Expert drafts reused from a prior run of a similar question" in second
+    assert "sap draft" in messages.lead_prompts[-1]
+    assert "What is the best architecture" in messages.lead_prompts[-1]
+
+    # A paraphrase that pulls a different entity subgraph into the skills context still hits.
+    from eam_council.council.entity_graph import get_entity_graph
+
+    third_question = "How should we architect a work order scheduling module for SAP EAM equipment?"
+    graph = get_entity_graph()
+    assert graph.context_for(third_question) != graph.context_for(first_question)
+    third = ask(third_question)
+    assert expert_calls == ["sap", "general"]
+    assert "Expert drafts reused from a prior run of a similar question" in third
@@ -0,0 +1,87 @@
+"""Entity graph parsed from canonical_entities.yaml."""
+
+from __future__ import annotations
+
+from eam_council.council.entity_graph import EntityGraph, get_entity_graph
+
+ENTITIES = """\
+entities:
+  work_order:
+    description: A maintenance task
+    sap_api:
+      odata_service: API_MAINTORDER_SRV
+      odata_entity_set: MaintenanceOrder
+    sap_internals:
+      legacy_table: AUFK
+    fields:
+      - name: order_id
+        type: string
+        primary_key: true
+      - name: equipment_id
+        type: string
+        foreign_key: equipment.equipment_id
+  equipment:
+    description: A physical asset
+    fields:
+      - name: equipment_id
+        primary_key: true
+      - name: func_loc_id
+        foreign_key: functional_location.func_loc_id
+  functional_location:
+    description: A plant hierarchy node
+    synonyms: [plant section]
+  material:
+    description: A spare part
+"""
+
+GLOSSARY = "| **Work Order (WO)** | A formal instruction. |\n"
+
+
+def _graph():
+    return EntityGraph.from_yaml(ENTITIES, GLOSSARY)
+
+
+def test_mentions_match_names_plurals_synonyms_and_abbreviations():
+    graph = _graph()
+    assert graph.mentioned("How do we prioritise work orders?") == {"work_order"}
+    assert graph.mentioned("Is the WO linked to a plant section?") == {"work_order", "functional_location"}
+    assert graph.mentioned("Read MaintenanceOrder from API_MAINTORDER_SRV") == {"work_order"}
+    assert graph.mentioned("Anything about agents?") == set()
+
+
+def test_expansion_follows_foreign_keys_both_ways_to_depth():
+    graph = _graph()
+    assert graph.expand({"work_order"}, 0) == ["work_order"]
+    assert graph.expand({"work_order"}, 1) == ["work_order", "equipment"]
+    assert graph.expand({"work_order"}, 2) == ["work_order", "equipment", "functional_location"]
+    assert graph.expand({"functional_location"}, 2) == ["work_order", "equipment", "functional_location"]
+
+
+def test_context_is_compact_and_scoped_to_the_question():
+    from eam_council.council.prompts import _filter_skills_context
+
+    context = _graph().context_for("Which equipment is behind an order?", depth=1)
+    assert context.startswith("--- Resource: eam_glossary_entities/canonical_entities.yaml ---\nentities:")
+    assert "  equipment: A physical asset" in context
+    assert "material" not in context
+    assert "equipment_id (string) -> equipment.equipment_id" in context
+
+    api_view = _filter_skills_context(context, "api")
+    assert "AUFK" not in api_view and "sap_api: API_MAINTORDER_SRV / MaintenanceOrder" in api_view
+
+    # No entity mentioned: the whole catalog, still compact.
+    assert "material: A spare part" in _graph().context_for("Design an agent")
+
+
+def test_packaged_catalog_is_smaller_than_raw_yaml():
+    from eam_council.council.skills_loader import load_selected_skills
+    from eam_council.council.token_counter import get_token_counter
+
+    raw = load_selected_skills(
+        include_skills={"eam_glossary_entities"},
+        include_resources={"eam_glossary_entities": {"canonical_entities.yaml"}},
+    )
+    scoped = get_entity_graph().context_for("How should work centers be loaded?", depth=1)
+    assert "work_center:" in scoped and "maintenance_plan" not in scoped
+    counter = get_token_counter()
+    assert counter.count(scoped) < counter.count(raw) / 2
@@ -7,6 +7,11 @@ import asyncio
 from eam_council.council.models import SubagentDraft
 
 
+def _message_text(message: dict) -> str:
+    content = message["content"]
+    return content if isinstance(content, str) else "".join(block["text"] for block in content)
+
+
 def test_agentic_flow_runs_agentic_after_eam(monkeypatch):
     """For agentic questions, SAP+General should run before Agentic expert."""
     from eam_council.council import lead_agent
@@ -55,3 +60,389 @@ def test_validator_parser_handles_clarification_and_aligned():
     assert _validator_needs_clarification(
         "NEEDS_CLARIFICATION | target=agentic | reason=conflict with SAP constraints"
     ) == (True, "agentic", "conflict with SAP constraints")
+
+
+class _LatencyMessages:
+    def __init__(self, delay: float, events: list[str]):
+        self._delay = delay
+        self._events = events
+
+    async def create(self, **_kwargs):
+        from types import SimpleNamespace
+
+        self._events.append("started")
+        await asyncio.sleep(self._delay)
+        self._events.append("finished")
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text="draft")])
+
+
+class _LatencyAsyncClient:
+    """Fake async Anthropic client that injects a fixed latency per call and logs start/finish."""
+
+    delay = 0.05
+
+    def __init__(self, events: list[str]):
+        self.messages = _LatencyMessages(self.delay, events)
+
+
+def test_expert_stages_overlap_with_async_client(monkeypatch):
+    """SAP and General live calls should overlap: both start before either finishes."""
+    from eam_council.council import clients
+    from eam_council.council.general_eam_subagent import run_general_subagent
+    from eam_council.council.sap_eam_subagent import run_sap_subagent
+
+    events: list[str] = []
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: _LatencyAsyncClient(events))
+
+    async def _both():
+        return await asyncio.gather(
+            run_sap_subagent("q", "skills", "mock", "dummy", False, False),
+            run_general_subagent("q", "skills", "mock", "dummy", False, False),
+        )
+
+    sap_draft, general_draft = asyncio.run(_both())
+
+    assert sap_draft.content == "draft"
+    assert general_draft.content == "draft"
+    assert events == ["started", "started", "finished", "finished"]
+
+
+def test_slow_expert_is_cut_and_reported(monkeypatch):
+    """An expert that misses its stage timeout is cancelled and named in the output."""
+    from eam_council.council import lead_agent
+
+    cancelled: list[bool] = []
+
+    async def slow_sap(*_args, **_kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    monkeypatch.setenv("EAM_EXPERT_TIMEOUT_SECONDS", "0.05")
+    monkeypatch.setattr(lead_agent, "run_sap_subagent", slow_sap)
+
+    output = asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=True,
+            search_enabled=False,
+        )
+    )
+
+    assert cancelled == [True]
+    assert "## Run Notes" in output
+    assert "`sap` timed out" in output
+
+
+def test_lead_timeout_degrades_to_unreconciled_drafts(monkeypatch):
+    """A lead call that overruns the run deadline returns the ready drafts instead of hanging."""
+    from types import SimpleNamespace
+
+    from eam_council.council import clients, lead_agent
+    from eam_council.council.prompts import LEAD_AGENT_SYSTEM
+
+    class _Messages:
+        async def create(self, **kwargs):
+            if kwargs["system"][-1]["text"] == LEAD_AGENT_SYSTEM:
+                await asyncio.sleep(5)
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text="expert draft")])
+
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setenv("EAM_RUN_DEADLINE_SECONDS", "0.3")
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=_Messages()))
+
+    output = asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=False,
+            search_enabled=False,
+        )
+    )
+
+    assert "Lead reconciliation did not finish" in output
+    assert "expert draft" in output
+    assert "`lead` timed out" in output
+
+
+class _FakeStream:
+    def __init__(self, chunks: list[str]):
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(0.01)
+            yield chunk
+
+    async def get_final_message(self):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text="".join(self._chunks))])
+
+
+def test_lead_stream_forwards_tokens_and_keeps_final_text(monkeypatch):
+    """Streaming mode emits lead deltas as they arrive and returns the same final text."""
+    import json
+    from pathlib import Path
+    from types import SimpleNamespace
+
+    from eam_council.council import clients, lead_agent
+    from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+
+    sections = "\n".join(f"## {name}\nok" for name in [
+        "Executive Summary", "SAP EAM Perspective", "General EAM Perspective",
+        "Agentic Architecture Perspective", "Agent Suitability Decision",
+        "Impact & Worthwhile Assessment", "Unified Recommendation",
+        "Assumptions & Open Questions", "Decision Log", "Next Agent To Build",
+    ])
+    chunks = [sections[i:i + 40] for i in range(0, len(sections), 40)]
+
+    class _Messages:
+        async def create(self, **kwargs):
+            text = "ALIGNED" if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM else "expert draft"
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+
+        def stream(self, **_kwargs):
+            return _FakeStream(chunks)
+
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=_Messages()))
+
+    received: list[str] = []
+    output = asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=False,
+            search_enabled=False,
+            on_token=received.append,
+        )
+    )
+
+    assert received == chunks
+    assert output == sections
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    lead = next(s for s in telemetry["stages"] if s["stage"] == "lead")
+    assert lead["ttft_ms"] is not None
+
+
+def test_prompt_caching_shares_context_prefix_and_reports_cache_usage(monkeypatch):
+    """Experts and lead send one cached skills prefix; cache traffic lands in telemetry."""
+    import json
+    from pathlib import Path
+    from types import SimpleNamespace
+
+    from eam_council.council import clients, lead_agent
+    from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+
+    requests: list[dict] = []
+
+    class _Messages:
+        async def create(self, **kwargs):
+            requests.append(kwargs)
+            text = "ALIGNED" if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM else "expert draft"
+            usage = SimpleNamespace(
+                input_tokens=50,
+                output_tokens=20,
+                cache_read_input_tokens=900 if len(requests) > 1 else 0,
+                cache_creation_input_tokens=0 if len(requests) > 1 else 900,
+            )
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=usage)
+
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=_Messages()))
+
+    asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=False,
+            search_enabled=False,
+        )
+    )
+
+    cached = [r for r in requests if isinstance(r["system"], list)]
+    assert len(cached) >= 3  # sap, general, lead
+    prefixes = {r["system"][0]["text"] for r in cached}
+    assert len(prefixes) == 1
+    assert all(r["system"][0]["cache_control"] == {"type": "ephemeral"} for r in cached)
+    assert all("## Skills & Resources Context" not in _message_text(r["messages"][0]) for r in cached)
+
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    assert telemetry["total_cache_write_tokens"] == 900
+    assert telemetry["total_cache_read_tokens"] == 900 * (len(requests) - 1)
+    assert telemetry["usage"]["lead"]["cache_read_tokens"] > 0
+
+
+def test_validation_rounds_send_only_the_delta(monkeypatch):
+    """After a clarification the validator and lead get follow-up turns, not rebuilt prompts."""
+    from types import SimpleNamespace
+
+    from eam_council.council import clients, lead_agent
+    from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+
+    sap_versions = iter(["sap draft v1", "sap draft v2 with API_MAINTORDER_SRV"])
+    general_text = "general draft " * 200
+
+    async def fake_sap(*_args, **_kwargs):
+        return SubagentDraft(agent_name="SAP", perspective="sap", content=next(sap_versions))
+
+    async def fake_general(*_args, **_kwargs):
+        return SubagentDraft(agent_name="General", perspective="gen", content=general_text)
+
+    validator_calls: list[dict] = []
+    lead_calls: list[dict] = []
+
+    class _Messages:
+        async def create(self, **kwargs):
+            if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM:
+                validator_calls.append(kwargs)
+                text = "NEEDS_CLARIFICATION | target=sap | reason=API unclear" if len(validator_calls) == 1 else "ALIGNED"
+            else:
+                lead_calls.append(kwargs)
+                text = f"## Executive Summary\nanswer v{len(lead_calls)}\n"
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setattr(lead_agent, "run_sap_subagent", fake_sap)
+    monkeypatch.setattr(lead_agent, "run_general_subagent", fake_general)
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=_Messages()))
+
+    output = asyncio.run(
+        lead_agent.run_council(question="How should we schedule work orders?", model="dummy", dry_run=False, search_enabled=False)
+    )
+    assert "answer v3" in output  # lead, escalation (sections missing), revision
+
+    first_check, second_check = validator_calls
+    assert second_check["messages"][0] == first_check["messages"][0]
+    assert second_check["messages"][1] == {"role": "assistant", "content": "NEEDS_CLARIFICATION | target=sap | reason=API unclear"}
+    delta = _message_text(second_check["messages"][2])
+    assert "## Updated SAP Draft" in delta and "API_MAINTORDER_SRV" in delta
+    assert "-answer v2" in delta and "+answer v3" in delta
+    assert "general draft" not in delta
+    assert second_check["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    revision = lead_calls[-1]["messages"]
+    assert revision[0] == lead_calls[0]["messages"][0]
+    assert revision[1]["content"] == "## Executive Summary\nanswer v2\n"
+    revision_prompt = _message_text(revision[2])
+    assert "sap draft v2" in revision_prompt and "general draft" not in revision_prompt
+
+
+def test_run_records_stage_timings_and_critical_path(monkeypatch):
+    """The council graph reports per-stage timing; the slowest expert lies on the critical path."""
+    import json
+    from pathlib import Path
+
+    from eam_council.council import lead_agent
+
+    async def slow_general(*_args, **_kwargs):
+        await asyncio.sleep(0.1)
+        return SubagentDraft(agent_name="General", perspective="gen", content="general draft")
+
+    monkeypatch.setattr(lead_agent, "run_general_subagent", slow_general)
+
+    asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=True,
+            search_enabled=False,
+        )
+    )
+
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    timings = {t["stage"]: t for t in telemetry["stage_timings"]}
+    assert timings["sap"]["group"] == timings["general"]["group"] == "experts"
+    assert timings["general"]["elapsed_ms"] >= 100
+    assert timings["agentic"]["status"] == "skipped"
+    assert "general" in telemetry["critical_path"]
+    assert "sap" not in telemetry["critical_path"]
+    assert not {"agentic", "agentic_check", "lead_escalated"} & set(telemetry["critical_path"])
+    general_metric = next(m for m in telemetry["stages"] if m["stage"] == "general")
+    assert general_metric["elapsed_ms"] >= 100
+
+
+def _delayed_experts(monkeypatch, agentic_content: str, agentic_calls: list[dict]) -> list[str]:
+    """Patch in slow experts; returns the order in which they start and finish."""
+    from eam_council.council import lead_agent
+
+    events: list[str] = []
+
+    def expert(name: str, content: str):
+        async def run(*_args, **kwargs):
+            if name == "agentic":
+                agentic_calls.append(kwargs)
+            events.append(f"{name} started")
+            await asyncio.sleep(0.05)
+            events.append(f"{name} finished")
+            return SubagentDraft(agent_name=name, perspective=name, content=content)
+
+        return run
+
+    monkeypatch.setattr(lead_agent, "run_sap_subagent", expert("sap", "Use API_MAINTORDER_SRV for orders."))
+    monkeypatch.setattr(lead_agent, "run_general_subagent", expert("general", "Plan on a rolling horizon."))
+    monkeypatch.setattr(lead_agent, "run_agentic_arch_subagent", expert("agentic", agentic_content))
+    return events
+
+
+def test_pipelined_agentic_overlaps_eam_experts(monkeypatch):
+    """A speculative agentic draft that agrees with the EAM drafts takes the agentic call off the critical path."""
+    from eam_council.council import lead_agent
+
+    agentic_calls: list[dict] = []
+    events = _delayed_experts(monkeypatch, "Agent reads orders via API_MAINTORDER_SRV.", agentic_calls)
+    monkeypatch.setenv("EAM_PIPELINED_AGENTIC", "1")
+
+    asyncio.run(
+        lead_agent.run_council(
+            question="Design an agentic EAM planner",
+            model="dummy",
+            dry_run=True,
+            search_enabled=False,
+        )
+    )
+
+    assert [c.get("speculative") for c in agentic_calls] == [True]
+    assert events.index("agentic started") < events.index("sap finished")
+    assert events.index("agentic started") < events.index("general finished")
+
+
+def test_pipelined_agentic_reruns_on_conflict(monkeypatch):
+    """A speculative draft relying on an API neither EAM draft names is re-run with the drafts."""
+    import json
+    from pathlib import Path
+
+    from eam_council.council import lead_agent
+
+    agentic_calls: list[dict] = []
+    _delayed_experts(monkeypatch, "Agent writes notifications via API_NOTIFICATION_LEGACY.", agentic_calls)
+    monkeypatch.setenv("EAM_PIPELINED_AGENTIC", "1")
+
+    asyncio.run(
+        lead_agent.run_council(
+            question="Design an agentic EAM planner",
+            model="dummy",
+            dry_run=True,
+            search_enabled=False,
+        )
+    )
+
+    assert agentic_calls[0].get("speculative") is True
+    assert agentic_calls[1]["sap_draft"] == "Use API_MAINTORDER_SRV for orders."
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    assert telemetry["speculation"]["agentic"] == {
+        "accepted": False,
+        "conflicts": ["API_NOTIFICATION_LEGACY is not named by either EAM draft"],
+    }
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+
+import pytest
+
 from eam_council.council import llm
+from eam_council.council.rate_limiter import (
+    EstimateCalibrator,
+    Priority,
+    RateLimiter,
+    SqliteTokenBucket,
+    TokenBucket,
+)
 from eam_council.council.runtime_config import DEFAULT_TOKENS_PER_MINUTE, load_runtime_config
+from eam_council.council.token_counter import TokenCounter
 
 
 def test_runtime_config_tpm_defaults(monkeypatch):
@@ -21,3 +34,268 @@ def test_estimate_tokens_includes_prompt_and_max_tokens():
     est = llm._estimate_tokens(kwargs)
     assert est >= 123
     assert est > 200
+
+
+def test_token_bucket_refills_and_reports_wait():
+    now = [0.0]
+    bucket = TokenBucket(600, clock=lambda: now[0])  # 10 tokens/second
+    assert bucket.try_take(600) == 0
+    assert bucket.try_take(50) == pytest.approx(5.0)
+    now[0] = 5.0
+    assert bucket.try_take(50) == 0
+
+
+def test_limiter_serves_priority_lanes_first_and_fifo_within_lane():
+    limiter = RateLimiter(TokenBucket(60_000))  # 1000 tokens/second
+    granted: list[str] = []
+
+    async def _request(name: str, priority: Priority):
+        await limiter.acquire(100, priority)
+        granted.append(name)
+
+    async def _scenario():
+        await limiter.acquire(60_000, Priority.LEAD)  # drain the bucket
+        await asyncio.gather(
+            _request("batch", Priority.BACKGROUND),
+            _request("expert-1", Priority.EXPERT),
+            _request("expert-2", Priority.EXPERT),
+            _request("lead", Priority.LEAD),
+        )
+
+    asyncio.run(_scenario())
+    assert granted == ["lead", "expert-1", "expert-2", "batch"]
+
+
+def test_limiter_wait_does_not_block_event_loop():
+    limiter = RateLimiter(TokenBucket(60_000))
+    ticks: list[int] = []
+
+    async def _ticker():
+        for i in range(5):
+            ticks.append(i)
+            await asyncio.sleep(0.01)
+
+    async def _scenario():
+        await limiter.acquire(60_000)
+        await asyncio.gather(limiter.acquire(200), _ticker())
+
+    asyncio.run(_scenario())
+    assert ticks == [0, 1, 2, 3, 4]
+
+
+def test_cancelled_waiter_leaves_its_lane():
+    limiter = RateLimiter(TokenBucket(60_000))
+
+    async def _scenario():
+        await limiter.acquire(60_000)
+        task = asyncio.create_task(limiter.acquire(500, Priority.BACKGROUND))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return limiter._head()
+
+    assert asyncio.run(_scenario()) is None
+
+
+def test_settle_refunds_over_reservation():
+    now = [0.0]
+    limiter = RateLimiter(TokenBucket(30_000, clock=lambda: now[0]))
+    reservation = limiter.acquire_blocking(9_000)
+    limiter.settle(reservation, 1_000)
+    assert limiter.bucket.available() == pytest.approx(29_000)
+
+    reservation = limiter.acquire_blocking(1_000)
+    limiter.settle(reservation, 3_000)
+    assert limiter.bucket.available() == pytest.approx(26_000)
+
+
+def test_calibrator_learns_per_stage_factors():
+    calibrator = EstimateCalibrator(alpha=0.5)
+    for _ in range(10):
+        calibrator.observe(
+            "lead",
+            estimated_prompt_tokens=1_000,
+            max_tokens=4_096,
+            input_tokens=1_200,
+            output_tokens=1_024,
+        )
+    input_factor, output_factor = calibrator.factors("lead")
+    assert input_factor == pytest.approx(1.2, rel=0.01)
+    assert output_factor == pytest.approx(0.25, rel=0.01)
+    assert calibrator.factors("sap") == (1.0, 1.0)
+    assert calibrator.reserve("lead", 1_000, 4_096) < 1_000 + 4_096
+
+
+def test_acreate_with_retry_reconciles_with_response_usage(monkeypatch):
+    from types import SimpleNamespace
+
+    from eam_council.council import rate_limiter
+
+    monkeypatch.setenv("EAM_TOKENS_PER_MINUTE", "30000")
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "1")
+    rate_limiter.reset_rate_limiter()
+    monkeypatch.setattr(rate_limiter, "_calibrator", EstimateCalibrator())
+
+    class _Messages:
+        async def create(self, **_kwargs):
+            usage = SimpleNamespace(input_tokens=100, output_tokens=800)
+            return SimpleNamespace(content=[], usage=usage)
+
+    client = SimpleNamespace(messages=_Messages())
+    asyncio.run(
+        llm.acreate_with_retry(
+            client,
+            stage="lead",
+            model="dummy",
+            max_tokens=8_192,
+            messages=[{"role": "user", "content": "x" * 400}],
+        )
+    )
+    available = rate_limiter.get_rate_limiter(30_000).bucket.available()
+    rate_limiter.reset_rate_limiter()
+    assert available == pytest.approx(30_000 - 900, abs=5)
+
+
+def test_failed_or_cancelled_calls_return_their_reservation(monkeypatch):
+    from types import SimpleNamespace
+
+    from eam_council.council import rate_limiter
+
+    monkeypatch.setenv("EAM_TOKENS_PER_MINUTE", "30000")
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "1")
+    monkeypatch.setenv("EAM_RETRIES", "0")
+    rate_limiter.reset_rate_limiter()
+    monkeypatch.setattr(rate_limiter, "_calibrator", EstimateCalibrator())
+
+    class _Messages:
+        async def create(self, **kwargs):
+            if kwargs["model"] == "slow":
+                await asyncio.sleep(5)
+            raise ValueError("bad request")
+
+    client = SimpleNamespace(messages=_Messages())
+    request = dict(stage="sap", retries=0, max_tokens=8_000, messages=[{"role": "user", "content": "x"}])
+
+    with pytest.raises(ValueError):
+        asyncio.run(llm.acreate_with_retry(client, model="fast", **request))
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(llm.acreate_with_retry(client, model="slow", **request), 0.05))
+
+    available = rate_limiter.get_rate_limiter(30_000).bucket.available()
+    rate_limiter.reset_rate_limiter()
+    assert available == pytest.approx(30_000, abs=5)
+
+
+def test_zero_tokens_per_minute_disables_throttling(monkeypatch):
+    import time
+    from types import SimpleNamespace
+
+    from eam_council.council import rate_limiter
+
+    monkeypatch.setenv("EAM_TOKENS_PER_MINUTE", "0")
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "1")
+    rate_limiter.reset_rate_limiter()
+    assert rate_limiter.get_rate_limiter(0) is None
+
+    class _Messages:
+        def create(self, **_kwargs):
+            return SimpleNamespace(content=[], usage=SimpleNamespace(input_tokens=100, output_tokens=100))
+
+    client = SimpleNamespace(messages=_Messages())
+    request = dict(stage="sap", model="dummy", max_tokens=1_000, messages=[{"role": "user", "content": "x"}])
+    started = time.perf_counter()
+    for _ in range(3):
+        llm.create_with_retry(client, **request)
+        asyncio.run(llm.acreate_with_retry(client, **request))
+    assert time.perf_counter() - started < 5
+
+
+def test_token_counter_memoizes_static_segments():
+    counter = TokenCounter()
+    skills = "=== SKILL: eam ===\nbody\n\n--- Resource: eam/entities.yaml ---\nentities:\n  work_order:\n"
+    counter.count(f"## Question\nfirst?\n\n## Skills & Resources Context\n{skills}")
+    misses = counter.misses
+    counter.count(f"## Question\nsecond?\n\n## Skills & Resources Context\n{skills}")
+    assert counter.misses == misses + 1  # only the new question segment is scanned
+
+
+def test_token_counter_costs_yaml_above_flat_char_ratio():
+    yaml_text = "entities:\n" + "".join(
+        f"  - name: field_{i}\n    type: string\n    foreign_key: equipment.equipment_id\n" for i in range(20)
+    )
+    assert TokenCounter().count(yaml_text) > len(yaml_text) // 4
+
+
+def test_token_counter_reads_system_blocks():
+    payload = {
+        "system": [{"type": "text", "text": "You are the lead."}],
+        "messages": [{"role": "user", "content": [{"type": "text", "text": "hello there"}]}],
+    }
+    assert TokenCounter().count_payload(payload) >= 6
+
+
+def test_calibrator_round_trips_recorded_factors(tmp_path):
+    calibrator = EstimateCalibrator(alpha=1.0)
+    calibrator.observe("sap", estimated_prompt_tokens=100, max_tokens=1_000, input_tokens=150, output_tokens=500)
+    path = tmp_path / "calibration.json"
+    calibrator.save(path)
+
+    restored = EstimateCalibrator()
+    restored.load(path)
+    assert restored.factors("sap") == pytest.approx((1.5, 0.5))
+
+
+def test_calibrator_clamps_factors_and_ignores_implausible_usage(tmp_path):
+    calibrator = EstimateCalibrator(alpha=1.0)
+    # A fake client reporting 50 input tokens for a 1,400-token prompt teaches nothing.
+    calibrator.observe("sap", estimated_prompt_tokens=1_400, max_tokens=4_096, input_tokens=50, output_tokens=10)
+    assert calibrator.factors("sap") == (1.0, 1.0)
+    assert not calibrator.observed
+
+    calibrator.observe("lead", estimated_prompt_tokens=1_000, max_tokens=4_096, input_tokens=4_000, output_tokens=0)
+    assert calibrator.factors("lead") == pytest.approx((2.0, 0.25))
+    assert calibrator.observed
+
+    path = tmp_path / "calibration.json"
+    path.write_text('{"input": {"sap": 0.036}, "output": {"sap": 0.1}}', encoding="utf-8")
+    restored = EstimateCalibrator()
+    restored.load(path)
+    assert restored.factors("sap") == pytest.approx((0.5, 0.25))
+
+
+def test_sqlite_bucket_is_shared_between_instances(tmp_path):
+    path = tmp_path / "bucket.sqlite3"
+    first = SqliteTokenBucket(6_000, path)
+    second = SqliteTokenBucket(6_000, path)
+    try:
+        assert first.try_take(5_000) == 0
+        assert second.try_take(5_000) > 0  # the other "process" already spent the budget
+        first.refund(4_000)
+        assert second.try_take(4_000) == 0
+    finally:
+        first.close()
+        second.close()
+
+
+def _take_from_shared_bucket(path: str, queue) -> None:
+    bucket = SqliteTokenBucket(600, Path(path))  # refills one 10-token grant per second
+    granted = sum(1 for _ in range(40) if bucket.try_take(10) == 0)
+    bucket.close()
+    queue.put(granted)
+
+
+def test_sqlite_bucket_budget_holds_across_processes(tmp_path):
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    path = str(tmp_path / "bucket.sqlite3")
+    procs = [ctx.Process(target=_take_from_shared_bucket, args=(path, queue)) for _ in range(3)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=30)
+    granted = sum(queue.get(timeout=5) for _ in procs)
+    # 60 tokens' worth of capacity, plus at most a little refill while the processes ran.
+    assert 60 <= granted <= 64
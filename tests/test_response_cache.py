@@ -0,0 +1,129 @@
+"""Response cache tests: repeat council runs, TTL, LRU size cap and stage bypass."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+from eam_council.council import clients, lead_agent
+from eam_council.council.prompts import ALIGNMENT_VALIDATOR_SYSTEM
+from eam_council.council.response_cache import ResponseCache, cache_key
+
+
+class _CountingMessages:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        text = "ALIGNED" if kwargs["system"] == ALIGNMENT_VALIDATOR_SYSTEM else "expert draft"
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=usage)
+
+
+def _response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+
+
+def _run() -> str:
+    return asyncio.run(
+        lead_agent.run_council(
+            question="How should we schedule work orders?",
+            model="dummy",
+            dry_run=False,
+            search_enabled=False,
+        )
+    )
+
+
+def test_repeat_run_is_served_from_cache(monkeypatch, tmp_path):
+    messages = _CountingMessages()
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setenv("EAM_RESPONSE_CACHE", "1")
+    monkeypatch.setenv("EAM_RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=messages))
+
+    first = _run()
+    live_calls = messages.calls
+    second = _run()
+
+    assert second == first
+    assert messages.calls == live_calls
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    assert telemetry["response_cache_misses"] == 0
+    assert telemetry["response_cache_hits"] == live_calls
+
+
+def test_bypassed_stage_always_calls_api(monkeypatch, tmp_path):
+    messages = _CountingMessages()
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setenv("EAM_RESPONSE_CACHE", "1")
+    monkeypatch.setenv("EAM_RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("EAM_RESPONSE_CACHE_BYPASS", "lead, validator")
+    monkeypatch.setattr(clients, "_build_async_client", lambda _cfg: SimpleNamespace(messages=messages))
+
+    _run()
+    first_calls = messages.calls
+    _run()
+
+    telemetry = json.loads((Path("out") / "telemetry_latest.json").read_text(encoding="utf-8"))
+    assert "lead" not in telemetry["response_cache"]
+    assert telemetry["response_cache"]["sap"] == {"hits": 1, "misses": 0}
+    assert messages.calls - first_calls == first_calls - telemetry["response_cache_hits"]
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    now = [1000.0]
+    cache = ResponseCache(tmp_path, max_bytes=0, ttl_seconds=60, clock=lambda: now[0])
+    request = {"model": "m", "max_tokens": 10, "messages": [{"role": "user", "content": "q"}]}
+    cache.put(request, _response("cached"))
+
+    now[0] += 30
+    assert cache.get(request).content[0].text == "cached"
+    now[0] += 31
+    assert cache.get(request) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    now = [1000.0]
+    probe = ResponseCache(tmp_path / "probe", max_bytes=0, ttl_seconds=0, clock=lambda: now[0])
+    probe.put({"model": "a"}, _response("x" * 200))
+    entry_size = next((tmp_path / "probe").iterdir()).stat().st_size
+
+    cache = ResponseCache(tmp_path / "lru", max_bytes=entry_size * 2, ttl_seconds=0, clock=lambda: now[0])
+    for name in ("a", "b"):
+        cache.put({"model": name}, _response("x" * 200))
+        now[0] += 1
+    assert cache.get({"model": "a"}) is not None  # a is now more recent than b
+    now[0] += 1
+    cache.put({"model": "c"}, _response("x" * 200))
+
+    assert cache.get({"model": "b"}) is None
+    assert cache.get({"model": "a"}) is not None
+    assert cache.get({"model": "c"}) is not None
+
+
+def test_directory_is_scanned_only_when_the_running_total_passes_the_cap(tmp_path):
+    now = [1000.0]
+    big = _response(random.Random(0).randbytes(3000).hex())
+    probe = ResponseCache(tmp_path / "probe", max_bytes=0, ttl_seconds=0, clock=lambda: now[0])
+    probe.put({"model": "a"}, _response("short"))
+    probe.put({"model": "big"}, big)
+    small_size, big_size = sorted(p.stat().st_size for p in (tmp_path / "probe").iterdir())
+
+    cap = big_size + 2 * small_size + small_size // 2
+    cache = ResponseCache(tmp_path / "lru", max_bytes=cap, ttl_seconds=0, clock=lambda: now[0])
+    for name in ("a", "b", "c", "a"):  # rewriting "a" does not grow the total
+        cache.put({"model": name}, _response("short"))
+        now[0] += 1
+    assert cache.scans == 1  # the first write
+
+    cache.put({"model": "big"}, big)
+    assert cache.scans == 2
+    assert sorted(p.name for p in (tmp_path / "lru").iterdir()) == sorted(
+        probe._path(cache_key({"model": name})).name for name in ("a", "big", "c")
+    )
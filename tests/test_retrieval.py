@@ -0,0 +1,47 @@
+"""BM25 chunk retrieval over skills."""
+
+from __future__ import annotations
+
+from eam_council.council.retrieval import PINNED_FILES, SkillsRetriever, chunk_file, get_retriever
+
+
+def test_markdown_and_yaml_are_chunked_at_headings_and_entity_keys():
+    md = chunk_file("notes.md", "# Title\nintro\n\n## MTBF\nmean time\n\n## OEE\navailability")
+    assert [h for h, _ in md] == ["Title", "MTBF", "OEE"]
+
+    yaml = chunk_file("entities.yaml", "entities:\n  asset:\n    id: x\n  work_order:\n    id: y\n")
+    assert [h for h, _ in yaml] == ["entities", "asset", "work_order"]
+    assert "id: y" in yaml[-1][1]
+
+
+def test_selection_ranks_relevant_chunks_within_budget():
+    retriever = SkillsRetriever.build()
+    budget = 3000
+    chunks = retriever.select("How do we set MTBF and OEE targets for critical pumps?", budget)
+
+    assert sum(c.tokens for c in chunks) <= budget
+    assert {(c.skill, c.file) for c in chunks} >= PINNED_FILES
+    assert any(c.skill == "eam_reliability_expert" for c in chunks)
+    assert [c.order for c in chunks] == sorted(c.order for c in chunks)
+
+    context = retriever.context_for("How do we set MTBF and OEE targets for critical pumps?", budget)
+    assert "--- Resource: eam_reliability_expert/formulas.md ---" in context
+    assert context.startswith("=== SKILL: eam_council ===")
+
+
+def test_index_is_persisted_and_reloaded(tmp_path, monkeypatch):
+    import eam_council.council.retrieval as retrieval
+
+    path = tmp_path / "skills_index.json"
+    monkeypatch.setattr(retrieval, "_retriever", None)
+    built = get_retriever(path)
+    assert path.exists()
+
+    def _no_build():
+        raise AssertionError("index should be loaded, not rebuilt")
+
+    monkeypatch.setattr(retrieval, "_retriever", None)
+    monkeypatch.setattr(SkillsRetriever, "build", classmethod(lambda cls: _no_build()))
+    loaded = get_retriever(path)
+    assert loaded.fingerprint == built.fingerprint
+    assert [c.text for c in loaded.chunks] == [c.text for c in built.chunks]
@@ -0,0 +1,137 @@
+"""Retry policy tests against a scripted fake Anthropic backend."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from eam_council.council import llm, retry
+from eam_council.council.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ErrorClass,
+    RetryBudget,
+    RetryPolicy,
+    classify_error,
+    retry_after_seconds,
+    retry_budget_scope,
+)
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class ScriptedMessages:
+    """Raises the scripted errors in order, then returns a text response."""
+
+    def __init__(self, script: list[Exception]):
+        self.script = list(script)
+        self.calls = 0
+
+    async def create(self, **_kwargs):
+        self.calls += 1
+        if self.script:
+            raise self.script.pop(0)
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text="ok")])
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(monkeypatch):
+    monkeypatch.setenv("EAM_ENABLE_TPM_THROTTLE", "0")
+    monkeypatch.setenv("EAM_RETRY_BASE_DELAY", "0.001")
+    monkeypatch.setenv("EAM_RETRY_MAX_DELAY", "0.002")
+    retry.reset_circuit_breaker()
+    yield
+    retry.reset_circuit_breaker()
+
+
+def _call(messages: ScriptedMessages, retries: int = 3):
+    client = SimpleNamespace(messages=messages)
+    return asyncio.run(
+        llm.acreate_with_retry(client, retries=retries, model="m", max_tokens=10, messages=[])
+    )
+
+
+def test_classify_error_separates_overload_transient_and_fatal():
+    assert classify_error(FakeStatusError(429)) is ErrorClass.OVERLOADED
+    assert classify_error(FakeStatusError(529)) is ErrorClass.OVERLOADED
+    assert classify_error(FakeStatusError(500)) is ErrorClass.RETRYABLE
+    assert classify_error(FakeStatusError(400)) is ErrorClass.FATAL
+    assert classify_error(ValueError("bad")) is ErrorClass.FATAL
+
+
+def test_scripted_transient_errors_are_retried():
+    messages = ScriptedMessages([FakeStatusError(429), FakeStatusError(529), FakeStatusError(500)])
+    response = _call(messages)
+    assert response.content[0].text == "ok"
+    assert messages.calls == 4
+
+
+def test_validation_errors_are_not_retried():
+    messages = ScriptedMessages([FakeStatusError(400)])
+    with pytest.raises(FakeStatusError):
+        _call(messages)
+    assert messages.calls == 1
+
+
+def test_retry_after_header_sets_the_minimum_delay():
+    exc = FakeStatusError(429, {"retry-after": "2"})
+    assert retry_after_seconds(exc) == 2.0
+    assert retry_after_seconds(FakeStatusError(429, {"retry-after-ms": "250"})) == 0.25
+    policy = RetryPolicy(base_delay=0.001, max_delay=0.002)
+    assert policy.backoff(0, exc) == 2.0
+
+
+def test_full_jitter_stays_within_the_exponential_ceiling():
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+    delays = [policy.backoff(attempt, FakeStatusError(500)) for attempt in range(6) for _ in range(20)]
+    assert all(0.0 <= d <= 3.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_run_retry_budget_is_shared_across_calls():
+    async def _two_calls():
+        with retry_budget_scope(RetryBudget(limit=1)) as budget:
+            client = SimpleNamespace(messages=ScriptedMessages([FakeStatusError(500)]))
+            await llm.acreate_with_retry(client, retries=3, model="m", max_tokens=1, messages=[])
+            client = SimpleNamespace(messages=ScriptedMessages([FakeStatusError(500)]))
+            with pytest.raises(FakeStatusError):
+                await llm.acreate_with_retry(client, retries=3, model="m", max_tokens=1, messages=[])
+            return budget.used
+
+    assert asyncio.run(_two_calls()) == 1
+
+
+def test_circuit_breaker_fails_fast_then_half_opens():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=10.0, clock=lambda: now[0])
+    breaker.record_failure(ErrorClass.OVERLOADED)
+    breaker.record_failure(ErrorClass.OVERLOADED)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    now[0] = 11.0
+    breaker.before_call()  # trial call allowed
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one trial at a time
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_overload_storm_opens_the_process_breaker(monkeypatch):
+    monkeypatch.setenv("EAM_BREAKER_THRESHOLD", "3")
+    storm = ScriptedMessages([FakeStatusError(529)] * 10)
+    with pytest.raises(CircuitOpenError):
+        _call(storm, retries=5)
+    assert storm.calls == 3
+
+    untouched = ScriptedMessages([])
+    with pytest.raises(CircuitOpenError):
+        _call(untouched)
+    assert untouched.calls == 0
@@ -0,0 +1,92 @@
+"""Precompiled skills bundle: build, mmap load, staleness fallback."""
+
+from __future__ import annotations
+
+import json
+import os
+
+from eam_council.council.skills_bundle import _HEADER, FORMAT_VERSION, MAGIC, build_bundle, seed_from_bundle
+from eam_council.council.skills_loader import DEFAULT_SKILLS_ROOT, SkillsRepository
+from eam_council.council.token_counter import TokenCounter, get_token_counter
+
+
+def _make_tree(root):
+    for name in ("alpha", "beta"):
+        skill = root / "skills" / name
+        (skill / "resources").mkdir(parents=True)
+        (skill / "SKILL.md").write_text(f"{name} skill\n## Rules\nbe precise", encoding="utf-8")
+        (skill / "resources" / "notes.md").write_text(f"{name} notes", encoding="utf-8")
+    return root / "skills"
+
+
+def test_bundle_seeds_repository_without_reading_files(tmp_path):
+    skills_root = _make_tree(tmp_path)
+    bundle = build_bundle(skills_root)
+    assert bundle == tmp_path / "skills.bundle"
+
+    repository = SkillsRepository(skills_root.resolve())
+    assert seed_from_bundle(repository)
+    context = repository.assemble()
+
+    assert repository.reads == 0
+    assert context == SkillsRepository(skills_root.resolve()).assemble()
+
+
+def test_bundle_seeds_token_counts(tmp_path):
+    skills_root = _make_tree(tmp_path)
+    build_bundle(skills_root)
+    context = SkillsRepository(skills_root.resolve()).assemble()
+    counter = get_token_counter()
+    counter._cache.clear()  # as in a fresh process
+
+    seed_from_bundle(SkillsRepository(skills_root.resolve()))
+    misses = counter.misses
+    assert counter.count(context) == TokenCounter().count(context)
+    assert counter.misses == misses
+
+
+def test_stale_or_corrupt_bundle_falls_back_to_directory_walk(tmp_path):
+    skills_root = _make_tree(tmp_path)
+    bundle = build_bundle(skills_root)
+
+    notes = skills_root / "alpha" / "resources" / "notes.md"
+    notes.write_text("alpha notes, revised", encoding="utf-8")
+    stat = notes.stat()
+    os.utime(notes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    repository = SkillsRepository(skills_root.resolve())
+    assert not seed_from_bundle(repository)
+    assert "revised" in repository.assemble()
+
+    bundle.write_bytes(b"not a bundle")
+    assert not seed_from_bundle(SkillsRepository(skills_root.resolve()))
+
+
+def test_malformed_index_falls_back_without_seeding(tmp_path):
+    skills_root = _make_tree(tmp_path)
+    bundle = build_bundle(skills_root)
+    raw = bundle.read_bytes()
+    _, _, index_len = _HEADER.unpack_from(raw, 0)
+    index = json.loads(raw[_HEADER.size : _HEADER.size + index_len])
+    payload = raw[_HEADER.size + index_len :]
+
+    def without(key, position=-1):
+        broken = json.loads(json.dumps(index))
+        del broken["files"][position][key]
+        return broken
+
+    orphan = json.loads(json.dumps(index))
+    orphan["files"] = orphan["files"][1:]  # a resource with no SKILL.md before it
+    for broken in ({}, [], {"dirs": index["dirs"]}, without("segments"), without("resource"), orphan):
+        data = json.dumps(broken).encode("utf-8")
+        bundle.write_bytes(_HEADER.pack(MAGIC, FORMAT_VERSION, len(data)) + data + payload)
+        repository = SkillsRepository(skills_root.resolve())
+        assert not seed_from_bundle(repository)
+        assert not repository._files
+        assert "alpha notes" in repository.assemble()
+
+
+def test_packaged_skills_round_trip(tmp_path):
+    path = build_bundle(DEFAULT_SKILLS_ROOT, tmp_path / "skills.bundle")
+    repository = SkillsRepository(DEFAULT_SKILLS_ROOT)
+    assert seed_from_bundle(repository, path)
+    assert repository.assemble() == SkillsRepository(DEFAULT_SKILLS_ROOT).assemble()
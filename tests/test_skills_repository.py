@@ -0,0 +1,77 @@
+"""Skills repository caching and per-file invalidation."""
+
+from __future__ import annotations
+
+import os
+
+from eam_council.council.skills_loader import SkillsRepository
+
+
+def _make_tree(root):
+    skill = root / "alpha"
+    (skill / "resources").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("alpha skill", encoding="utf-8")
+    (skill / "resources" / "notes.md").write_text("v1", encoding="utf-8")
+    return skill
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_assembled_context_is_memoized_until_a_file_changes(tmp_path):
+    skill = _make_tree(tmp_path)
+    repo = SkillsRepository(tmp_path)
+
+    first = repo.assemble()
+    assert "--- Resource: alpha/notes.md ---\nv1" in first
+    assert repo.assemble() is first
+    assert repo.reads == 2
+
+    notes = skill / "resources" / "notes.md"
+    notes.write_text("v2", encoding="utf-8")
+    _bump_mtime(notes)
+    assert "v2" in repo.assemble()
+    assert repo.reads == 3
+
+
+def test_touched_but_unchanged_file_keeps_memoized_context(tmp_path):
+    skill = _make_tree(tmp_path)
+    repo = SkillsRepository(tmp_path)
+    first = repo.assemble()
+
+    _bump_mtime(skill / "SKILL.md")
+    assert repo.assemble() is first  # content hash unchanged
+    assert repo.reads == 3
+    assert repo.assemble() is first
+    assert repo.reads == 3
+
+
+def test_new_resource_and_selection_are_picked_up(tmp_path):
+    skill = _make_tree(tmp_path)
+    repo = SkillsRepository(tmp_path)
+    repo.assemble()
+
+    (skill / "resources" / "extra.md").write_text("extra", encoding="utf-8")
+    _bump_mtime(skill / "resources")
+    assert "alpha/extra.md" in repo.assemble()
+
+    only_notes = repo.assemble({"alpha"}, {"alpha": {"notes.md"}})
+    assert "extra" not in only_notes
+    assert repo.inventory() == {"alpha": ["extra.md", "notes.md"]}
+
+
+def test_crlf_and_cr_files_read_the_same_as_lf_files(tmp_path):
+    lf = _make_tree(tmp_path / "lf")
+    (lf / "SKILL.md").write_bytes(b"alpha skill\nsecond line\n")
+    expected = SkillsRepository(tmp_path / "lf")
+
+    for name, data in (("crlf", b"alpha skill\r\nsecond line\r\n"), ("cr", b"alpha skill\rsecond line\r")):
+        skill = _make_tree(tmp_path / name)
+        (skill / "SKILL.md").write_bytes(data)
+        repo = SkillsRepository(tmp_path / name)
+        context = repo.assemble()
+        assert "\r" not in context
+        assert context == expected.assemble()
+        assert repo.digest(skill / "SKILL.md") == expected.digest(lf / "SKILL.md")
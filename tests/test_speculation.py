@@ -0,0 +1,60 @@
+"""Tests for the speculative agentic draft conflict check."""
+
+from __future__ import annotations
+
+SAP_DRAFT = """\
+## SAP EAM Expert Draft
+Read orders through API_MAINTORDER_SRV and equipment through API_EQUIPMENT_SRV.
+Direct table writes to AUFK are not supported; avoid API_NOTIFICATION_LEGACY for new builds.
+"""
+
+GENERAL_DRAFT = """\
+## General EAM Expert Draft
+Plan on a rolling two-week horizon. Do not let the agent release work orders without planner approval.
+"""
+
+
+def test_consistent_speculative_draft_has_no_conflicts():
+    from eam_council.council.speculation import find_conflicts
+
+    agentic = """\
+## Agentic Architecture Expert Draft
+A planner agent reads backlog data through API_MAINTORDER_SRV and proposes a schedule.
+
+### Domain Assumptions
+- Orders are readable through an OData service.
+"""
+    assert find_conflicts(agentic, SAP_DRAFT, GENERAL_DRAFT) == []
+
+
+def test_unnamed_and_rejected_identifiers_are_conflicts():
+    from eam_council.council.speculation import find_conflicts
+
+    agentic = "The agent writes through API_NOTIFICATION_LEGACY and triggers IW32 for changes."
+
+    conflicts = find_conflicts(agentic, SAP_DRAFT, GENERAL_DRAFT)
+
+    assert "IW32 is not named by either EAM draft" in conflicts
+    assert "API_NOTIFICATION_LEGACY is rejected by an EAM draft" in conflicts
+
+
+def test_contradicted_assumption_is_a_conflict():
+    from eam_council.council.speculation import find_conflicts
+
+    agentic = """\
+### Domain Assumptions
+- The agent can release work orders automatically without planner approval.
+"""
+    conflicts = find_conflicts(agentic, SAP_DRAFT, GENERAL_DRAFT)
+
+    assert len(conflicts) == 1
+    assert conflicts[0].startswith("assumption contradicted: The agent can release work orders")
+
+
+def test_order_types_are_not_transaction_codes():
+    from eam_council.council.speculation import find_conflicts
+
+    agentic = "The agent creates PM01 corrective and PM02 preventive orders, then opens them in IW32."
+    sap = SAP_DRAFT + "Create the order in IW31 and change it in IW32.\n"
+
+    assert find_conflicts(agentic, sap, GENERAL_DRAFT) == []